@@ -0,0 +1,200 @@
+"""
+Admission control for Cricket Chat MCP Server.
+
+Every tool call must take a slot from its tool's limiter before it runs.
+Each tool has its own concurrency limit and a short, bounded wait queue,
+served by weighted fair queuing across clients (see clients.py).
+Calls that find the queue full, or that wait too long, are turned away at
+once with a "busy, retry" result instead of piling more work onto a slow
+upstream.
+
+Limits adapt with AIMD (additive increase, multiplicative decrease). A call
+that finishes under the latency target raises its tool's limit by 1/limit,
+so the limit grows by about one per limit's worth of calls. A call that is
+slower than the target, or runs out of time, cuts the limit by a fixed
+factor, at most once per cool-down. Under a spike, admitted calls stay fast
+while excess calls are shed. Clients over their upstream budget are shed
+before they queue.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+from config import (
+    ADMISSION_INITIAL_LIMIT,
+    ADMISSION_MIN_LIMIT,
+    ADMISSION_MAX_LIMIT,
+    ADMISSION_QUEUE_SIZE,
+    ADMISSION_QUEUE_TIMEOUT,
+    ADMISSION_LATENCY_TARGET,
+    ADMISSION_DECREASE_FACTOR,
+    ADMISSION_DECREASE_COOLDOWN,
+    CLIENT_WEIGHTS,
+    TOOL_NAMES,
+)
+from clients import INTERNAL, usage
+from cric_buzz_service.tracing import span
+from cric_buzz_service.upstream import FairQueue, remaining
+
+logger = logging.getLogger(__name__)
+
+
+class Overloaded(Exception):
+    """Raised when a tool call is shed instead of admitted."""
+
+    def __init__(self, tool: str, reason: str, retry_after: float):
+        self.tool = tool
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"{tool} is busy ({reason})")
+
+
+class AdaptiveLimiter:
+    """Concurrency limit with a bounded fair wait queue and an AIMD-adjusted limit."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.limit = float(ADMISSION_INITIAL_LIMIT)
+        self.inflight = 0
+        self._waiters = FairQueue(CLIENT_WEIGHTS)
+        self._last_decrease = float("-inf")
+        self.admitted = 0
+        self.rejected = 0
+        self.latency_ewma: Optional[float] = None
+
+    def _has_room(self) -> bool:
+        return self.inflight < int(self.limit)
+
+    async def acquire(self, client: str = INTERNAL) -> None:
+        """
+        Take a slot, waiting in the queue (fairly among clients) if needed.
+
+        Raises:
+            Overloaded: Queue full, or no slot within the queue timeout (or the call deadline)
+        """
+        if not self._waiters and self._has_room():
+            self.inflight += 1
+            return
+        if len(self._waiters) >= ADMISSION_QUEUE_SIZE:
+            self.rejected += 1
+            raise Overloaded(self.name, "queue full", ADMISSION_QUEUE_TIMEOUT)
+
+        timeout = ADMISSION_QUEUE_TIMEOUT
+        budget = remaining()
+        if budget is not None:
+            timeout = min(timeout, budget)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.push(client, future)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if future.done() and not future.cancelled():
+                # Slot was handed over as we gave up - pass it on
+                self.release()
+            else:
+                future.cancel()
+                self._waiters.remove(future)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            self.rejected += 1
+            raise Overloaded(self.name, "queue timeout", ADMISSION_QUEUE_TIMEOUT) from None
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next waiter."""
+        self.inflight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._has_room():
+            future = self._waiters.pop()
+            if not future.done():
+                self.inflight += 1
+                future.set_result(None)
+
+    def record(self, latency: float, overloaded: bool) -> None:
+        """Adjust the limit from one finished call (AIMD)."""
+        self.latency_ewma = latency if self.latency_ewma is None else 0.8 * self.latency_ewma + 0.2 * latency
+        if overloaded or latency > ADMISSION_LATENCY_TARGET:
+            now = asyncio.get_running_loop().time()
+            if now - self._last_decrease >= ADMISSION_DECREASE_COOLDOWN:
+                self._last_decrease = now
+                previous = self.limit
+                self.limit = max(float(ADMISSION_MIN_LIMIT), self.limit * ADMISSION_DECREASE_FACTOR)
+                if int(self.limit) != int(previous):
+                    logger.info(f"🚦 {self.name}: limit {int(previous)} -> {int(self.limit)} ({latency:.2f}s call)")
+        else:
+            self.limit = min(float(ADMISSION_MAX_LIMIT), self.limit + 1.0 / self.limit)
+            self._wake()
+
+    def stats(self) -> dict:
+        return {
+            "limit": int(self.limit),
+            "inflight": self.inflight,
+            "queued": len(self._waiters),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "latencyEwmaMs": None if self.latency_ewma is None else round(self.latency_ewma * 1000),
+        }
+
+
+_KNOWN_TOOLS = frozenset(TOOL_NAMES)
+
+
+class AdmissionController:
+    """One adaptive limiter per tool."""
+
+    def __init__(self):
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+
+    def limiter(self, tool: str) -> AdaptiveLimiter:
+        limiter = self._limiters.get(tool)
+        if limiter is None:
+            limiter = self._limiters[tool] = AdaptiveLimiter(tool)
+        return limiter
+
+    @asynccontextmanager
+    async def admit(self, tool: str, client: str = INTERNAL):
+        """
+        Hold one of the tool's slots for the enclosed call.
+
+        Raises:
+            ValueError: Unknown tool name (never given a limiter or usage counters)
+            Overloaded: The call was shed (tool at capacity or client over budget)
+
+        Example:
+            >>> async with admission.admit("get-player-info", client):
+            >>>     result = await handler(arguments)
+        """
+        if tool not in _KNOWN_TOOLS:
+            raise ValueError(f"Unknown tool: {tool}")
+        limiter = self.limiter(tool)
+        usage.record_call(client, tool)
+        try:
+            with span("admission", limit=int(limiter.limit), inflight=limiter.inflight):
+                if usage.over_budget(client):
+                    limiter.rejected += 1
+                    raise Overloaded(tool, "client upstream budget exhausted", round(usage.budget_reset_in()))
+                await limiter.acquire(client)
+        except Overloaded:
+            usage.record_shed(client)
+            raise
+        limiter.admitted += 1
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        overloaded = False
+        try:
+            yield
+        except TimeoutError:
+            overloaded = True
+            raise
+        finally:
+            limiter.release()
+            limiter.record(loop.time() - started, overloaded)
+
+    def stats(self) -> Dict[str, dict]:
+        return {tool: limiter.stats() for tool, limiter in sorted(self._limiters.items())}
+
+
+admission = AdmissionController()
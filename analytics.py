@@ -0,0 +1,184 @@
+"""
+Over-by-over analytics for Cricket Chat MCP Server.
+
+Loads an innings from the commentary store into compact NumPy arrays (runs,
+extras, wicket flags, over and ball indices) and computes worm, manhattan,
+phase run rates, partnerships and required-rate curves with vectorized
+operations. Results are cached per match, innings and commentary version.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from cachetools import LRUCache
+
+from ball_events import BallLog, EXTRA_NO_BALL, EXTRA_WIDE, NOT_A_BALL
+from config import ANALYTICS_CACHE_SIZE, ANALYTICS_PHASES, ANALYTICS_FORMAT_OVERS
+from commentary_store import CommentaryStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InningsArrays:
+    """Column arrays for the deliveries of one innings, in bowling order."""
+    over: np.ndarray      # int16, zero-based over index
+    ball: np.ndarray      # int8, ball number within the over as shown by the feed
+    runs: np.ndarray      # int16, total runs off the delivery (including extras)
+    extras: np.ndarray    # int16, runs credited as extras
+    wicket: np.ndarray    # bool
+    legal: np.ndarray     # bool, counts towards the over
+
+    def __len__(self) -> int:
+        return len(self.runs)
+
+    @classmethod
+    def from_ball_log(cls, log: BallLog, innings_id: int) -> "InningsArrays":
+        """Select the deliveries of one innings from a match's ball log."""
+        over = log.column("over")
+        mask = (log.column("innings") == innings_id) & (over != NOT_A_BALL)
+        kind = log.column("extra_kind")[mask]
+        return cls(
+            over=over[mask],
+            ball=log.column("ball")[mask],
+            runs=log.column("runs")[mask],
+            extras=log.column("extras")[mask],
+            wicket=log.column("wicket")[mask].astype(bool),
+            legal=(kind != EXTRA_WIDE) & (kind != EXTRA_NO_BALL),
+        )
+
+
+def worm_and_manhattan(arrays: InningsArrays) -> Dict[str, List]:
+    """Per-over runs and wickets (manhattan) and cumulative score (worm)."""
+    if not len(arrays):
+        return {"overs": [], "runs": [], "wickets": [], "cumulative": [], "runRate": []}
+    overs_count = int(arrays.over.max()) + 1
+    per_over = np.bincount(arrays.over, weights=arrays.runs, minlength=overs_count).astype(np.int64)
+    wickets = np.bincount(arrays.over, weights=arrays.wicket, minlength=overs_count).astype(np.int64)
+    cumulative = np.cumsum(per_over)
+    run_rate = cumulative / np.arange(1, overs_count + 1)
+    return {
+        "overs": list(range(1, overs_count + 1)),
+        "runs": per_over.tolist(),
+        "wickets": wickets.tolist(),
+        "cumulative": cumulative.tolist(),
+        "runRate": np.round(run_rate, 2).tolist(),
+    }
+
+
+def phase_run_rates(arrays: InningsArrays, match_format: str) -> List[Dict[str, Any]]:
+    """Runs, wickets and run rate for each phase of the innings (powerplay, middle, death)."""
+    phases = ANALYTICS_PHASES.get(match_format.upper(), [("innings", 0, None)])
+    result = []
+    for name, start, end in phases:
+        mask = arrays.over >= start
+        if end is not None:
+            mask &= arrays.over < end
+        balls = int(arrays.legal[mask].sum())
+        runs = int(arrays.runs[mask].sum())
+        result.append({
+            "phase": name,
+            "overs": f"{start + 1}-{end}" if end is not None else f"{start + 1}+",
+            "runs": runs,
+            "wickets": int(arrays.wicket[mask].sum()),
+            "balls": balls,
+            "runRate": round(runs * 6 / balls, 2) if balls else None,
+        })
+    return result
+
+
+def partnerships(arrays: InningsArrays) -> List[Dict[str, Any]]:
+    """Runs and balls for each partnership (a wicket ball closes the partnership it fell in)."""
+    if not len(arrays):
+        return []
+    partnership_id = np.concatenate(([0], np.cumsum(arrays.wicket)[:-1]))
+    count = int(partnership_id.max()) + 1
+    runs = np.bincount(partnership_id, weights=arrays.runs, minlength=count).astype(np.int64)
+    balls = np.bincount(partnership_id, weights=arrays.legal, minlength=count).astype(np.int64)
+    return [
+        {
+            "wicket": index + 1,
+            "runs": int(runs[index]),
+            "balls": int(balls[index]),
+            "unbroken": index == count - 1 and not bool(arrays.wicket[-1]),
+        }
+        for index in range(count)
+    ]
+
+
+def required_rate_curve(arrays: InningsArrays, target: int, total_overs: int) -> Dict[str, List]:
+    """Required run rate at the end of each over of a chase."""
+    if not len(arrays):
+        return {"overs": [], "required": [], "requiredRate": []}
+    overs_count = int(arrays.over.max()) + 1
+    cumulative_runs = np.cumsum(np.bincount(arrays.over, weights=arrays.runs, minlength=overs_count))
+    cumulative_balls = np.cumsum(np.bincount(arrays.over, weights=arrays.legal, minlength=overs_count))
+    required = np.maximum(target - cumulative_runs, 0)
+    balls_left = total_overs * 6 - cumulative_balls
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = np.where(balls_left > 0, required * 6 / balls_left, np.nan)
+    return {
+        "overs": list(range(1, overs_count + 1)),
+        "required": required.astype(np.int64).tolist(),
+        "requiredRate": [None if np.isnan(r) else round(float(r), 2) for r in rate],
+    }
+
+
+_cache: LRUCache = LRUCache(maxsize=ANALYTICS_CACHE_SIZE)
+
+
+def innings_analytics(
+    store: CommentaryStore,
+    innings_id: int,
+    match_format: Optional[str] = None,
+    target: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Compute (or reuse cached) analytics for one innings held in a commentary store.
+
+    Args:
+        store: Commentary store of the match
+        innings_id: Innings to analyse
+        match_format: Match format ('T20', 'ODI', 'TEST'), read from the match header if omitted
+        target: Chase target, read from the miniscore if omitted
+
+    Returns:
+        dict: worm/manhattan, phases, partnerships and (for chases) required-rate curve
+    """
+    header = store.match_header or {}
+    miniscore = store.miniscore or {}
+    match_format = (match_format or header.get("matchFormat") or "").upper()
+    if target is None and miniscore.get("inningsId") == innings_id:
+        target = miniscore.get("target") or None
+
+    key = (store.match_id, innings_id, store.version, match_format, target)
+    cached = _cache.get(key)
+    if cached is not None:
+        return cached
+
+    arrays = InningsArrays.from_ball_log(store.log, innings_id)
+    result: Dict[str, Any] = {
+        "matchId": store.match_id,
+        "inningsId": innings_id,
+        "version": store.version,
+        "format": match_format or None,
+        "deliveries": len(arrays),
+        "totals": {
+            "runs": int(arrays.runs.sum()),
+            "wickets": int(arrays.wicket.sum()),
+            "extras": int(arrays.extras.sum()),
+            "balls": int(arrays.legal.sum()),
+        },
+        "worm": worm_and_manhattan(arrays),
+        "phases": phase_run_rates(arrays, match_format),
+        "partnerships": partnerships(arrays),
+    }
+    total_overs = ANALYTICS_FORMAT_OVERS.get(match_format)
+    if target and total_overs:
+        result["target"] = target
+        result["requiredRate"] = required_rate_curve(arrays, int(target), total_overs)
+
+    _cache[key] = result
+    return result
@@ -0,0 +1,96 @@
+"""
+Background jobs for Cricket Chat MCP Server.
+
+Long-running maintenance loops (cache warmers, refreshers) register a
+coroutine factory here and are started with the app: `attach(app)` wraps the
+app's lifespan so jobs start after startup and are cancelled on shutdown.
+
+Jobs registered with `leader_only=True` (upstream pollers and prefetchers)
+start only in the worker that wins the leader election (see leader.py), and
+start in another worker if the leader goes away.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, Dict, Optional
+
+from leader import election
+
+logger = logging.getLogger(__name__)
+
+_jobs: Dict[str, Callable[[], Awaitable[None]]] = {}
+_leader_jobs: Dict[str, Callable[[], Awaitable[None]]] = {}
+_tasks: Dict[str, asyncio.Task] = {}
+_election: Optional[asyncio.Task] = None
+
+
+def register(name: str, job: Callable[[], Awaitable[None]], leader_only: bool = False) -> None:
+    """Register a job to run for the lifetime of the app (in the leader worker only, if leader_only)."""
+    (_leader_jobs if leader_only else _jobs)[name] = job
+
+
+async def _supervise(name: str, job: Callable[[], Awaitable[None]]) -> None:
+    """Run a job, restarting it if it crashes."""
+    while True:
+        try:
+            await job()
+            return
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception(f"❌ Background job {name} crashed, restarting in 5s")
+            await asyncio.sleep(5)
+
+
+def _start(jobs: Dict[str, Callable[[], Awaitable[None]]]) -> None:
+    for name, job in jobs.items():
+        if name not in _tasks:
+            logger.info(f"⏱️ Starting background job: {name}")
+            _tasks[name] = asyncio.create_task(_supervise(name, job), name=f"background:{name}")
+
+
+async def _lead() -> None:
+    """Wait to be elected, then start the leader-only jobs."""
+    await election.wait()
+    _start(_leader_jobs)
+
+
+def start() -> None:
+    global _election
+    _start(_jobs)
+    if _leader_jobs and _election is None:
+        _election = asyncio.create_task(_lead(), name="background:leader-election")
+
+
+async def stop() -> None:
+    global _election
+    tasks = list(_tasks.values())
+    if _election is not None:
+        tasks.append(_election)
+        _election = None
+    _tasks.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    election.release()
+
+
+def running() -> Dict[str, bool]:
+    return {name: not task.done() for name, task in _tasks.items()}
+
+
+def attach(app) -> None:
+    """Wrap a Starlette app's lifespan so registered jobs run alongside it."""
+    inner = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app_):
+        async with inner(app_) as state:
+            start()
+            try:
+                yield state
+            finally:
+                await stop()
+
+    app.router.lifespan_context = lifespan
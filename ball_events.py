@@ -0,0 +1,217 @@
+"""
+Compact ball-by-ball event storage for Cricket Chat MCP Server.
+
+Commentary entries arrive as nested upstream dicts that cost several
+kilobytes each once parsed. `BallLog` keeps the facts needed for queries and
+analytics in typed struct-of-arrays columns (with player, team and event
+names interned to small integers), and stores each entry's full payload
+separately as zlib-compressed JSON that is only decoded when commentary text
+is actually requested.
+"""
+
+import json
+import re
+import zlib
+from array import array
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+_EXTRAS_RE = re.compile(r"^[^,]*,\s*(\d+\s+)?(wides?|no balls?|leg byes?|byes?)\b", re.IGNORECASE)
+_RUNS_RE = re.compile(r"(\d+)\s+runs?\b", re.IGNORECASE)
+
+EXTRA_NONE, EXTRA_WIDE, EXTRA_NO_BALL, EXTRA_BYE, EXTRA_LEG_BYE = range(5)
+_EXTRA_KINDS = {
+    "wide": EXTRA_WIDE, "wides": EXTRA_WIDE,
+    "no ball": EXTRA_NO_BALL, "no balls": EXTRA_NO_BALL,
+    "bye": EXTRA_BYE, "byes": EXTRA_BYE,
+    "leg bye": EXTRA_LEG_BYE, "leg byes": EXTRA_LEG_BYE,
+}
+
+NO_INNINGS = -1
+NOT_A_BALL = -1
+
+# Preset dictionary of the keys every commentary entry repeats, so that each
+# small payload compresses well on its own.
+_ZDICT = json.dumps({
+    "commText": "", "timestamp": 0, "ballNbr": 0, "overNumber": 0, "inningsId": 0,
+    "event": "NONE", "batTeamName": "", "batTeamScore": 0, "overSeparator": {},
+    "commentaryFormats": {"bold": {"formatId": [], "formatValue": []}},
+    "batsmanStriker": {"batBalls": 0, "batDots": 0, "batFours": 0, "batId": 0, "batName": "",
+                       "batMins": 0, "batRuns": 0, "batSixes": 0, "batStrikeRate": 0},
+    "bowlerStriker": {"bowlId": 0, "bowlName": "", "bowlMaidens": 0, "bowlNoballs": 0,
+                      "bowlOvs": 0, "bowlRuns": 0, "bowlWides": 0, "bowlWkts": 0, "bowlEcon": 0},
+}, separators=(",", ":")).encode()
+
+T = TypeVar("T", bound=Hashable)
+
+
+class Interner(Generic[T]):
+    """Maps repeated values (player IDs, team names, event names) to small integer codes."""
+
+    def __init__(self):
+        self._codes: Dict[T, int] = {}
+        self._values: List[T] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def code(self, value: T) -> int:
+        """Code for a value, assigning a new one on first sight."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._codes[value] = code
+            self._values.append(value)
+        return code
+
+    def value(self, code: int) -> T:
+        return self._values[code]
+
+
+def parse_ball(entry: dict, previous_score: Optional[int] = None) -> Optional[Tuple[int, int, int, int, int, bool]]:
+    """
+    Extract ball facts from a Cricbuzz commentary entry.
+
+    Runs come from the change in `batTeamScore` when the feed provides it,
+    otherwise from the event and commentary text. A counted wide or bye
+    ("5 wides", "2 leg byes") gives its count, which already includes the
+    wide's penalty run.
+
+    Args:
+        entry: Commentary entry
+        previous_score: Team score after the previous ball, if known
+
+    Returns:
+        Tuple of (over, ball, runs, extras, extra_kind, wicket), or None for
+        entries that are not deliveries
+    """
+    over_number = entry.get("overNumber")
+    if not over_number:
+        return None
+    over_number = float(over_number)
+    over = int(over_number)
+    ball = int(round((over_number - over) * 10))
+
+    text = entry.get("commText") or ""
+    event = (entry.get("event") or "").upper()
+
+    extra_kind = EXTRA_NONE
+    counted = None
+    match = _EXTRAS_RE.match(text)
+    if match:
+        extra_kind = _EXTRA_KINDS.get(match.group(2).lower(), EXTRA_NONE)
+        if match.group(1) and extra_kind in (EXTRA_WIDE, EXTRA_BYE, EXTRA_LEG_BYE):
+            counted = int(match.group(1))
+
+    score = entry.get("batTeamScore")
+    if score is not None and previous_score is not None:
+        runs = int(score) - previous_score
+    elif counted is not None:
+        runs = counted
+    elif "SIX" in event:
+        runs = 6
+    elif "FOUR" in event:
+        runs = 4
+    else:
+        found = _RUNS_RE.search(text)
+        runs = int(found.group(1)) if found else 0
+        if extra_kind in (EXTRA_WIDE, EXTRA_NO_BALL):
+            runs += 1  # Penalty run on top of any runs taken
+
+    if extra_kind in (EXTRA_WIDE, EXTRA_BYE, EXTRA_LEG_BYE):
+        extras = runs
+    elif extra_kind == EXTRA_NO_BALL:
+        extras = 1
+    else:
+        extras = 0
+
+    return over, ball, runs, extras, extra_kind, "WICKET" in event
+
+
+class BallLog:
+    """
+    Append-only, column-oriented log of commentary entries for one match.
+
+    Every entry gets a row; entries that are not deliveries (over breaks,
+    milestones) have `over == NOT_A_BALL`.
+    """
+
+    def __init__(self):
+        self.timestamp = array("q")
+        self.innings = array("b")
+        self.over = array("h")
+        self.ball = array("b")
+        self.runs = array("h")
+        self.extras = array("h")
+        self.extra_kind = array("b")
+        self.wicket = array("b")
+        self.striker = array("i")
+        self.bowler = array("i")
+        self.team = array("i")
+        self.event = array("i")
+        self.players: Interner = Interner()
+        self.teams: Interner = Interner()
+        self.events: Interner = Interner()
+        self._payloads: List[bytes] = []
+        self._last_score: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def append(self, entry: dict) -> None:
+        """Parse an entry into the columns and store its compressed payload."""
+        innings = entry.get("inningsId")
+        innings = NO_INNINGS if innings is None else int(innings)
+        parsed = parse_ball(entry, self._last_score.get(innings))
+        if entry.get("batTeamScore") is not None:
+            self._last_score[innings] = int(entry["batTeamScore"])
+        over, ball, runs, extras, extra_kind, wicket = parsed or (NOT_A_BALL, 0, 0, 0, EXTRA_NONE, False)
+
+        striker = (entry.get("batsmanStriker") or {}).get("batId")
+        bowler = (entry.get("bowlerStriker") or {}).get("bowlId")
+
+        self.timestamp.append(int(entry.get("timestamp") or 0))
+        self.innings.append(innings)
+        self.over.append(over)
+        self.ball.append(ball)
+        self.runs.append(runs)
+        self.extras.append(extras)
+        self.extra_kind.append(extra_kind)
+        self.wicket.append(1 if wicket else 0)
+        self.striker.append(self.players.code(striker))
+        self.bowler.append(self.players.code(bowler))
+        self.team.append(self.teams.code(entry.get("batTeamName")))
+        self.event.append(self.events.code(entry.get("event")))
+
+        compressor = zlib.compressobj(level=6, zdict=_ZDICT)
+        payload = json.dumps(entry, separators=(",", ":")).encode()
+        self._payloads.append(compressor.compress(payload) + compressor.flush())
+
+    def entry(self, index: int) -> dict:
+        """Decode the full upstream entry (commentary text included) for a row."""
+        decompressor = zlib.decompressobj(zdict=_ZDICT)
+        return json.loads(decompressor.decompress(self._payloads[index]) + decompressor.flush())
+
+    def entries(self, indices) -> List[dict]:
+        """Decode the full entries for the given rows."""
+        return [self.entry(int(index)) for index in indices]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        NumPy copy of a column.
+
+        A copy rather than a view: `array.array` cannot grow while a buffer
+        export is alive, and the log keeps appending during live matches.
+        """
+        col = getattr(self, name)
+        return np.array(col, dtype=col.typecode)
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns and payloads."""
+        columns = (self.timestamp, self.innings, self.over, self.ball, self.runs, self.extras,
+                   self.extra_kind, self.wicket, self.striker, self.bowler, self.team, self.event)
+        return (
+            sum(col.buffer_info()[1] * col.itemsize for col in columns)
+            + sum(len(p) for p in self._payloads)
+        )
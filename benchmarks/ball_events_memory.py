@@ -0,0 +1,134 @@
+"""
+Memory benchmark: upstream commentary dicts vs the compact BallLog.
+
+Synthesizes a full five-day Test (450 overs across four innings, plus over
+breaks) shaped like the Cricbuzz `/mcenter/v1/{id}/comm` feed, decodes it page
+by page the way the client does, and compares the tracemalloc footprint of
+holding the parsed dicts with holding the same entries in a BallLog.
+
+Usage:
+    python benchmarks/ball_events_memory.py
+"""
+
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ball_events import BallLog  # noqa: E402
+
+OVERS_PER_DAY = 90
+DAYS = 5
+PAGE_SIZE = 12
+
+PHRASES = [
+    "no run, defended solidly back down the pitch",
+    "1 run, worked off the pads towards square leg",
+    "FOUR, driven handsomely through the covers, no stopping that",
+    "2 runs, pushed into the gap at deep point and they come back for the second",
+    "no run, left alone outside off stump, good carry through to the keeper",
+    "SIX, that's gone a long way over long-on!",
+]
+
+
+def synthesize_test(seed: int = 7) -> list:
+    """Commentary entries for a five-day Test, oldest first."""
+    rng = random.Random(seed)
+    entries = []
+    timestamp = 1_700_000_000_000
+    ball_nbr = 0
+    for over in range(OVERS_PER_DAY * DAYS):
+        innings = 1 + over * 4 // (OVERS_PER_DAY * DAYS)
+        if over % (OVERS_PER_DAY * DAYS // 4) == 0:
+            score = 0
+        for ball in range(1, 7):
+            timestamp += rng.randint(25_000, 60_000)
+            ball_nbr += 1
+            phrase = rng.choice(PHRASES)
+            runs = 6 if "SIX" in phrase else 4 if "FOUR" in phrase else 2 if "2 runs" in phrase else 1 if "1 run" in phrase else 0
+            score += runs
+            entries.append({
+                "commText": f"Bowler{over % 5} to Batter{ball_nbr % 11}, {phrase}. " * 2,
+                "timestamp": timestamp,
+                "ballNbr": ball_nbr,
+                "overNumber": over % (OVERS_PER_DAY * DAYS // 4) + ball / 10,
+                "inningsId": innings,
+                "event": "SIX" if runs == 6 else "FOUR" if runs == 4 else "NONE",
+                "batTeamName": "IND" if innings % 2 else "AUS",
+                "batTeamScore": score,
+                "commentaryFormats": {"bold": {"formatId": ["B0$"], "formatValue": [f"Bowler{over % 5}"]}},
+                "batsmanStriker": {
+                    "batBalls": rng.randint(0, 300), "batDots": rng.randint(0, 200), "batFours": rng.randint(0, 20),
+                    "batId": 1000 + ball_nbr % 11, "batName": f"Batter{ball_nbr % 11}", "batMins": rng.randint(0, 400),
+                    "batRuns": rng.randint(0, 200), "batSixes": rng.randint(0, 5), "batStrikeRate": round(rng.random() * 100, 2),
+                },
+                "bowlerStriker": {
+                    "bowlId": 2000 + over % 5, "bowlName": f"Bowler{over % 5}", "bowlMaidens": rng.randint(0, 10),
+                    "bowlNoballs": 0, "bowlOvs": round(rng.random() * 30, 1), "bowlRuns": rng.randint(0, 120),
+                    "bowlWides": rng.randint(0, 3), "bowlWkts": rng.randint(0, 5), "bowlEcon": round(rng.random() * 6, 2),
+                },
+            })
+        timestamp += 60_000
+        entries.append({
+            "commText": f"End of over {over + 1}", "timestamp": timestamp, "inningsId": innings,
+            "event": "over-break", "overSeparator": {"score": score, "wickets": 3, "overNum": over + 0.6,
+                                                     "o_summary": "0 1 4 0 2 1 ", "runs": 8},
+        })
+    return entries
+
+
+def measure(build) -> tuple:
+    """Retained bytes (traced run) and wall time (untraced run) of building a structure."""
+    started = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before, elapsed
+
+
+def main() -> None:
+    entries = synthesize_test()
+    pages = [
+        json.dumps({"commentaryList": entries[i:i + PAGE_SIZE]})
+        for i in range(0, len(entries), PAGE_SIZE)
+    ]
+
+    def build_dicts():
+        held = []
+        for page in pages:
+            held.extend(json.loads(page)["commentaryList"])
+        return held
+
+    def build_log():
+        log = BallLog()
+        for page in pages:
+            for entry in json.loads(page)["commentaryList"]:
+                log.append(entry)
+        return log
+
+    dicts, dict_bytes, dict_time = measure(build_dicts)
+    log, log_bytes, log_time = measure(build_log)
+
+    print(f"entries:        {len(dicts)}")
+    print(f"dicts:          {dict_bytes / 1024:10.1f} KiB  ({dict_bytes / len(dicts):7.1f} B/entry, built in {dict_time * 1000:.1f} ms)")
+    print(f"BallLog:        {log_bytes / 1024:10.1f} KiB  ({log_bytes / len(log):7.1f} B/entry, built in {log_time * 1000:.1f} ms)")
+    print(f"  columns+blobs {log.nbytes() / 1024:10.1f} KiB")
+    print(f"ratio:          {log_bytes / dict_bytes:10.1%} of the dict footprint")
+
+    started = time.perf_counter()
+    decoded = log.entries(range(len(log) - 42, len(log)))
+    print(f"decode last 6 overs: {(time.perf_counter() - started) * 1e6:.0f} µs ({len(decoded)} entries)")
+    assert decoded[-1] == dicts[-1]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Event-loop lag benchmark: how long do hot paths hold the loop?
+
+Runs the loop monitor while exercising the paths that do synchronous work
+on the event loop:
+- serving every widget resource (bundle read plus stderr logging)
+- concurrent tool calls against a local stub upstream that returns a large
+  player payload (JSON decode plus result serialization)
+
+It then reports scheduling lag and every blocking episode longer than the
+threshold, grouped by the coroutine that held the loop.
+
+Usage:
+    python benchmarks/loop_lag.py [--calls 200] [--threshold-ms 20] [--fail-over-ms 100]
+
+With --fail-over-ms the exit status is 1 if any episode was longer, so the
+benchmark can gate regressions.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _player_payload(size_kb: int) -> bytes:
+    """A player profile padded with a long bio and ranking history, about size_kb large."""
+    history = [{"format": "ODI", "rank": i % 100, "date": f"2024-{i % 12 + 1:02d}-01"} for i in range(size_kb * 8)]
+    return json.dumps({"id": "1413", "name": "Virat Kohli", "bio": "x" * 2048, "rankHistory": history}).encode()
+
+
+def start_stub_upstream(size_kb: int) -> ThreadingHTTPServer:
+    body = _player_payload(size_kb)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run(args) -> int:
+    import mcp.types as types
+    from loop_monitor import LoopMonitor
+    from mcp_handlers import read_resource_handler
+    from response_cache import player_cache
+    from tools import handle_tool_call
+    from widgets import WIDGETS_BY_URI
+
+    monitor = LoopMonitor(interval=0.005, threshold=args.threshold_ms / 1000)
+    monitor_task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.05)
+    started = time.perf_counter()
+
+    for uri in WIDGETS_BY_URI:
+        await read_resource_handler(types.ReadResourceRequest(
+            method="resources/read", params=types.ReadResourceRequestParams(uri=uri),
+        ))
+
+    async def call(i: int) -> None:
+        player_cache._cache.clear()  # every call goes upstream
+        await handle_tool_call(types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="get-player-info", arguments={"player_id": str(1413 + i % 5)}),
+        ))
+
+    for batch in range(0, args.calls, args.concurrency):
+        await asyncio.gather(*(call(i) for i in range(batch, min(args.calls, batch + args.concurrency))))
+
+    elapsed = time.perf_counter() - started
+    await asyncio.sleep(0.05)
+    monitor_task.cancel()
+    await asyncio.gather(monitor_task, return_exceptions=True)
+
+    stats = monitor.stats()
+    by_coroutine = defaultdict(list)
+    for episode in stats["recentBlocks"]:
+        by_coroutine[episode["coroutine"]].append(episode)
+
+    print(f"workload:      {len(WIDGETS_BY_URI)} widget reads + {args.calls} tool calls in {elapsed:.2f} s")
+    print(f"lag:           p50 {stats['lagMs']['p50']} ms, p99 {stats['lagMs']['p99']} ms, max {stats['lagMs']['max']} ms")
+    print(f"blocked >{args.threshold_ms} ms: {stats['blockedTotal']} episodes")
+    for coroutine, episodes in sorted(by_coroutine.items(), key=lambda kv: -max(e["blockedMs"] for e in kv[1])):
+        worst = max(episodes, key=lambda e: e["blockedMs"])
+        frames = " <- ".join(reversed(worst["stack"].split(";")[-3:]))
+        print(f"  {len(episodes):4d}x  max {worst['blockedMs']:7.1f} ms  {coroutine}")
+        print(f"         {frames}")
+
+    if args.fail_over_ms is not None and monitor.max_lag * 1000 > args.fail_over_ms:
+        print(f"FAIL: loop blocked for {monitor.max_lag * 1000:.0f} ms (limit {args.fail_over_ms} ms)")
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--payload-kb", type=int, default=256)
+    parser.add_argument("--threshold-ms", type=float, default=20)
+    parser.add_argument("--fail-over-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    server = start_stub_upstream(args.payload_kb)
+    os.environ["CRICBUZZ_BASE_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ.setdefault("RAPIDAPI_KEY", "benchmark")
+
+    # Keep the server's log output (part of what is measured) off the terminal
+    devnull = open(os.devnull, "w")
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = devnull
+    import mcp_handlers  # noqa: F401 - configures logging onto the (redirected) stdout
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler):
+            handler.setStream(devnull)
+    sys.stdout = stdout
+    sys.stderr = devnull
+
+    status = asyncio.run(run(args))
+    sys.stderr = stderr
+    server.shutdown()
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Offload benchmark: when does moving a transform to a worker pool pay off?
+
+For growing input sizes, runs each CPU-heavy transform three ways on a live
+event loop: inline, in a thread pool and in a process pool. A 1 ms ticker
+runs alongside and measures how long the loop was blocked. The transforms
+are:
+- diff: json_diff between two versions of a synthetic detailed scorecard
+  (the get-match-scorecard / live stream path)
+- records: VenueStatsCache._compute over a venue's match history
+- decode: json.loads of the scorecard body, for comparison. C code that
+  holds the GIL throughout, so a thread does not unblock the loop
+
+Reports the wall time of one call, the longest loop stall during it, and
+the node count used for the inline threshold (EXECUTOR_POOLS).
+
+Usage:
+    python benchmarks/offload.py [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from executors import WorkerPool, approx_size  # noqa: E402
+from scorecard_store import json_diff  # noqa: E402
+from venue_stats import VenueStatsCache  # noqa: E402
+
+
+def synthesize_scorecard(innings: int, rng: random.Random) -> dict:
+    """A detailed scorecard with `innings` innings of 11 batters and 6 bowlers each."""
+    def batter(i):
+        return {"batId": 1000 + i, "batName": f"Batter {i}", "runs": rng.randint(0, 120), "balls": rng.randint(0, 150),
+                "fours": rng.randint(0, 12), "sixes": rng.randint(0, 6), "strikeRate": round(rng.uniform(40, 180), 2),
+                "outDesc": "c Keeper b Bowler", "isCaptain": i == 0, "isKeeper": i == 6}
+
+    def bowler(i):
+        return {"bowlId": 2000 + i, "bowlName": f"Bowler {i}", "overs": rng.randint(0, 10), "maidens": rng.randint(0, 3),
+                "runs": rng.randint(0, 80), "wickets": rng.randint(0, 5), "economy": round(rng.uniform(3, 11), 2)}
+
+    return {
+        "scoreCard": [{
+            "inningsId": n + 1,
+            "batTeamDetails": {"batTeamName": f"Team {n % 2}", "batsmenData": {f"bat_{i}": batter(i) for i in range(11)}},
+            "bowlTeamDetails": {"bowlTeamName": f"Team {1 - n % 2}", "bowlersData": {f"bowl_{i}": bowler(i) for i in range(6)}},
+            "scoreDetails": {"runs": rng.randint(100, 400), "wickets": rng.randint(0, 10), "overs": rng.randint(20, 90)},
+            "extrasData": {"byes": 1, "legByes": 2, "wides": 3, "noBalls": 1, "total": 7},
+            "wicketsData": {f"wkt_{i}": {"batName": f"Batter {i}", "wktRuns": 20 * i, "wktOver": 3.2 * i} for i in range(10)},
+            "partnershipsData": {f"pat_{i}": {"bat1Name": "A", "bat2Name": "B", "totalRuns": 30, "totalBalls": 40} for i in range(10)},
+        } for n in range(innings)],
+        "matchHeader": {"matchId": 1, "status": "In progress", "state": "In Progress"},
+    }
+
+
+def next_version(scorecard: dict, rng: random.Random) -> dict:
+    """The same scorecard one ball later: a few numbers change in the last innings."""
+    updated = copy.deepcopy(scorecard)
+    last = updated["scoreCard"][-1]
+    last["scoreDetails"]["runs"] += 1
+    batter = last["batTeamDetails"]["batsmenData"][f"bat_{rng.randrange(11)}"]
+    batter["runs"] += 1
+    batter["balls"] += 1
+    return updated
+
+
+def synthesize_venue_matches(count: int, rng: random.Random) -> dict:
+    matches = []
+    for i in range(count):
+        first = rng.randint(120, 380)
+        matches.append({
+            "matchInfo": {"matchId": i, "state": "Complete", "matchFormat": rng.choice(["T20", "ODI", "TEST"]),
+                          "startDate": str(1_600_000_000_000 + i * 86_400_000), "seriesName": "Series",
+                          "team1": {"teamName": "India", "teamSName": "IND"},
+                          "team2": {"teamName": "Australia", "teamSName": "AUS"},
+                          "status": f"India won by {rng.randint(1, 80)} runs"},
+            "matchScore": {"team1Score": {"inngs1": {"inningsId": 1, "runs": first}},
+                           "team2Score": {"inngs1": {"inningsId": 2, "runs": first - 10}}},
+        })
+    return {"matchDetails": [{"matchDetailsMap": {"match": matches}}]}
+
+
+async def measure(pool, fn, args, repeat: int):
+    """Median wall time and worst loop stall (ms) of running fn(*args) `repeat` times."""
+    stall = 0.0
+    walls = []
+    stop = False
+
+    async def ticker():
+        nonlocal stall
+        loop = asyncio.get_running_loop()
+        last = loop.time()
+        while not stop:
+            await asyncio.sleep(0.001)
+            now = loop.time()
+            stall = max(stall, now - last - 0.001)
+            last = now
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    for _ in range(repeat):
+        started = time.perf_counter()
+        if pool is None:
+            fn(*args)
+            await asyncio.sleep(0)
+        else:
+            await pool.run(fn, *args, size=pool.inline_below)
+        walls.append(time.perf_counter() - started)
+    stop = True
+    await ticking
+    walls.sort()
+    return walls[len(walls) // 2] * 1000, stall * 1000
+
+
+async def run(args) -> None:
+    rng = random.Random(11)
+    pools = {
+        "thread": WorkerPool("bench-thread", "thread", 2, 8, 0),
+        "process": WorkerPool("bench-process", "process", 2, 8, 0),
+    }
+    # Start the workers up front so process start-up is not measured
+    for pool in pools.values():
+        await pool.run(len, [], size=1)
+
+    cases = []
+    for innings in (1, 4, 16, 64):
+        old = synthesize_scorecard(innings, rng)
+        new = next_version(old, rng)
+        cases.append(("diff", f"{innings} innings", json_diff, (old, new)))
+    for innings in (4, 64):
+        body = json.dumps(synthesize_scorecard(innings, rng)).encode()
+        cases.append(("decode", f"{len(body) // 1024} KB", json.loads, (body,)))
+    for count in (50, 500, 5000):
+        matches = synthesize_venue_matches(count, rng)
+        cases.append(("records", f"{count} matches", VenueStatsCache._compute, (1, {}, matches)))
+
+    print(f"{'transform':<9} {'input':<12} {'nodes':>7}   {'inline ms':>17}   {'thread ms':>17}   {'process ms':>17}")
+    print(f"{'':<9} {'':<12} {'':>7}   {'wall / stall':>17}   {'wall / stall':>17}   {'wall / stall':>17}")
+    for kind, label, fn, call_args in cases:
+        nodes = approx_size(call_args, 10**7)
+        row = [await measure(None, fn, call_args, args.repeat)]
+        for mode in ("thread", "process"):
+            row.append(await measure(pools[mode], fn, call_args, args.repeat))
+        cells = "   ".join(f"{wall:8.2f} / {stall:6.2f}" for wall, stall in row)
+        print(f"{kind:<9} {label:<12} {nodes:>7}   {cells}")
+
+    for pool in pools.values():
+        pool.shutdown()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Multi-worker benchmark: does throughput scale with workers without multiplying upstream calls?
+
+Starts a stub upstream that counts requests, then for each worker count runs
+`uvicorn server:app --workers N` against it. Concurrent MCP `tools/call`
+requests for get-player-info are sent over a small set of player IDs
+(stateless streamable HTTP on /mcp). Each run uses a fresh shared state
+directory, so every run starts cold.
+
+Reports requests per second, speed-up over one worker, and upstream
+requests. With the shared cache the upstream count should stay at one per
+distinct player, whatever the worker count.
+
+Usage:
+    python benchmarks/workers.py [--workers 1,2,4] [--seconds 10] [--concurrency 64]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def start_counting_upstream():
+    """Stub upstream serving a player profile for any path; returns (server, request counter)."""
+    body = json.dumps({"id": "1413", "name": "Virat Kohli", "bio": "x" * 4096}).encode()
+    counter = {"requests": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                counter["requests"] += 1
+            time.sleep(0.05)  # upstream latency
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, counter
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def drive(url: str, seconds: float, concurrency: int, players: int) -> int:
+    """Send tool calls from `concurrency` clients for `seconds`; returns completed calls."""
+    headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+    done = 0
+    stop_at = time.perf_counter() + seconds
+
+    async def client(n: int) -> None:
+        nonlocal done
+        async with httpx.AsyncClient(timeout=30) as http:
+            i = n
+            while time.perf_counter() < stop_at:
+                request = {
+                    "jsonrpc": "2.0", "id": i, "method": "tools/call",
+                    "params": {"name": "get-player-info", "arguments": {"player_id": str(1000 + i % players)}},
+                }
+                response = await http.post(url, json=request, headers=headers)
+                if response.status_code == 200:
+                    done += 1
+                i += concurrency
+
+    await asyncio.gather(*(client(n) for n in range(concurrency)))
+    return done
+
+
+def wait_healthy(base: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError("server did not become healthy")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", default="1,2,4")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--players", type=int, default=20)
+    args = parser.parse_args()
+
+    upstream, counter = start_counting_upstream()
+    print(f"{'workers':>7} {'calls/s':>9} {'speed-up':>9} {'upstream':>9}")
+    baseline = None
+    for workers in (int(w) for w in args.workers.split(",")):
+        port = free_port()
+        env = {
+            **os.environ,
+            "RAPIDAPI_KEY": "benchmark",
+            "CRICBUZZ_BASE_URL": f"http://127.0.0.1:{upstream.server_port}",
+            "WEB_CONCURRENCY": str(workers),
+            "SHARED_STATE_DIR": tempfile.mkdtemp(prefix="cric_chat_bench_"),
+            "TRACING_ENABLED": "0",
+        }
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port), "--log-level", "warning"],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            base = f"http://127.0.0.1:{port}"
+            wait_healthy(base)
+            before = counter["requests"]
+            calls = asyncio.run(drive(f"{base}/mcp", args.seconds, args.concurrency, args.players))
+            rate = calls / args.seconds
+            baseline = baseline or rate
+            print(f"{workers:>7} {rate:>9.0f} {rate / baseline:>8.2f}x {counter['requests'] - before:>9}")
+        finally:
+            server.terminate()
+            server.wait()
+    upstream.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Per-client accounting for Cricket Chat MCP Server.
+
+Tool calls are attributed to a client, identified in this order by:
+- a hashed API key (`X-API-Key` or `Authorization` header)
+- the request's `Origin`
+- the MCP client name from the session's initialize handshake
+- the remote address
+
+The client ID is set in the upstream `current_client` context for the
+duration of the call. Image proxy requests are attributed the same way
+(`identify_request`), minus the MCP handshake. Admission queues and upstream slots are then shared
+fairly between clients, weighted by CLIENT_WEIGHTS.
+
+Usage is counted per client: tool calls, shed calls and upstream requests.
+Each client may make at most CLIENT_UPSTREAM_BUDGET upstream requests per
+CLIENT_BUDGET_WINDOW, so a single integration cannot use up the RapidAPI
+quota. Once over budget, the client's calls are shed until the window rolls
+over. Windows are aligned to wall-clock time, so every worker agrees on them.
+Clients not seen for a whole window are forgotten when it rolls over, so
+callers rotating API keys or origins cannot grow the counters without bound.
+
+With several workers, each worker publishes its per-client counts to the
+shared state every CLIENT_BUDGET_SYNC_INTERVAL and adds the other workers'
+counts to its own (`run`), so the budget covers all workers together. If
+the shared state cannot be reached, each worker enforces an equal share of
+the budget instead.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+from mcp.server.lowlevel.server import request_ctx
+
+from config import (
+    CLIENT_WEIGHTS,
+    CLIENT_UPSTREAM_BUDGET,
+    CLIENT_BUDGET_WINDOW,
+    CLIENT_BUDGET_SYNC_INTERVAL,
+    WORKERS,
+)
+from cric_buzz_service.upstream import scheduler
+from memory import deep_sizeof, estimate
+from shared_cache import shared_cache
+
+logger = logging.getLogger(__name__)
+
+INTERNAL = "internal"
+
+
+def _from_headers(request) -> Optional[str]:
+    headers = getattr(request, "headers", None)
+    if headers is not None:
+        api_key = headers.get("x-api-key") or headers.get("authorization")
+        if api_key:
+            return f"key:{hashlib.sha256(api_key.encode()).hexdigest()[:12]}"
+        origin = headers.get("origin")
+        if origin:
+            return f"origin:{origin}"
+    return None
+
+
+def _from_address(request) -> str:
+    remote = getattr(request, "client", None)
+    if remote is not None and remote.host:
+        return f"ip:{remote.host}"
+    return "anonymous"
+
+
+def identify_client() -> str:
+    """Client ID of the MCP request being handled ('internal' outside a request)."""
+    try:
+        ctx = request_ctx.get()
+    except LookupError:
+        return INTERNAL
+
+    client = _from_headers(ctx.request)
+    if client is not None:
+        return client
+
+    client_params = getattr(ctx.session, "client_params", None)
+    if client_params is not None and client_params.clientInfo is not None:
+        return f"client:{client_params.clientInfo.name}"
+    return _from_address(ctx.request)
+
+
+def identify_request(request) -> str:
+    """Client ID of a plain HTTP request (image proxy): API key, then Origin, then remote address."""
+    return _from_headers(request) or _from_address(request)
+
+
+class UsageMeter:
+    """Per-client tool call counters and upstream request budget over a fixed window."""
+
+    def __init__(self):
+        self.calls: Dict[str, Counter] = {}       # client -> tool -> calls
+        self.shed: Counter = Counter()
+        self.last_seen: Dict[str, float] = {}
+        self._window = self._current_window()
+        self._window_baseline: Counter = Counter()  # scheduler.requests at window start
+        self._other_workers: Counter = Counter()    # other workers' requests in this window
+        self._shared = False                        # last exchange with the other workers succeeded
+
+    @staticmethod
+    def _current_window() -> int:
+        return int(time.time() // CLIENT_BUDGET_WINDOW)
+
+    def _roll(self) -> None:
+        window = self._current_window()
+        if window != self._window:
+            self._window = window
+            self._prune(time.time() - CLIENT_BUDGET_WINDOW)
+            self._window_baseline = Counter(scheduler.requests)
+            self._other_workers = Counter()
+
+    def _prune(self, before: float) -> None:
+        """Forget clients not seen since `before` (they have no requests in the new window)."""
+        stale = [
+            client for client in set(self.calls) | set(scheduler.requests) | set(self.shed)
+            if client != INTERNAL and self.last_seen.get(client, 0.0) < before
+        ]
+        for client in stale:
+            self.calls.pop(client, None)
+            self.shed.pop(client, None)
+            self.last_seen.pop(client, None)
+            scheduler.requests.pop(client, None)
+        if stale:
+            logger.info(f"🧹 Forgot {len(stale)} idle clients")
+
+    def nbytes(self) -> int:
+        """Estimated memory of the per-client counters."""
+        return (
+            estimate(self.calls.values(), len(self.calls))
+            + deep_sizeof(self.last_seen)
+            + deep_sizeof(self.shed)
+            + deep_sizeof(scheduler.requests)
+        )
+
+    def _local_in_window(self, client: str) -> int:
+        return scheduler.requests[client] - self._window_baseline[client]
+
+    def upstream_in_window(self, client: str) -> int:
+        """Upstream requests by the client in the current window, across all workers."""
+        self._roll()
+        return self._local_in_window(client) + self._other_workers[client]
+
+    def budget_reset_in(self) -> float:
+        return max(0.0, (self._window + 1) * CLIENT_BUDGET_WINDOW - time.time())
+
+    def budget(self) -> int:
+        """Budget enforced here: the whole budget when counts are shared, else this worker's share."""
+        if WORKERS > 1 and not self._shared:
+            return max(1, CLIENT_UPSTREAM_BUDGET // WORKERS)
+        return CLIENT_UPSTREAM_BUDGET
+
+    def over_budget(self, client: str) -> bool:
+        return client != INTERNAL and self.upstream_in_window(client) >= self.budget()
+
+    async def run(self) -> None:
+        """Exchange window counts with the other workers (multi-worker mode only)."""
+        if shared_cache is None:
+            return
+        while True:
+            self._roll()
+            window = self._window
+            counts = {}
+            for client in list(scheduler.requests):
+                requests = self._local_in_window(client)
+                if client != INTERNAL and requests > 0:
+                    counts[client] = requests
+            others = await shared_cache.exchange_usage(window, counts)
+            self._shared = others is not None
+            if others is not None and window == self._window:
+                self._other_workers = Counter(others)
+            await asyncio.sleep(CLIENT_BUDGET_SYNC_INTERVAL)
+
+    def record_call(self, client: str, tool: str) -> None:
+        self.calls.setdefault(client, Counter())[tool] += 1
+        self.last_seen[client] = time.time()
+
+    def record_shed(self, client: str) -> None:
+        self.shed[client] += 1
+
+    def stats(self, client: Optional[str] = None) -> Dict[str, dict]:
+        clients = [client] if client is not None else sorted(set(self.calls) | set(scheduler.requests))
+        return {
+            c: {
+                "toolCalls": sum(self.calls.get(c, {}).values()),
+                "byTool": dict(self.calls.get(c, {})),
+                "shed": self.shed[c],
+                "upstreamRequests": scheduler.requests[c],
+                "upstreamInWindow": self.upstream_in_window(c),
+                "upstreamBudget": None if c == INTERNAL else self.budget(),
+                "weight": scheduler.weights.get(c, 1.0),
+                "lastSeen": self.last_seen.get(c),
+            }
+            for c in clients
+        }
+
+
+scheduler.weights.update(CLIENT_WEIGHTS)
+usage = UsageMeter()
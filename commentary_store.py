@@ -0,0 +1,279 @@
+"""
+Incremental commentary store for Cricket Chat MCP Server.
+
+Keeps an append-only, per-match log of ball-by-ball commentary synced from
+the Cricbuzz `/mcenter/v1/{match_id}/comm` feed. Each sync only downloads the
+entries that are newer than the last seen `timestamp` (tms): the feed's latest
+page is fetched first and older pages are requested with the `tms` cursor only
+until they overlap what the store already holds. "Last N overs" queries are
+then served from memory.
+
+A sync walks back at most COMMENTARY_MAX_PAGES_PER_SYNC pages, and stops
+early when fewer than COMMENTARY_PAGE_RESERVE seconds of the call deadline
+are left. If it stops (or is cancelled) before reaching the entries already
+held, the fetched entries and cursor are kept and the next sync continues
+the walk; nothing is appended until the gap is closed, so the log never has
+an unflagged hole. When entries are out of reach (the first sync of a long
+match hits the cap, or the feed's cursor stops moving back),
+`history_complete` is False. Tool results report both as `complete`.
+
+Entries are held in a compact `BallLog` (see ball_events.py) rather than as
+upstream dicts; full entries are only decoded for the rows a query returns.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ball_events import BallLog, NO_INNINGS, NOT_A_BALL
+from config import (
+    COMMENTARY_SYNC_INTERVAL,
+    COMMENTARY_MAX_PAGES_PER_SYNC,
+    COMMENTARY_MAX_MATCHES,
+    COMMENTARY_PAGE_RESERVE,
+)
+from cric_buzz_service.base_client import DataIsEmpty
+from cric_buzz_service.matches_api import MatchesAPI
+from cric_buzz_service.upstream import remaining
+from memory import evict_lru
+from shared_cache import shared_fetch
+
+logger = logging.getLogger(__name__)
+
+EntryKey = Tuple[Optional[int], int]
+
+
+def _entry_key(entry: dict) -> Optional[EntryKey]:
+    """Identity of a commentary entry: (inningsId, timestamp)."""
+    timestamp = entry.get("timestamp")
+    if timestamp is None:
+        return None
+    return entry.get("inningsId"), int(timestamp)
+
+
+class CommentaryStore:
+    """Append-only commentary log for a single match."""
+
+    def __init__(self, match_id: int):
+        self.match_id = match_id
+        self.log = BallLog()
+        self._lock = asyncio.Lock()
+        self.last_timestamp: Optional[int] = None
+        self.last_synced: Optional[float] = None
+        self.match_header: Optional[dict] = None
+        self.miniscore: Optional[dict] = None
+        self.pages_fetched = 0
+        self.version = 0
+        self.history_complete = True  # False when the first sync could not reach the start of the feed
+        self._backfill: Optional[Tuple[int, int, Dict[EntryKey, dict]]] = None  # (since, cursor, fetched) of an unfinished walk-back
+
+    def __len__(self) -> int:
+        return len(self.log)
+
+    def entries_since(self, start: int) -> List[dict]:
+        """Decoded entries from row `start` onwards, oldest first."""
+        return self.log.entries(range(start, len(self.log)))
+
+    @property
+    def complete(self) -> bool:
+        """Whether the log holds every entry from the start of the feed up to the last sync."""
+        return self.history_complete and self._backfill is None
+
+    def is_stale(self) -> bool:
+        """Whether the store is due for a sync."""
+        if self.last_synced is None:
+            return True
+        return time.monotonic() - self.last_synced >= COMMENTARY_SYNC_INTERVAL
+
+    async def sync_if_stale(self, api: MatchesAPI) -> int:
+        """Sync with the upstream feed unless it was synced recently."""
+        if not self.is_stale():
+            return 0
+        return await self.sync(api)
+
+    async def sync(self, api: MatchesAPI) -> int:
+        """
+        Fetch entries newer than the last seen timestamp and append them.
+
+        Args:
+            api: MatchesAPI client used for the upstream requests
+
+        Returns:
+            int: Number of new entries appended to the log
+        """
+        async with self._lock:
+            resumed = self._backfill is not None
+            if resumed:
+                since, cursor, fresh = self._backfill
+            else:
+                since, cursor, fresh = self.last_timestamp, None, {}
+            # How the walk ended: "reached" `since` or the start of the feed, hit the page "cap",
+            # "paused" for the call deadline, or "stuck" on a cursor that did not move back
+            outcome = "cap"
+
+            try:
+                for _ in range(COMMENTARY_MAX_PAGES_PER_SYNC):
+                    budget = remaining()
+                    if cursor is not None and budget is not None and budget < COMMENTARY_PAGE_RESERVE:
+                        outcome = "paused"
+                        break
+                    try:
+                        if cursor is None:
+                            # Newest page is shared for one sync interval, so workers fetch it once
+                            page = await shared_fetch(
+                                "commentary", self.match_id, COMMENTARY_SYNC_INTERVAL,
+                                lambda: api.get_match_commentary_detailed(self.match_id),
+                            )
+                        else:
+                            page = await api.get_match_commentary_detailed(self.match_id, timestamp=cursor)
+                    except DataIsEmpty:
+                        outcome = "reached"
+                        break
+                    self.pages_fetched += 1
+
+                    if cursor is None:
+                        # The newest page carries the current match header / miniscore
+                        self.match_header = page.get("matchHeader", self.match_header)
+                        self.miniscore = page.get("miniscore", self.miniscore)
+
+                    oldest_on_page: Optional[int] = None
+                    for entry in page.get("commentaryList") or []:
+                        key = _entry_key(entry)
+                        if key is None:
+                            continue
+                        oldest_on_page = key[1] if oldest_on_page is None else min(oldest_on_page, key[1])
+                        if since is None or key[1] > since:
+                            fresh[key] = entry
+
+                    # Stop once this page reaches back to entries we already hold
+                    if oldest_on_page is None or (since is not None and oldest_on_page <= since):
+                        outcome = "reached"
+                        break
+                    if cursor is not None and oldest_on_page >= cursor:
+                        outcome = "stuck"  # Cursor did not move back; avoid looping on the same page
+                        break
+                    cursor = oldest_on_page
+            except BaseException:
+                # Deadline or cancellation mid-walk: keep the pages fetched so far for the next sync
+                if cursor is not None:
+                    self._backfill = (since, cursor, fresh)
+                raise
+
+            if outcome == "paused" or (outcome == "cap" and since is not None):
+                # Appending now would leave a hole between `since` and the cursor
+                self._backfill = (since, cursor, fresh)
+                self.last_synced = None if outcome == "paused" else time.monotonic()
+                logger.warning(
+                    f"Commentary sync for match {self.match_id} stopped ({outcome}) before reaching held "
+                    f"entries; backfill continues next sync ({len(fresh)} entries pending)"
+                )
+                return 0
+
+            self.last_synced = time.monotonic()
+            self._backfill = None
+            if resumed:
+                self.last_synced = None  # catch up with entries newer than the backfill straight away
+            if outcome != "reached":
+                # The entries between `since` (or the start of the feed) and the cursor are out of reach
+                self.history_complete = False
+                logger.warning(
+                    f"Commentary for match {self.match_id} has a gap: the walk-back stopped ({outcome}) "
+                    f"before {'the first entry' if since is None else 'the entries already held'}"
+                )
+            if not fresh:
+                return 0
+
+            for key in sorted(fresh, key=lambda k: k[1]):
+                self.log.append(fresh[key])
+            self.last_timestamp = self.log.timestamp[-1]
+            self.version += 1
+            logger.debug(
+                f"Commentary sync for match {self.match_id}: +{len(fresh)} entries "
+                f"(total {len(self.log)}, pages fetched {self.pages_fetched})"
+            )
+            return len(fresh)
+
+    def current_innings(self) -> Optional[int]:
+        """Innings ID of the most recent entry."""
+        for innings in reversed(self.log.innings):
+            if innings != NO_INNINGS:
+                return innings
+        return None
+
+    def last_overs(self, overs: int, innings_id: Optional[int] = None) -> List[dict]:
+        """
+        Get commentary for the last N overs of an innings, newest first.
+
+        Args:
+            overs: Number of overs to return
+            innings_id: Innings to read (defaults to the current innings)
+
+        Returns:
+            List[dict]: Commentary entries, latest ball first
+        """
+        if innings_id is None:
+            innings_id = self.current_innings()
+        rows = np.flatnonzero(self.log.column("innings") == (NO_INNINGS if innings_id is None else innings_id))
+        over = self.log.column("over")[rows]
+
+        deliveries = over != NOT_A_BALL
+        if deliveries.any():
+            cutoff = over[deliveries].max() - overs + 1
+            first_row = rows[deliveries & (over >= cutoff)].min()
+            rows = rows[rows >= first_row]
+        return self.log.entries(rows[::-1])
+
+    def stats(self) -> Dict[str, Any]:
+        """Summary of what the store holds."""
+        return {
+            "matchId": self.match_id,
+            "entries": len(self.log),
+            "bytes": self.log.nbytes(),
+            "lastTimestamp": self.last_timestamp,
+            "pagesFetched": self.pages_fetched,
+            "version": self.version,
+            "complete": self.complete,
+        }
+
+
+_stores: "OrderedDict[int, CommentaryStore]" = OrderedDict()
+_pinned: Set[int] = set()  # matches with live subscribers, never evicted
+
+
+def get_commentary_store(match_id: int) -> CommentaryStore:
+    """Get (or create) the commentary store for a match, evicting the least recently used unpinned store."""
+    store = _stores.get(match_id)
+    if store is None:
+        store = CommentaryStore(match_id)
+        _stores[match_id] = store
+        excess = len(_stores) - COMMENTARY_MAX_MATCHES
+        for evicted_id in list(islice((m for m in _stores if m not in _pinned and m != match_id), max(0, excess))):
+            del _stores[evicted_id]
+            logger.info(f"Evicted commentary store for match {evicted_id}")
+    else:
+        _stores.move_to_end(match_id)
+    return store
+
+
+def pin(match_id: int) -> None:
+    """Keep a match's store through LRU and memory-budget eviction (while it has live subscribers)."""
+    _pinned.add(match_id)
+
+
+def unpin(match_id: int) -> None:
+    _pinned.discard(match_id)
+
+
+def stores_nbytes() -> int:
+    """Approximate memory held by all commentary logs."""
+    return sum(store.log.nbytes() for store in list(_stores.values()))
+
+
+def shrink_stores(fraction: float) -> int:
+    """Drop the least recently used fraction of commentary stores; returns how many."""
+    return evict_lru(_stores, fraction, keep=_pinned)
@@ -2,6 +2,9 @@
 Configuration constants for Cricket Chat MCP Server.
 """
 
+import os
+import tempfile
+
 # Server configuration
 SERVER_NAME = "cric_chat"
 SERVER_VERSION = "1.0.0"
@@ -75,8 +78,190 @@ TOOL_NAMES = [
     "get-player-batting",
     "get-player-news",
     "get-trending-players",
+    "get-rankings",
+    "get-records",
+    "get-record-filters",
+    "get-match-commentary",
+    "get-match-scorecard",
+    "get-match-analytics",
+    "get-qualification-scenarios",
+    "get-fixtures",
+    "get-team-players",
+    "get-player-teams",
+    "get-venue-stats",
+    "get-series-stats",
+    "search-news",
+    "get-news-detail",
 ]
 
+# Commentary store configuration
+COMMENTARY_SYNC_INTERVAL = 15        # seconds between upstream syncs for a match
+COMMENTARY_MAX_PAGES_PER_SYNC = 50   # cap on tms pages walked back in one sync
+COMMENTARY_PAGE_RESERVE = 3.0        # seconds of call deadline left when a walk-back pauses until the next sync
+COMMENTARY_MAX_MATCHES = 32          # matches kept in memory (LRU)
+
+# Scorecard snapshot store configuration
+SCORECARD_SYNC_INTERVAL = 15         # seconds between upstream syncs for a match
+SCORECARD_MAX_VERSIONS = 20          # snapshots kept per match for "changes since" diffs
+SCORECARD_MAX_MATCHES = 32           # matches kept in memory (LRU)
+SCORECARD_VOLATILE_KEYS = ("appIndex", "responseLastUpdated")  # ignored when diffing
+
+# Live stream configuration
+LIVE_STREAM_PATH = "/live/{match_id:int}"
+LIVE_POLL_INTERVAL = 10              # seconds between upstream polls per subscribed match
+LIVE_QUEUE_SIZE = 16                 # frames buffered per subscriber before drop-to-latest
+LIVE_HEARTBEAT_INTERVAL = 15         # seconds between keep-alive comments
+LIVE_MAX_SUBSCRIBERS = 10000         # subscribers across all matches per process
+LIVE_COMMENTARY_BATCH = 30           # max commentary entries per published frame
+
+# Innings analytics configuration
+ANALYTICS_CACHE_SIZE = 256           # cached analytics results (per match, innings and version)
+ANALYTICS_FORMAT_OVERS = {"T20": 20, "ODI": 50}
+ANALYTICS_PHASES = {                 # (name, first over index, end over index)
+    "T20": [("powerplay", 0, 6), ("middle", 6, 15), ("death", 15, 20)],
+    "ODI": [("powerplay", 0, 10), ("middle", 10, 40), ("death", 40, 50)],
+}
+
+# Qualification simulator configuration
+QUALIFICATION_POINTS_PER_WIN = 2
+QUALIFICATION_ENUMERATION_LIMIT = 2 ** 16   # enumerate every outcome up to this many scenarios
+QUALIFICATION_SAMPLES = 20000        # Monte-Carlo scenarios beyond the enumeration limit
+QUALIFICATION_NRR_MARGIN = 1.0       # typical NRR swing of a single result
+QUALIFICATION_INPUT_TTL = 120        # seconds to reuse a fetched points table / fixture list
+QUALIFICATION_CACHE_SIZE = 64
+
+# Fixture calendar configuration
+FIXTURES_REFRESH_INTERVAL = 900      # seconds between schedule refreshes
+FIXTURES_HORIZON_DAYS = 30           # how far ahead schedule pages are walked
+FIXTURES_RETENTION_DAYS = 2          # keep fixtures this long after they start
+FIXTURES_MAX_PAGES = 10              # schedule pages per category per refresh
+FIXTURES_TIMEZONE = "Asia/Kolkata"   # timezone for date-range queries (IST audience)
+
+# Team index configuration
+TEAMS_LIST_REFRESH_INTERVAL = 86400  # seconds between refreshes of the team lists
+TEAMS_ROSTER_TTL = 21600             # seconds a fetched team roster is reused
+TEAMS_SERIES_TTL = 3600              # seconds a fetched series' squads are reused
+TEAMS_MAX_SERIES = 64                # series squads kept in memory (LRU)
+
+# Venue stats configuration
+VENUES_STATS_TTL = 21600             # seconds before a venue's records are recomputed on next access
+VENUES_MAX_VENUES = 128              # venues kept in memory (LRU)
+VENUES_RECENT_RESULTS = 10           # recent results returned per venue
+
+# Series stats engine configuration
+SERIES_STATS_TTL = 1800              # seconds a series' leaderboards are reused before refetching
+SERIES_STATS_MAX_SERIES = 32         # series kept in memory (LRU)
+SERIES_STATS_FETCH_CONCURRENCY = 4   # stats types fetched in parallel during a refresh
+SERIES_STATS_MIN_BALLS = 60          # default minimum balls faced for derived strike rate
+SERIES_STATS_MIN_OVERS = 10          # default minimum overs bowled for derived economy
+
+# Player response cache configuration
+PLAYER_CACHE_TTL = 3600              # seconds a player profile / batting / bowling response is reused
+PLAYER_CACHE_SIZE = 4096             # cached player responses
+
+# Pre-match warm-up configuration
+WARMUP_LEAD_TIME = 2700              # seconds before start that a match's squads are warmed
+WARMUP_SCAN_INTERVAL = 120           # seconds between scans of the fixture calendar
+WARMUP_PLAYER_CONCURRENCY = 4        # player lookups in flight per warm-up (also capped by the low lane)
+
+# Image proxy configuration
+IMAGE_ROUTE_PATH = "/images/{image_id}"
+IMAGE_CACHE_DIR = os.path.join(tempfile.gettempdir(), "cric_chat_images")
+IMAGE_CACHE_MAX_BYTES = 512 * 1024 * 1024   # disk budget for cached image files (LRU)
+IMAGE_SIZES = ("de", "det", "gthumb", "thumb")
+IMAGE_QUALITIES = ("high", "low")
+IMAGE_PREGENERATE_SIZES = ("thumb", "gthumb")  # variants fetched once alongside the first request
+IMAGE_MAX_AGE = 31536000             # Cache-Control max-age for served images (immutable per ID)
+IMAGE_EVICT_GRACE = 60               # seconds a just-served image file is safe from eviction
+IMAGE_SHARED_RESCAN_BYTES = IMAGE_CACHE_MAX_BYTES // 20  # bytes downloaded between directory budget checks (multi-worker)
+IMAGE_ISSUED_MAX = 50000             # image IDs remembered from tool results (eligible for pre-generation)
+IMAGE_TEMP_MAX_AGE = 3600            # seconds before an abandoned partial download is removed
+
+# News store configuration
+NEWS_REFRESH_INTERVAL = 300          # seconds between pulls of the index, category and topic feeds
+NEWS_LISTS_REFRESH_INTERVAL = 21600  # seconds between refreshes of the category and topic lists
+NEWS_MAX_TOPIC_FEEDS = 10            # trending topics whose feeds are pulled each refresh
+NEWS_MAX_STORIES = 2000              # stories retained (oldest dropped first)
+NEWS_PLAYER_TTL = 600                # seconds a player's news feed is reused
+NEWS_DETAIL_CACHE_TTL = 21600        # seconds a story's full text is reused
+NEWS_DETAIL_CACHE_SIZE = 1024        # story details held in memory
+RANKINGS_CACHE_TTL = 3600            # seconds an ICC rankings table is reused
+RECORD_FILTERS_CACHE_TTL = 86400     # seconds the record filters are reused
+TRENDING_CACHE_TTL = 600             # seconds the trending players list is reused
+NEWS_DETAIL_PREFETCH_INDEX = 15      # top index stories whose details are prefetched
+NEWS_DETAIL_PREFETCH_PER_TOPIC = 3   # top stories of each trending-topic feed prefetched
+NEWS_DETAIL_PREFETCH_QUOTA = 30      # max detail calls per refresh cycle
+NEWS_DETAIL_PREFETCH_CONCURRENCY = 2
+
+# Tool call deadlines
+TOOL_DEADLINE = 25.0        # seconds of budget per tool call, shared by all its upstream requests
+TOOL_DEADLINE_GRACE = 0.5   # extra seconds to assemble partial results before the call is cancelled
+
+# Admission control (per tool, see admission.py)
+ADMISSION_INITIAL_LIMIT = 16       # concurrent calls per tool before the limit adapts
+ADMISSION_MIN_LIMIT = 2
+ADMISSION_MAX_LIMIT = 128
+ADMISSION_QUEUE_SIZE = 32          # calls that may wait for a slot; beyond this they are shed
+ADMISSION_QUEUE_TIMEOUT = 2.0      # seconds a call may wait for a slot
+ADMISSION_LATENCY_TARGET = 5.0     # calls slower than this shrink the limit
+ADMISSION_DECREASE_FACTOR = 0.8    # multiplicative decrease
+ADMISSION_DECREASE_COOLDOWN = 1.0  # seconds between decreases
+
+# Per-client fair queuing and usage (see clients.py)
+CLIENT_WEIGHTS: dict = {}        # client ID -> fair-queuing weight (default 1.0), e.g. {"origin:https://chatgpt.com": 2.0}
+CLIENT_UPSTREAM_BUDGET = 2000    # upstream requests per client per window
+CLIENT_BUDGET_WINDOW = 3600      # seconds
+CLIENT_BUDGET_SYNC_INTERVAL = 1.0  # seconds between budget count exchanges with other workers
+
+# Debug endpoints
+DEBUG_TOKEN = os.getenv("DEBUG_TOKEN")   # required by /debug/profile (disabled when unset)
+PROFILE_MAX_SECONDS = 60
+PROFILE_SAMPLE_INTERVAL = 0.005          # seconds between stack samples (cpu mode)
+PROFILE_HEARTBEAT_INTERVAL = 0.01        # seconds between loop heartbeats (blocking mode)
+PROFILE_BLOCKING_THRESHOLD = 0.1         # default seconds a callback may hold the loop
+
+# Event-loop monitor (see loop_monitor.py)
+LOOP_MONITOR_INTERVAL = 0.05    # seconds between lag heartbeats
+LOOP_BLOCK_THRESHOLD = 0.1      # callbacks holding the loop longer than this are captured
+LOOP_BLOCK_HISTORY = 50         # blocking episodes kept for /health and /metrics
+LOOP_LAG_WINDOW = 1200          # recent lag samples behind the p50/p99 (one minute at 50 ms)
+
+# Memory accounting (see memory.py)
+MEMORY_BUDGET = int(os.getenv("MEMORY_BUDGET_MB", "512")) * 2**20              # process RSS limit
+MEMORY_CACHE_BUDGET = int(os.getenv("MEMORY_CACHE_BUDGET_MB", "256")) * 2**20  # tracked caches limit
+MEMORY_CHECK_INTERVAL = 30       # seconds between budget checks
+MEMORY_SHRINK_FRACTION = 0.25    # share of a cache's entries evicted per shrink
+MEMORY_RSS_MIN_CACHE_SHARE = 0.1 # RSS pressure shrinks caches only while they hold at least this share of RSS
+MEMORY_SAMPLE_SIZE = 32          # entries deep-sized per cache size estimate
+MEMORY_TRACEMALLOC_FRAMES = 1    # frames kept per allocation once tracemalloc is started
+
+# Worker pools for CPU-heavy transforms (see executors.py, benchmarks/offload.py)
+# kind -> (mode 'thread' | 'process', workers, max queued jobs, run inline below this many nodes)
+EXECUTOR_POOLS = {
+    "diff": (os.getenv("EXECUTOR_DIFF_MODE", "thread"), 2, 32, 5000),        # scorecard JSON diffs
+    "records": (os.getenv("EXECUTOR_RECORDS_MODE", "thread"), 2, 32, 5000),  # venue / series aggregation, qualification simulations
+}
+EXECUTOR_PROCESS_START = "spawn"   # process pools start clean rather than forking a threaded server
+
+# Multi-worker mode (see shared_cache.py, leader.py)
+# uvicorn reads WEB_CONCURRENCY as its default --workers; with more than one
+# worker, workers share a SQLite response cache and elect one leader to run
+# the background pollers. SHARED_STATE_DIR forces this on for a single worker.
+WORKERS = int(os.getenv("WEB_CONCURRENCY", "1"))
+SHARED_STATE_DIR = os.getenv("SHARED_STATE_DIR") or (
+    os.path.join(tempfile.gettempdir(), "cric_chat_shared") if WORKERS > 1 else None
+)
+SHARED_CACHE_LEASE = 10.0           # seconds a worker may hold a fetch lease before others take over
+SHARED_CACHE_POLL_INTERVAL = 0.05   # seconds between checks while another worker fetches the same key
+SHARED_CACHE_PURGE_EVERY = 500      # writes between purges of expired entries
+LEADER_RETRY_INTERVAL = 5.0         # seconds between election attempts by non-leaders (failover time)
+
+# Warm restarts (see warm_restart.py)
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH") or os.path.join(tempfile.gettempdir(), "cric_chat_snapshot.json.gz")
+SNAPSHOT_MAX_AGE = 6 * 3600         # seconds after which a snapshot is ignored on startup
+SHUTDOWN_DRAIN_TIMEOUT = 10.0       # seconds shutdown waits for in-flight tool calls
+DRAIN_RETRY_AFTER = 2.0             # retry hint for tool calls refused while draining
+
 # CORS settings
 CORS_ALLOW_ORIGINS = ["*"]
 CORS_ALLOW_METHODS = ["*"]
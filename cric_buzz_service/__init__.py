@@ -6,6 +6,9 @@ Categories:
 - Matches: Live, recent, and upcoming matches
 - Series: Series details, points tables, squads, venues
 - Players: Player information and statistics
+- Teams: Team lists and rosters
+- Venues: Venue details and matches played at a ground
+- Schedules: Upcoming fixtures by category
 - Media: Images and media content
 
 Example:
@@ -26,6 +29,9 @@ Example:
 from .matches_api import MatchesAPI, MatchType
 from .series_api import SeriesAPI
 from .players_api import PlayersAPI
+from .schedules_api import SchedulesAPI, ScheduleType
+from .teams_api import TeamsAPI, TeamType
+from .venues_api import VenuesAPI
 # from .media_api import MediaAPI, ImageResolution, ImageType  # Not available yet
 
 # Base client and exceptions
@@ -34,7 +40,9 @@ from .base_client import (
     DataIsEmpty,
     APINotSubscribed,
     RateLimitExceeded,
-    CricBuzzAPIError
+    CricBuzzAPIError,
+    ImageTooLarge,
+    DeadlineExceeded
 )
 
 __version__ = "2.0.0"
@@ -44,10 +52,15 @@ __all__ = [
     "MatchesAPI",
     "SeriesAPI",
     "PlayersAPI",
+    "SchedulesAPI",
+    "TeamsAPI",
+    "VenuesAPI",
     # "MediaAPI",  # Not available yet
     
     # Enums
     "MatchType",
+    "ScheduleType",
+    "TeamType",
     # "ImageResolution",  # Not available yet
     # "ImageType",  # Not available yet
     
@@ -56,6 +69,8 @@ __all__ = [
     "APINotSubscribed",
     "RateLimitExceeded",
     "CricBuzzAPIError",
+    "ImageTooLarge",
+    "DeadlineExceeded",
     
     # Base
     "BaseCricBuzzClient",
@@ -10,6 +10,9 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+from .upstream import SchedulingTransport, scheduler, DeadlineExceeded  # noqa: E402,F401 - reads env at import
+from .tracing import instrument_methods, span  # noqa: E402
+
 
 # Custom Exceptions
 class DataIsEmpty(Exception):
@@ -38,9 +41,19 @@ class CricBuzzAPIError(Exception):
         super().__init__(self.message)
 
 
+class ImageTooLarge(CricBuzzAPIError):
+    """Raised when an upstream image exceeds the configured maximum size"""
+    pass
+
+
 class BaseCricBuzzClient:
     """Base client for making authenticated requests to CricBuzz API"""
     
+    def __init_subclass__(cls, **kwargs):
+        """Record every public API method of a subclass as a tracing span"""
+        super().__init_subclass__(**kwargs)
+        instrument_methods(cls)
+    
     def __init__(self, base_url: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
         """
         Initialize base client
@@ -64,11 +77,14 @@ class BaseCricBuzzClient:
                 "X-RapidAPI-Key": api_key,
                 "X-RapidAPI-Host": api_host
             }
-            self._client = httpx.AsyncClient(
-                base_url=self._base_url,
-                headers=headers,
-                timeout=httpx.Timeout(10.0, connect=5.0)
-            )
+            with span("client.init"):
+                self._client = httpx.AsyncClient(
+                    base_url=self._base_url,
+                    headers=headers,
+                    timeout=httpx.Timeout(10.0, connect=5.0),
+                    # Shares the process-wide priority lanes (see upstream.py)
+                    transport=SchedulingTransport(scheduler, httpx.AsyncHTTPTransport())
+                )
             self._owns_client = True
         else:
             self._client = client
@@ -76,7 +92,21 @@ class BaseCricBuzzClient:
     
     def _handle_response(self, response: httpx.Response, operation: str = "request") -> dict:
         """
-        Handle API response and raise appropriate exceptions
+        Handle API response and raise appropriate exceptions (traced as a 'decode' span)
+        
+        Args:
+            response: HTTP response object
+            operation: Description of the operation for error messages
+            
+        Returns:
+            dict: Parsed JSON response
+        """
+        with span("decode", operation=operation, status=response.status_code, bytes=len(response.content)):
+            return self._parse_response(response, operation)
+    
+    def _parse_response(self, response: httpx.Response, operation: str = "request") -> dict:
+        """
+        Parse API response and raise appropriate exceptions
         
         Args:
             response: HTTP response object
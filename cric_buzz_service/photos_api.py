@@ -1,8 +1,25 @@
 """
 Photos API - Handles all photo-related endpoints
 """
-from typing import Optional
-from .base_client import BaseCricBuzzClient
+import asyncio
+import hashlib
+import os
+from contextlib import aclosing
+from typing import AsyncIterator, Optional
+from .base_client import (
+    BaseCricBuzzClient,
+    APINotSubscribed,
+    RateLimitExceeded,
+    CricBuzzAPIError,
+    DataIsEmpty,
+    ImageTooLarge,
+)
+
+# Upper bound on a single image body, and on image downloads in flight per process,
+# so memory stays flat however many images are being proxied
+IMAGE_MAX_BYTES = int(os.getenv('IMAGE_MAX_BYTES', str(5 * 1024 * 1024)))
+IMAGE_DOWNLOAD_CONCURRENCY = int(os.getenv('IMAGE_DOWNLOAD_CONCURRENCY', '8'))
+_download_slots = asyncio.Semaphore(IMAGE_DOWNLOAD_CONCURRENCY)
 
 
 class PhotosAPI(BaseCricBuzzClient):
@@ -51,6 +68,76 @@ class PhotosAPI(BaseCricBuzzClient):
         response = await self._client.get(f'/photos/v1/detail/{photo_id}')
         return self._handle_response(response, f"get_photo_detail_{photo_id}")
     
+    async def stream_image(
+        self,
+        image_id: str,
+        size: Optional[str] = None,
+        quality: Optional[str] = None,
+        max_bytes: int = IMAGE_MAX_BYTES,
+        chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream an image as chunks, without reading the whole body into memory
+        
+        Holds one of the process-wide download slots while streaming, so at most
+        IMAGE_DOWNLOAD_CONCURRENCY images are in flight and each holds at most
+        one chunk. Close the iterator (e.g. with contextlib.aclosing) if you stop
+        consuming early.
+        
+        Args:
+            image_id: ID of the image (with 'c' prefix, e.g., 'c231889')
+            size: Image size - one of: 'de', 'det', 'gthumb', 'thumb' (optional)
+            quality: Image quality - 'high' or 'low' (optional)
+            max_bytes: Abort once the body exceeds this many bytes
+            chunk_size: Size of the yielded chunks
+            
+        Yields:
+            bytes: Consecutive chunks of the JPEG body
+            
+        Raises:
+            DataIsEmpty: When the image does not exist or is empty
+            ImageTooLarge: When the image exceeds max_bytes
+            APINotSubscribed: When API key is not subscribed
+            RateLimitExceeded: When rate limit is exceeded
+            CricBuzzAPIError: For other errors
+            
+        Example:
+            >>> async with PhotosAPI() as api:
+            >>>     async with aclosing(api.stream_image('c231889', size='thumb')) as chunks:
+            >>>         async for chunk in chunks:
+            >>>             await send(chunk)
+        """
+        params = {}
+        if size:
+            params['p'] = size
+        if quality:
+            params['d'] = quality
+        
+        async with _download_slots:
+            async with self._client.stream('GET', f'/img/v1/i1/{image_id}/i.jpg', params=params or None) as response:
+                if response.status_code == 403:
+                    raise APINotSubscribed()
+                if response.status_code == 429:
+                    raise RateLimitExceeded()
+                if response.status_code in (204, 404):
+                    raise DataIsEmpty(f'No image available for {image_id}')
+                if response.status_code >= 400:
+                    raise CricBuzzAPIError(f"HTTP {response.status_code}: Error downloading image {image_id}")
+                
+                declared = response.headers.get('content-length')
+                if declared is not None and declared.isdigit() and int(declared) > max_bytes:
+                    raise ImageTooLarge(f'Image {image_id} is {declared} bytes (limit {max_bytes})')
+                
+                received = 0
+                async for chunk in response.aiter_bytes(chunk_size):
+                    received += len(chunk)
+                    if received > max_bytes:
+                        raise ImageTooLarge(f'Image {image_id} exceeds {max_bytes} bytes')
+                    yield chunk
+                
+                if not received:
+                    raise DataIsEmpty(f'No image available for {image_id}')
+    
     async def get_image(
         self, 
         image_id: str, 
@@ -61,6 +148,7 @@ class PhotosAPI(BaseCricBuzzClient):
         Get image with specified size and quality
         
         Note: This endpoint returns raw image bytes (JPEG), not JSON data.
+        Prefer stream_image or download_image when proxying or storing images.
         
         Args:
             image_id: ID of the image (with 'c' prefix, e.g., 'c231889')
@@ -71,6 +159,8 @@ class PhotosAPI(BaseCricBuzzClient):
             bytes: Raw image data (JPEG format)
             
         Raises:
+            DataIsEmpty: When the image does not exist or is empty
+            ImageTooLarge: When the image exceeds IMAGE_MAX_BYTES
             APINotSubscribed: When API key is not subscribed
             RateLimitExceeded: When rate limit is exceeded
             CricBuzzAPIError: For other errors
@@ -86,31 +176,48 @@ class PhotosAPI(BaseCricBuzzClient):
             >>>     # Get thumbnail with high quality
             >>>     thumb = await api.get_image('c231889', size='thumb', quality='high')
         """
-        # Build query parameters
-        params = {}
-        if size:
-            params['p'] = size
-        if quality:
-            params['d'] = quality
-        
-        # Build URL with query string
-        url = f'/img/v1/i1/{image_id}/i.jpg'
-        if params:
-            query_string = '&'.join([f'{k}={v}' for k, v in params.items()])
-            url = f'{url}?{query_string}'
-        
-        response = await self._client.get(url)
-        
-        # Check for API errors in headers or status code
-        if response.status_code == 403:
-            from .base_client import APINotSubscribed
-            raise APINotSubscribed()
-        elif response.status_code == 429:
-            from .base_client import RateLimitExceeded
-            raise RateLimitExceeded()
-        elif response.status_code >= 400:
-            from .base_client import CricBuzzAPIError
-            raise CricBuzzAPIError(f"HTTP {response.status_code}: {response.text}")
+        chunks = []
+        async with aclosing(self.stream_image(image_id, size=size, quality=quality)) as stream:
+            async for chunk in stream:
+                chunks.append(chunk)
+        return b''.join(chunks)
+    
+    async def download_image(
+        self,
+        image_id: str,
+        file,
+        size: Optional[str] = None,
+        quality: Optional[str] = None,
+        max_bytes: int = IMAGE_MAX_BYTES
+    ) -> str:
+        """
+        Stream an image straight into a file, without holding it in memory
         
-        # Return raw image bytes
-        return response.content
+        Args:
+            image_id: ID of the image (with 'c' prefix, e.g., 'c231889')
+            file: Binary file object opened for writing
+            size: Image size - one of: 'de', 'det', 'gthumb', 'thumb' (optional)
+            quality: Image quality - 'high' or 'low' (optional)
+            max_bytes: Abort once the body exceeds this many bytes
+            
+        Returns:
+            str: SHA-1 hex digest of the written bytes (usable as an ETag)
+            
+        Raises:
+            DataIsEmpty: When the image does not exist or is empty
+            ImageTooLarge: When the image exceeds max_bytes
+            APINotSubscribed: When API key is not subscribed
+            RateLimitExceeded: When rate limit is exceeded
+            CricBuzzAPIError: For other errors
+            
+        Example:
+            >>> async with PhotosAPI() as api:
+            >>>     with open('thumb.jpg', 'wb') as f:
+            >>>         digest = await api.download_image('c231889', f, size='thumb')
+        """
+        digest = hashlib.sha1()
+        async with aclosing(self.stream_image(image_id, size=size, quality=quality, max_bytes=max_bytes)) as stream:
+            async for chunk in stream:
+                digest.update(chunk)
+                file.write(chunk)
+        return digest.hexdigest()
@@ -0,0 +1,55 @@
+"""
+Schedules API - Handles all schedule/fixture-related endpoints
+"""
+from typing import Optional
+from enum import Enum
+from .base_client import BaseCricBuzzClient
+
+
+class ScheduleType(Enum):
+    """Types of schedules that can be queried"""
+    INTERNATIONAL = "international"
+    LEAGUE = "league"
+    DOMESTIC = "domestic"
+    WOMEN = "women"
+
+
+class SchedulesAPI(BaseCricBuzzClient):
+    """API client for schedule-related operations"""
+
+    async def get_schedules(
+        self,
+        schedule_type: ScheduleType = ScheduleType.INTERNATIONAL,
+        last_time: Optional[int] = None
+    ) -> dict:
+        """
+        Get upcoming match schedules grouped by day
+
+        Args:
+            schedule_type: Type of schedule to retrieve (default: international)
+            last_time: Optional pagination cursor - the 'longDate' of the last
+                day on the previous page (epoch milliseconds)
+
+        Returns:
+            dict: Schedule data with keys:
+                - matchScheduleMap: List of days, each with a scheduleAdWrapper
+                  holding the date, longDate and matchScheduleList (series with
+                  their matchInfo entries)
+                - appIndex: App index information
+
+        Raises:
+            DataIsEmpty: When API returns empty data
+            APINotSubscribed: When API key is not subscribed
+            RateLimitExceeded: When rate limit is exceeded
+            CricBuzzAPIError: For other errors
+
+        Example:
+            >>> async with SchedulesAPI() as api:
+            >>>     schedule = await api.get_schedules(ScheduleType.INTERNATIONAL)
+            >>>
+            >>>     # Next page
+            >>>     schedule = await api.get_schedules(ScheduleType.INTERNATIONAL, last_time=1729296000000)
+        """
+        params = {'lastTime': last_time} if last_time is not None else None
+        response = await self._client.get(f'/schedule/v1/{schedule_type.value}', params=params)
+        return self._handle_response(response, f"get_{schedule_type.value}_schedules")
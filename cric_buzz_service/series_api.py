@@ -111,7 +111,7 @@ class SeriesAPI(BaseCricBuzzClient):
         response = await self._client.get(f'/series/v1/{series_id}/venues')
         return self._handle_response(response, f"get_series_venues_{series_id}")
     
-    async def get_series_stats(self, series_id: int) -> dict:
+    async def get_series_stats_filters(self, series_id: int) -> dict:
         """
         Get statistics filters for a series
         
@@ -120,7 +120,8 @@ class SeriesAPI(BaseCricBuzzClient):
             
         Returns:
             dict: Stats filters with keys:
-                - types: Available stat types
+                - types: Available stat types (header rows carry only a
+                  category; the others carry the 'value' to pass as statsType)
                 - appIndex: App index information
             
         Raises:
@@ -199,28 +200,35 @@ class SeriesAPI(BaseCricBuzzClient):
         response = await self._client.get(f'/series/v1/{series_id}')
         return self._handle_response(response, f"get_series_matches_{series_id}")
     
-    async def get_series_stats(self, statsType: str, series_id: str):
+    async def get_series_stats(self, series_id: int, stats_type: str) -> dict:
         """
-        Retrieve statistics for a specific cricket series.
-
+        Get a statistics leaderboard for a series
+        
         Args:
-            statsType (str): The type of statistics to retrieve. This should be the value 
-                from the 'value' field returned in the /series/get-stats-filter endpoint.
-                Examples include 'mostRuns', 'mostWickets', etc.
-            series_id (str): The unique identifier for the series. This should be the value 
-                of the 'id' field returned in /series/list or /series/list-archives endpoints.
-
+            series_id: ID of the series
+            stats_type: The type of statistics to retrieve - the 'value' field of
+                a type returned by get_series_stats_filters (e.g., 'mostRuns',
+                'mostWickets')
+            
         Returns:
-            dict: The response containing series statistics data.
-
+            dict: Leaderboards per format, with keys such as:
+                - t20StatsList / odiStatsList / testStatsList: Each holding
+                  'headers' (column names) and 'values' (rows whose first value
+                  is the player ID)
+                - appIndex: App index information
+            
         Raises:
-            Exception: If the API request fails or returns an error response.
-
+            DataIsEmpty: When API returns empty data
+            APINotSubscribed: When API key is not subscribed
+            RateLimitExceeded: When rate limit is exceeded
+            CricBuzzAPIError: For other errors
+            
         Example:
-            >>> stats = await get_series_stats('mostRuns', '3718')
+            >>> async with SeriesAPI() as api:
+            >>>     stats = await api.get_series_stats(3718, 'mostRuns')
         """
-        response = await self._client.get(f'/series/v1/{series_id}')
-        return self._handle_response(response, f"get_series_stats_{series_id}")
-
-
-        
+        response = await self._client.get(
+            f'/stats/v1/series/{series_id}',
+            params={'statsType': stats_type}
+        )
+        return self._handle_response(response, f"get_series_stats_{series_id}_{stats_type}")
@@ -0,0 +1,121 @@
+"""
+Teams API - Handles all team-related endpoints
+"""
+from enum import Enum
+from .base_client import BaseCricBuzzClient
+
+
+class TeamType(Enum):
+    """Types of team lists that can be queried"""
+    INTERNATIONAL = "international"
+    LEAGUE = "league"
+    DOMESTIC = "domestic"
+    WOMEN = "women"
+
+
+class TeamsAPI(BaseCricBuzzClient):
+    """API client for team-related operations"""
+
+    async def get_teams(self, team_type: TeamType = TeamType.INTERNATIONAL) -> dict:
+        """
+        Get list of teams by type
+
+        Args:
+            team_type: Type of teams to retrieve (default: international)
+
+        Returns:
+            dict: Teams data with keys:
+                - list: List of teams (teamId, teamName, teamSName, imageId,
+                  plus header rows without a teamId)
+                - appIndex: App index information
+
+        Raises:
+            DataIsEmpty: When API returns empty data
+            APINotSubscribed: When API key is not subscribed
+            RateLimitExceeded: When rate limit is exceeded
+            CricBuzzAPIError: For other errors
+
+        Example:
+            >>> async with TeamsAPI() as api:
+            >>>     teams = await api.get_teams(TeamType.INTERNATIONAL)
+        """
+        response = await self._client.get(f'/teams/v1/{team_type.value}')
+        return self._handle_response(response, f"get_{team_type.value}_teams")
+
+    async def get_team_players(self, team_id: int) -> dict:
+        """
+        Get players of a team
+
+        Args:
+            team_id: ID of the team
+
+        Returns:
+            dict: Players data with keys:
+                - player: List of players (id, name, imageId, battingStyle,
+                  bowlingStyle, plus role header rows without an id)
+
+        Raises:
+            DataIsEmpty: When API returns empty data
+            APINotSubscribed: When API key is not subscribed
+            RateLimitExceeded: When rate limit is exceeded
+            CricBuzzAPIError: For other errors
+
+        Example:
+            >>> async with TeamsAPI() as api:
+            >>>     players = await api.get_team_players(2)  # India
+        """
+        response = await self._client.get(f'/teams/v1/{team_id}/players')
+        return self._handle_response(response, f"get_team_players_{team_id}")
+
+    async def get_team_schedules(self, team_id: int) -> dict:
+        """
+        Get upcoming matches of a team
+
+        Args:
+            team_id: ID of the team
+
+        Returns:
+            dict: Team schedule grouped by series
+
+        Raises:
+            DataIsEmpty: When API returns empty data
+            CricBuzzAPIError: For other errors
+        """
+        response = await self._client.get(f'/teams/v1/{team_id}/schedule')
+        return self._handle_response(response, f"get_team_schedules_{team_id}")
+
+    async def get_team_results(self, team_id: int) -> dict:
+        """
+        Get recent results of a team
+
+        Args:
+            team_id: ID of the team
+
+        Returns:
+            dict: Team results grouped by series
+
+        Raises:
+            DataIsEmpty: When API returns empty data
+            CricBuzzAPIError: For other errors
+        """
+        response = await self._client.get(f'/teams/v1/{team_id}/results')
+        return self._handle_response(response, f"get_team_results_{team_id}")
+
+    async def get_team_news(self, team_id: int) -> dict:
+        """
+        Get news stories about a team
+
+        Args:
+            team_id: ID of the team
+
+        Returns:
+            dict: News stories with keys:
+                - storyList: List of news articles
+                - appIndex: App index information
+
+        Raises:
+            DataIsEmpty: When API returns empty data
+            CricBuzzAPIError: For other errors
+        """
+        response = await self._client.get(f'/news/v1/team/{team_id}')
+        return self._handle_response(response, f"get_team_news_{team_id}")
@@ -0,0 +1,277 @@
+"""
+Lightweight tracing - timed spans from a tool call down to the upstream socket
+
+A trace is started with `trace()` (the MCP server opens one per tool call)
+and nested `span()`s record where its time went: admission, validation,
+each `*API` method, queueing for an upstream slot, connect/TLS, waiting
+for upstream headers and body, JSON decode and result serialization.
+Transport-level phases come from httpcore's `trace` request extension.
+
+Spans outside a trace are no-ops, so background work costs nothing.
+Finished traces go to an in-memory ring buffer (TRACE_BUFFER_SIZE, default
+500) and, when TRACE_JSONL_PATH is set, are appended to that file as one
+JSON object per line by a writer thread, so the event loop never blocks on
+disk (if the writer falls TRACE_JSONL_QUEUE traces behind, new ones are
+dropped from the file). Result serialization is measured on a
+TRACE_SERIALIZE_SAMPLE share of tool calls (default 0.05), since measuring
+means serializing the result an extra time. Set TRACING_ENABLED=0 to turn
+tracing off.
+"""
+import functools
+import inspect
+import itertools
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+TRACING_ENABLED = os.getenv('TRACING_ENABLED', '1') not in ('0', 'false', 'no')
+TRACE_BUFFER_SIZE = int(os.getenv('TRACE_BUFFER_SIZE', '500'))
+TRACE_JSONL_PATH = os.getenv('TRACE_JSONL_PATH') or None
+TRACE_JSONL_QUEUE = int(os.getenv('TRACE_JSONL_QUEUE', '1000'))
+TRACE_SERIALIZE_SAMPLE = float(os.getenv('TRACE_SERIALIZE_SAMPLE', '0.05'))
+
+_ids = itertools.count(1)
+
+
+class Span:
+    """One timed operation within a trace"""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "start", "end", "attributes")
+
+    def __init__(self, trace: "Trace", name: str, parent_id: Optional[int], attributes: Dict[str, Any]):
+        self.trace = trace
+        self.span_id = next(_ids)
+        self.parent_id = parent_id
+        self.name = name
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.attributes = attributes
+
+    def set(self, **attributes: Any) -> None:
+        """Add attributes to the span"""
+        self.attributes.update(attributes)
+
+    def finish(self) -> None:
+        if self.end is None:
+            self.end = time.perf_counter()
+
+    @property
+    def duration(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def to_dict(self) -> dict:
+        return {
+            "spanId": self.span_id,
+            "parentId": self.parent_id,
+            "name": self.name,
+            "startMs": round((self.start - self.trace.root.start) * 1000, 3),
+            "durationMs": round(self.duration * 1000, 3),
+            "attributes": self.attributes,
+        }
+
+
+class Trace:
+    """Spans of one root operation (a tool call)"""
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.trace_id = f"{next(_ids):x}-{int(time.time() * 1000):x}"
+        self.started_at = time.time()
+        self.spans: List[Span] = []
+        self.root = Span(self, name, None, attributes)
+        self.spans.append(self.root)
+
+    def to_dict(self) -> dict:
+        return {
+            "traceId": self.trace_id,
+            "name": self.root.name,
+            "startedAt": self.started_at,
+            "durationMs": round(self.root.duration * 1000, 3),
+            "attributes": self.root.attributes,
+            "spans": [s.to_dict() for s in sorted(self.spans, key=lambda s: s.start)],
+        }
+
+
+class _NoopSpan:
+    """Stand-in returned when there is no trace to record into"""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+# Innermost open span of the current task; inherited by tasks it spawns
+current_span: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+
+
+class TraceExporter:
+    """Ring buffer of finished traces, optionally mirrored to a JSONL file"""
+
+    def __init__(self, size: int, jsonl_path: Optional[str] = None, queue_size: int = TRACE_JSONL_QUEUE):
+        self.traces: Deque[Trace] = deque(maxlen=size)
+        self.jsonl_path = jsonl_path
+        self.dropped = 0
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+
+    def export(self, trace_: Trace) -> None:
+        self.traces.append(trace_)
+        if self.jsonl_path:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="trace-jsonl", daemon=True)
+                self._writer.start()
+            try:
+                self._queue.put_nowait(trace_.to_dict())
+            except queue.Full:
+                self.dropped += 1
+
+    def _write_loop(self) -> None:
+        """Writer thread: append queued traces, flushing whenever the queue runs dry"""
+        while True:
+            record = self._queue.get()
+            try:
+                with open(self.jsonl_path, "a", encoding="utf-8") as file:
+                    while record is not None:
+                        file.write(json.dumps(record, default=str) + "\n")
+                        try:
+                            record = self._queue.get_nowait()
+                        except queue.Empty:
+                            record = None
+            except OSError as exc:
+                logger.warning(f"Could not write trace to {self.jsonl_path}: {exc}")
+
+    def shrink(self, fraction: float) -> int:
+        """Drop the oldest fraction of buffered traces; returns how many"""
+        count = min(len(self.traces), max(1, int(len(self.traces) * fraction))) if self.traces else 0
+        for _ in range(count):
+            self.traces.popleft()
+        return count
+
+    def slowest(self, limit: int = 20, name: Optional[str] = None) -> List[dict]:
+        """Recent traces, slowest first, optionally only those whose root has this name or tool"""
+        traces = [
+            t for t in self.traces
+            if name is None or name in (t.root.name, t.root.attributes.get("tool"))
+        ]
+        traces.sort(key=lambda t: t.root.duration, reverse=True)
+        return [t.to_dict() for t in traces[:limit]]
+
+
+exporter = TraceExporter(TRACE_BUFFER_SIZE, TRACE_JSONL_PATH)
+
+
+@contextmanager
+def trace(name: str, **attributes: Any):
+    """
+    Record a new trace for the enclosed work and export it when done
+
+    Example:
+        >>> with trace("tool_call", tool="get-player-info") as root:
+        >>>     ...
+    """
+    if not TRACING_ENABLED:
+        yield _NOOP
+        return
+    trace_ = Trace(name, attributes)
+    token = current_span.set(trace_.root)
+    try:
+        yield trace_.root
+    except BaseException as exc:
+        trace_.root.set(error=type(exc).__name__)
+        raise
+    finally:
+        current_span.reset(token)
+        trace_.root.finish()
+        exporter.export(trace_)
+
+
+@contextmanager
+def span(name: str, **attributes: Any):
+    """
+    Time the enclosed work as a child of the current span (no-op outside a trace)
+
+    Example:
+        >>> with span("decode", operation="get_player_info"):
+        >>>     data = response.json()
+    """
+    parent = current_span.get()
+    if parent is None:
+        yield _NOOP
+        return
+    child = Span(parent.trace, name, parent.span_id, attributes)
+    parent.trace.spans.append(child)
+    token = current_span.set(child)
+    try:
+        yield child
+    except BaseException as exc:
+        child.set(error=type(exc).__name__)
+        raise
+    finally:
+        current_span.reset(token)
+        child.finish()
+
+
+def sample_serialization() -> bool:
+    """Whether this call should measure its result serialization (a TRACE_SERIALIZE_SAMPLE share)"""
+    return TRACING_ENABLED and random.random() < TRACE_SERIALIZE_SAMPLE
+
+
+def traced(name: str):
+    """Decorator recording each call of a coroutine function as a span"""
+    def decorate(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with span(name):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def instrument_methods(cls) -> None:
+    """Wrap the public coroutine methods defined on cls in spans named '<Class>.<method>'"""
+    for attr, func in list(vars(cls).items()):
+        if not attr.startswith("_") and inspect.iscoroutinefunction(func):
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(func))
+
+
+class TransportTrace:
+    """
+    httpcore `trace` extension callback turning connection events into spans
+
+    httpcore reports `<phase>.started` / `.complete` / `.failed` events for
+    connect_tcp (DNS and TCP), start_tls, send_request_headers,
+    receive_response_headers, receive_response_body and so on.
+    """
+
+    def __init__(self, parent: Span):
+        self._parent = parent
+        self._open: Dict[str, Span] = {}
+
+    async def __call__(self, event_name: str, info: dict) -> None:
+        phase, _, stage = event_name.rpartition(".")
+        if stage == "started":
+            child = Span(self._parent.trace, phase.split(".", 1)[-1], self._parent.span_id, {})
+            self._parent.trace.spans.append(child)
+            self._open[phase] = child
+        elif stage in ("complete", "failed"):
+            child = self._open.pop(phase, None)
+            if child is not None:
+                if stage == "failed":
+                    child.set(error=type(info.get("exception")).__name__)
+                child.finish()
+
+
+def transport_trace() -> Optional[TransportTrace]:
+    """Trace callback for the current span, or None outside a trace"""
+    parent = current_span.get()
+    return None if parent is None else TransportTrace(parent)
@@ -0,0 +1,383 @@
+"""
+Upstream request scheduling - priority lanes for calls to the Cricbuzz API
+
+Every client that builds its own httpx.AsyncClient sends requests through a
+SchedulingTransport backed by one process-wide UpstreamScheduler. User-facing
+requests run in the high-priority lane; background work (cache warming,
+prefetching) marks itself low priority with `low_priority()` and only uses a
+small share of the upstream concurrency, yielding to queued user requests.
+
+Within a lane, waiting requests are served by weighted fair queuing across
+clients (`current_client`), so one busy caller cannot starve the others,
+and upstream requests are counted per client.
+
+A tool call also sets a `deadline()` for its work. The transport honours it
+while queueing for a slot and while waiting on upstream, and fan-out calls
+made with `gather_partial()` cancel what is still running when the budget
+runs out, so the tool can answer with what it has.
+"""
+import asyncio
+import heapq
+import itertools
+import os
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+import httpx
+
+from .tracing import span, transport_trace
+
+
+class Priority(IntEnum):
+    """Upstream lanes, lower value is served first"""
+    HIGH = 0
+    LOW = 1
+
+
+# Lane of the current task; inherited by tasks it spawns
+current_priority: ContextVar[Priority] = ContextVar("upstream_priority", default=Priority.HIGH)
+
+# Caller the current task works for (API key, origin or MCP client); background work is "internal"
+current_client: ContextVar[str] = ContextVar("upstream_client", default="internal")
+
+
+@contextmanager
+def low_priority():
+    """
+    Run the enclosed upstream calls in the low-priority lane
+
+    Example:
+        >>> with low_priority():
+        >>>     async with PlayersAPI() as api:
+        >>>         await api.get_player_info("1413")
+    """
+    token = current_priority.set(Priority.LOW)
+    try:
+        yield
+    finally:
+        current_priority.reset(token)
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when the current call's time budget ran out before an upstream request could finish"""
+    pass
+
+
+class Deadline:
+    """
+    Time budget of one call, shared by every task it spawns
+
+    Tracks whether any work was cut short, so the caller can label its result
+    as partial.
+    """
+
+    def __init__(self, budget: float, expires_at: Optional[float] = None):
+        loop = asyncio.get_running_loop()
+        self.budget = budget
+        self.started = loop.time()
+        self.expires_at = self.started + budget if expires_at is None else expires_at
+        self.partial = False
+        self.cancelled = 0
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - asyncio.get_running_loop().time())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timing(self) -> dict:
+        elapsed = asyncio.get_running_loop().time() - self.started
+        return {
+            "budgetMs": round(self.budget * 1000),
+            "elapsedMs": round(elapsed * 1000),
+            "remainingMs": round(self.remaining() * 1000),
+            "partial": self.partial,
+            "cancelledCalls": self.cancelled,
+        }
+
+
+# Deadline of the current call; inherited by tasks it spawns
+current_deadline: ContextVar[Optional[Deadline]] = ContextVar("upstream_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float):
+    """
+    Run the enclosed work under a time budget
+
+    A nested deadline never extends an outer one.
+
+    Example:
+        >>> with deadline(20.0) as budget:
+        >>>     async with PlayersAPI() as api:
+        >>>         await api.get_player_info("1413")
+        >>>     print(budget.timing())
+    """
+    outer = current_deadline.get()
+    budget = Deadline(seconds)
+    if outer is not None and outer.expires_at < budget.expires_at:
+        budget.expires_at = outer.expires_at
+    token = current_deadline.set(budget)
+    try:
+        yield budget
+    finally:
+        current_deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current budget, or None when there is no deadline"""
+    budget = current_deadline.get()
+    return None if budget is None else budget.remaining()
+
+
+async def gather_partial(*aws: Awaitable[Any], reserve: float = 0.0) -> List[Any]:
+    """
+    Like asyncio.gather(..., return_exceptions=True), but bounded by the current deadline
+
+    Awaitables still running `reserve` seconds before the deadline are
+    cancelled and reported as DeadlineExceeded instances, and the deadline is
+    marked partial. Without a deadline this waits for everything.
+    """
+    budget = current_deadline.get()
+    if budget is None:
+        return await asyncio.gather(*aws, return_exceptions=True)
+
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    if not tasks:
+        return []
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=max(0.0, budget.remaining() - reserve))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.wait(pending)
+        budget.partial = True
+        budget.cancelled += len(pending)
+
+    results = []
+    for task in tasks:
+        if task in pending:
+            results.append(DeadlineExceeded("Cancelled at the call deadline"))
+        elif task.cancelled():
+            results.append(asyncio.CancelledError())
+        else:
+            results.append(task.exception() or task.result())
+    return results
+
+
+class FairQueue:
+    """
+    Waiting items ordered by weighted fair queuing across clients
+
+    Each item gets a virtual finish time, `max(now, client's last finish) +
+    1 / weight`, and the earliest finish is served first. A client with many
+    queued items therefore alternates with the others rather than going
+    ahead of them, and a client with weight 2 gets twice the share.
+    """
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None, default_weight: float = 1.0):
+        self.weights = weights if weights is not None else {}
+        self.default_weight = default_weight
+        self._heap: List[Tuple[float, int, str, Any]] = []
+        self._finish: Dict[str, float] = {}
+        self._virtual = 0.0
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, client: str, item: Any) -> None:
+        start = max(self._virtual, self._finish.get(client, 0.0))
+        finish = start + 1.0 / self.weights.get(client, self.default_weight)
+        self._finish[client] = finish
+        heapq.heappush(self._heap, (finish, next(self._seq), client, item))
+
+    def peek(self) -> Any:
+        return self._heap[0][3]
+
+    def pop(self) -> Any:
+        finish, _, _, item = heapq.heappop(self._heap)
+        self._virtual = finish
+        if len(self._finish) > 2 * len(self._heap) + 64:
+            # Clients with nothing queued past the virtual clock start afresh anyway
+            self._finish = {c: f for c, f in self._finish.items() if f > self._virtual}
+        return item
+
+    def remove(self, item: Any) -> None:
+        for index, entry in enumerate(self._heap):
+            if entry[3] is item:
+                self._heap[index] = self._heap[-1]
+                self._heap.pop()
+                heapq.heapify(self._heap)
+                return
+        raise ValueError("item not queued")
+
+    def clients(self) -> Counter:
+        """Queued items per client"""
+        return Counter(entry[2] for entry in self._heap)
+
+
+class UpstreamScheduler:
+    """
+    Concurrency limiter with two priority lanes
+
+    At most `max_concurrency` requests are in flight. Low-priority requests
+    may hold at most `low_slots` of those and only start when no
+    high-priority request is waiting. Waiters in a lane are served fairly
+    across clients (see FairQueue); `weights` gives some clients a larger
+    share.
+    """
+
+    def __init__(self, max_concurrency: int, low_slots: int, weights: Optional[Dict[str, float]] = None):
+        self.max_concurrency = max_concurrency
+        self.low_slots = low_slots
+        self.active = [0, 0]
+        self.weights: Dict[str, float] = weights if weights is not None else {}
+        self._waiters: Tuple[FairQueue, FairQueue] = (FairQueue(self.weights), FairQueue(self.weights))
+        self.requests: Counter = Counter()  # upstream requests started, per client
+
+    def _can_start(self, priority: Priority) -> bool:
+        if sum(self.active) >= self.max_concurrency:
+            return False
+        if priority == Priority.LOW:
+            return not self._waiters[Priority.HIGH] and self.active[Priority.LOW] < self.low_slots
+        return True
+
+    async def acquire(self, priority: Priority) -> None:
+        """Wait for a slot in the given lane, queued fairly among the current client's peers"""
+        client = current_client.get()
+        if not self._waiters[priority] and self._can_start(priority):
+            self.active[priority] += 1
+            self.requests[client] += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].push(client, future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over just as we were cancelled - pass it on
+                self.release(priority)
+            else:
+                self._waiters[priority].remove(future)
+            raise
+        self.requests[client] += 1
+
+    def release(self, priority: Priority) -> None:
+        """Free a slot and hand it to the next waiter, high-priority lane first"""
+        self.active[priority] -= 1
+        for lane in (Priority.HIGH, Priority.LOW):
+            waiters = self._waiters[lane]
+            while waiters and self._can_start(lane):
+                future = waiters.pop()
+                if not future.done():
+                    self.active[lane] += 1
+                    future.set_result(None)
+
+    def stats(self) -> dict:
+        return {
+            "active": {"high": self.active[Priority.HIGH], "low": self.active[Priority.LOW]},
+            "waiting": {"high": len(self._waiters[Priority.HIGH]), "low": len(self._waiters[Priority.LOW])},
+            "waitingByClient": dict(self._waiters[Priority.HIGH].clients() + self._waiters[Priority.LOW].clients()),
+        }
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body wrapper that frees the scheduler slot once the body is closed"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                yield chunk
+        finally:
+            self._release()
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class SchedulingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that takes a scheduler slot for every request until its body is closed"""
+
+    def __init__(self, scheduler: UpstreamScheduler, transport: httpx.AsyncBaseTransport):
+        self._scheduler = scheduler
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        priority = current_priority.get()
+        budget = current_deadline.get()
+        with span("upstream.queue", lane=priority.name.lower(), client=current_client.get()):
+            if budget is None:
+                await self._scheduler.acquire(priority)
+            else:
+                try:
+                    await asyncio.wait_for(self._scheduler.acquire(priority), budget.remaining())
+                except asyncio.TimeoutError:
+                    budget.partial = True
+                    raise DeadlineExceeded(f"Deadline reached while queued for {request.url.path}") from None
+        released = False
+
+        def release():
+            nonlocal released
+            if not released:
+                released = True
+                self._scheduler.release(priority)
+
+        try:
+            with span("upstream.request", method=request.method, path=request.url.path) as request_span:
+                on_event = transport_trace()
+                if on_event is not None:
+                    request.extensions["trace"] = on_event
+                response = await self._send(request, budget)
+                request_span.set(status=response.status_code)
+        except (asyncio.TimeoutError, httpx.TimeoutException) as exc:
+            release()
+            if budget is None or not budget.expired():
+                raise
+            budget.partial = True
+            raise DeadlineExceeded(f"Deadline reached waiting on {request.url.path}") from exc
+        except BaseException:
+            release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # Body is already in memory, nothing left to read from upstream
+            release()
+        else:
+            response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    async def _send(self, request: httpx.Request, budget: Optional[Deadline]) -> httpx.Response:
+        if budget is None:
+            return await self._transport.handle_async_request(request)
+        # Per-phase httpx timeouts never outlast the budget
+        left = budget.remaining()
+        timeouts = request.extensions.get("timeout") or {}
+        request.extensions["timeout"] = {
+            phase: left if limit is None else min(limit, left)
+            for phase, limit in {**dict.fromkeys(("connect", "read", "write", "pool")), **timeouts}.items()
+        }
+        return await asyncio.wait_for(self._transport.handle_async_request(request), left)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# Process-wide scheduler shared by every client
+scheduler = UpstreamScheduler(
+    max_concurrency=int(os.getenv('UPSTREAM_MAX_CONCURRENCY', '32')),
+    low_slots=int(os.getenv('UPSTREAM_LOW_PRIORITY_SLOTS', '4')),
+)
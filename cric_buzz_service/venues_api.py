@@ -0,0 +1,81 @@
+"""
+Venues API - Handles all venue-related endpoints
+"""
+from .base_client import BaseCricBuzzClient
+
+
+class VenuesAPI(BaseCricBuzzClient):
+    """API client for venue-related operations"""
+
+    async def get_venue_info(self, venue_id: int) -> dict:
+        """
+        Get details of a venue
+
+        Args:
+            venue_id: ID of the venue
+
+        Returns:
+            dict: Venue information with keys:
+                - ground: Name of the ground
+                - city: City of the venue
+                - country: Country of the venue
+                - timezone: Local timezone offset
+                - capacity, ends, homeTeam, established, floodlights
+                - imageId: Venue image ID
+
+        Raises:
+            DataIsEmpty: When API returns empty data
+            APINotSubscribed: When API key is not subscribed
+            RateLimitExceeded: When rate limit is exceeded
+            CricBuzzAPIError: For other errors
+
+        Example:
+            >>> async with VenuesAPI() as api:
+            >>>     venue = await api.get_venue_info(31)  # Wankhede Stadium
+        """
+        response = await self._client.get(f'/venues/v1/{venue_id}')
+        return self._handle_response(response, f"get_venue_info_{venue_id}")
+
+    async def get_venue_matches(self, venue_id: int) -> dict:
+        """
+        Get recent and upcoming matches played at a venue
+
+        Args:
+            venue_id: ID of the venue
+
+        Returns:
+            dict: Matches grouped by series with keys:
+                - matchDetails: List of groups, each with a matchDetailsMap
+                  holding the matches (matchInfo and matchScore)
+                - appIndex: App index information
+
+        Raises:
+            DataIsEmpty: When API returns empty data
+            APINotSubscribed: When API key is not subscribed
+            RateLimitExceeded: When rate limit is exceeded
+            CricBuzzAPIError: For other errors
+
+        Example:
+            >>> async with VenuesAPI() as api:
+            >>>     matches = await api.get_venue_matches(31)
+        """
+        response = await self._client.get(f'/venues/v1/{venue_id}/matches')
+        return self._handle_response(response, f"get_venue_matches_{venue_id}")
+
+    async def get_venue_stats(self, venue_id: int) -> dict:
+        """
+        Get Cricbuzz's headline statistics for a venue
+
+        Args:
+            venue_id: ID of the venue
+
+        Returns:
+            dict: Venue statistics with key:
+                - venueStats: List of stat rows (key/value pairs per format)
+
+        Raises:
+            DataIsEmpty: When API returns empty data
+            CricBuzzAPIError: For other errors
+        """
+        response = await self._client.get(f'/stats/v1/venue/{venue_id}')
+        return self._handle_response(response, f"get_venue_stats_{venue_id}")
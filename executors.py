@@ -0,0 +1,161 @@
+"""
+Worker pools for CPU-heavy transforms in Cricket Chat MCP Server.
+
+Everything runs on one asyncio loop, so a long pure-Python transform (diffing
+two versions of a detailed scorecard, aggregating a venue's match history or
+a series' leaderboards) delays every other request until it finishes.
+`run(kind, fn, *args)` sends such work to a pool chosen by kind
+(EXECUTOR_POOLS):
+
+- `thread` pools keep the work in-process. Python code still holds the GIL,
+  but the interpreter hands it back every few milliseconds, so the loop
+  keeps serving other requests. Arguments are not copied.
+- `process` pools run the work truly in parallel, but arguments and results
+  are pickled across the process boundary on the loop thread. They pay off
+  only when the work is much larger than its input and output (see
+  `benchmarks/offload.py`).
+
+Small inputs run inline: submitting costs more than the work. Size is the
+number of container nodes in the arguments, counted only up to the pool's
+inline threshold. Each pool keeps at most `workers + max_queue` jobs in
+flight. Beyond that, the caller runs the job inline instead of piling up an
+unbounded backlog, so overload degrades to today's behaviour rather than
+to growing latency and memory.
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import time
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from config import EXECUTOR_POOLS, EXECUTOR_PROCESS_START
+from cric_buzz_service.tracing import span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def approx_size(obj: Any, limit: int) -> int:
+    """Number of container nodes reachable from obj, counting no further than limit."""
+    count = 0
+    stack = [obj]
+    while stack and count < limit:
+        item = stack.pop()
+        count += 1
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return count
+
+
+class WorkerPool:
+    """One lazily started thread or process pool with a bounded backlog and an inline fast path."""
+
+    def __init__(self, name: str, mode: str, workers: int, max_queue: int, inline_below: int):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Executor mode for {name} must be 'thread' or 'process', not {mode!r}")
+        self.name = name
+        self.mode = mode
+        self.workers = workers
+        self.max_queue = max_queue
+        self.inline_below = inline_below
+        self._executor: Optional[Executor] = None
+        self.pending = 0
+        self.peak_pending = 0
+        self.inline = 0
+        self.offloaded = 0
+        self.caller_runs = 0
+        self.offload_seconds = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context(EXECUTOR_PROCESS_START)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix=f"{self.name}-worker")
+            logger.info(f"🧵 Started {self.mode} pool '{self.name}' with {self.workers} workers")
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any, size: Optional[int] = None) -> T:
+        """
+        Run fn(*args) in the pool, or inline when the input is small or the backlog is full.
+
+        Args:
+            fn: Function to run; must be a module-level function for process pools
+            size: Input size in container nodes (counted from args when omitted)
+        """
+        if size is None:
+            size = approx_size(args, self.inline_below)
+        if size < self.inline_below:
+            self.inline += 1
+            return fn(*args)
+        if self.pending >= self.workers + self.max_queue:
+            self.caller_runs += 1
+            return fn(*args)
+
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        started = time.perf_counter()
+        try:
+            with span("offload", pool=self.name, mode=self.mode):
+                result = await asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), functools.partial(fn, *args)
+                )
+        except BrokenExecutor as exc:
+            # A crashed worker process breaks the whole pool; start a new one on the next call
+            logger.warning(f"⚠️ Worker pool '{self.name}' broke ({exc}), running inline")
+            self._executor = None
+            self.caller_runs += 1
+            return fn(*args)
+        finally:
+            self.pending -= 1
+        self.offloaded += 1
+        self.offload_seconds += time.perf_counter() - started
+        return result
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "maxQueue": self.max_queue,
+            "inlineBelowNodes": self.inline_below,
+            "started": self._executor is not None,
+            "pending": self.pending,
+            "peakPending": self.peak_pending,
+            "inline": self.inline,
+            "offloaded": self.offloaded,
+            "callerRuns": self.caller_runs,
+            "avgOffloadMs": round(1000 * self.offload_seconds / self.offloaded, 2) if self.offloaded else None,
+        }
+
+
+pools: Dict[str, WorkerPool] = {
+    kind: WorkerPool(kind, mode, workers, max_queue, inline_below)
+    for kind, (mode, workers, max_queue, inline_below) in EXECUTOR_POOLS.items()
+}
+
+
+async def run(kind: str, fn: Callable[..., T], *args: Any, size: Optional[int] = None) -> T:
+    """
+    Run a CPU-heavy transform in the worker pool for its kind.
+
+    Example:
+        >>> patch = await executors.run("diff", json_diff, old, new)
+    """
+    return await pools[kind].run(fn, *args, size=size)
+
+
+def stats() -> Dict[str, dict]:
+    return {kind: pool.stats() for kind, pool in pools.items()}
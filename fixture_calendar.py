@@ -0,0 +1,277 @@
+"""
+Local fixture calendar for Cricket Chat MCP Server.
+
+Pages through the Cricbuzz schedule feeds and keeps every upcoming fixture in
+an in-memory index sorted by start time, with secondary indexes by team,
+series, venue and format. Each index is a sorted list of (start, match ID)
+pairs, so date-range queries are two bisections plus a slice and need no
+upstream fan-out. Refreshes upsert fixtures in place, so a re-timed or newly
+added match only touches its own index entries.
+"""
+
+import asyncio
+import bisect
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from config import (
+    FIXTURES_REFRESH_INTERVAL,
+    FIXTURES_HORIZON_DAYS,
+    FIXTURES_RETENTION_DAYS,
+    FIXTURES_MAX_PAGES,
+    FIXTURES_TIMEZONE,
+)
+from cric_buzz_service.base_client import DataIsEmpty
+from cric_buzz_service.schedules_api import SchedulesAPI, ScheduleType
+from memory import estimate
+
+logger = logging.getLogger(__name__)
+
+TZ = ZoneInfo(FIXTURES_TIMEZONE)
+
+IndexEntry = Tuple[int, int]  # (start time in epoch ms, match ID)
+
+
+def _venue_keys(venue: dict) -> List[str]:
+    """Venue ID and lowercased ground name, so either finds the venue."""
+    keys = []
+    if venue.get("id") is not None:
+        keys.append(str(venue["id"]))
+    if venue.get("ground"):
+        keys.append(venue["ground"].strip().lower())
+    return keys
+
+
+def _fixture(info: dict, series_name: Optional[str], category: str) -> Optional[dict]:
+    """Flatten an upstream matchInfo into a calendar fixture."""
+    if info.get("matchId") is None or not info.get("startDate"):
+        return None
+    team1 = info.get("team1") or {}
+    team2 = info.get("team2") or {}
+    venue = info.get("venueInfo") or {}
+    return {
+        "matchId": int(info["matchId"]),
+        "seriesId": info.get("seriesId"),
+        "seriesName": series_name or info.get("seriesName"),
+        "category": category,
+        "matchDesc": info.get("matchDesc"),
+        "matchFormat": (info.get("matchFormat") or "").upper() or None,
+        "startDate": int(info["startDate"]),
+        "endDate": int(info["endDate"]) if info.get("endDate") else None,
+        "team1": {k: team1.get(k) for k in ("teamId", "teamName", "teamSName")},
+        "team2": {k: team2.get(k) for k in ("teamId", "teamName", "teamSName")},
+        "venue": {k: venue.get(k) for k in ("id", "ground", "city", "country", "timezone")},
+    }
+
+
+class FixtureCalendar:
+    """Upcoming fixtures indexed by start time, team, series, venue and format."""
+
+    def __init__(self):
+        self._fixtures: Dict[int, dict] = {}
+        self._by_time: List[IndexEntry] = []
+        self._by_team: Dict[int, List[IndexEntry]] = {}
+        self._by_series: Dict[int, List[IndexEntry]] = {}
+        self._by_venue: Dict[str, List[IndexEntry]] = {}
+        self._by_format: Dict[str, List[IndexEntry]] = {}
+        self._team_names: Dict[str, int] = {}
+        self._lock = asyncio.Lock()
+        self.last_refreshed: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._fixtures)
+
+    def nbytes(self) -> int:
+        """Estimated memory of the fixtures (index entries share their keys)."""
+        return estimate(self._fixtures.values(), len(self._fixtures))
+
+    # ----- index maintenance -----
+
+    def _keys(self, fixture: dict) -> Iterable[Tuple[Dict[Any, List[IndexEntry]], Any]]:
+        for team in (fixture["team1"], fixture["team2"]):
+            if team.get("teamId") is not None:
+                yield self._by_team, team["teamId"]
+        if fixture["seriesId"] is not None:
+            yield self._by_series, fixture["seriesId"]
+        for venue in _venue_keys(fixture["venue"]):
+            yield self._by_venue, venue
+        if fixture["matchFormat"]:
+            yield self._by_format, fixture["matchFormat"]
+
+    @staticmethod
+    def _discard(entries: List[IndexEntry], entry: IndexEntry) -> None:
+        position = bisect.bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+    def _remove(self, fixture: dict) -> None:
+        entry = (fixture["startDate"], fixture["matchId"])
+        self._discard(self._by_time, entry)
+        for index, key in self._keys(fixture):
+            self._discard(index.get(key, []), entry)
+
+    def upsert(self, fixture: dict) -> bool:
+        """Insert or update a fixture; returns True if the calendar changed."""
+        existing = self._fixtures.get(fixture["matchId"])
+        if existing == fixture:
+            return False
+        if existing is not None:
+            self._remove(existing)
+
+        self._fixtures[fixture["matchId"]] = fixture
+        entry = (fixture["startDate"], fixture["matchId"])
+        bisect.insort(self._by_time, entry)
+        for index, key in self._keys(fixture):
+            bisect.insort(index.setdefault(key, []), entry)
+        for team in (fixture["team1"], fixture["team2"]):
+            if team.get("teamId") is None:
+                continue
+            for name in (team.get("teamName"), team.get("teamSName")):
+                if name:
+                    self._team_names[name.lower()] = team["teamId"]
+        return True
+
+    def prune(self, before_ms: int) -> int:
+        """Drop fixtures that started before the given time."""
+        cut = bisect.bisect_left(self._by_time, (before_ms, -1))
+        stale = [match_id for _, match_id in self._by_time[:cut]]
+        for match_id in stale:
+            self._remove(self._fixtures.pop(match_id))
+        return len(stale)
+
+    # ----- warm restart -----
+
+    def snapshot(self) -> dict:
+        """Fixtures and wall-clock refresh time, for a warm-restart snapshot."""
+        refreshed_at = None
+        if self.last_refreshed is not None:
+            refreshed_at = time.time() - (time.monotonic() - self.last_refreshed)
+        return {"fixtures": list(self._fixtures.values()), "refreshedAt": refreshed_at}
+
+    def restore(self, data: dict) -> int:
+        """Reload a snapshot; the calendar falls due for refresh when it would have without the restart."""
+        for fixture in data.get("fixtures") or []:
+            self.upsert(fixture)
+        self.prune(int(time.time() * 1000) - FIXTURES_RETENTION_DAYS * 86_400_000)
+        if data.get("refreshedAt") is not None:
+            self.last_refreshed = time.monotonic() - max(0.0, time.time() - data["refreshedAt"])
+        return len(self)
+
+    # ----- refresh -----
+
+    def is_stale(self) -> bool:
+        if self.last_refreshed is None:
+            return True
+        return time.monotonic() - self.last_refreshed >= FIXTURES_REFRESH_INTERVAL
+
+    async def refresh(self, api: SchedulesAPI) -> int:
+        """
+        Pull every schedule category up to the configured horizon and upsert the fixtures.
+
+        Returns:
+            int: Number of fixtures added or changed
+        """
+        async with self._lock:
+            now_ms = int(time.time() * 1000)
+            horizon_ms = now_ms + FIXTURES_HORIZON_DAYS * 86_400_000
+            changed = 0
+            for schedule_type in ScheduleType:
+                last_time: Optional[int] = None
+                for _ in range(FIXTURES_MAX_PAGES):
+                    try:
+                        page = await api.get_schedules(schedule_type, last_time=last_time)
+                    except DataIsEmpty:
+                        break
+                    next_time = last_time
+                    for day in page.get("matchScheduleMap") or []:
+                        wrapper = day.get("scheduleAdWrapper")
+                        if not wrapper:
+                            continue
+                        if wrapper.get("longDate"):
+                            next_time = int(wrapper["longDate"])
+                        for series in wrapper.get("matchScheduleList") or []:
+                            for info in series.get("matchInfo") or []:
+                                fixture = _fixture(info, series.get("seriesName"), schedule_type.value)
+                                if fixture is not None and self.upsert(fixture):
+                                    changed += 1
+                    if next_time is None or next_time == last_time or next_time > horizon_ms:
+                        break
+                    last_time = next_time
+
+            pruned = self.prune(now_ms - FIXTURES_RETENTION_DAYS * 86_400_000)
+            self.last_refreshed = time.monotonic()
+            logger.info(f"📅 Fixture calendar refreshed: {changed} changed, {pruned} pruned, {len(self)} held")
+            return changed
+
+    async def refresh_if_stale(self, api: SchedulesAPI) -> int:
+        if not self.is_stale():
+            return 0
+        return await self.refresh(api)
+
+    # ----- queries -----
+
+    def resolve_team(self, team: str) -> Optional[int]:
+        """Team ID from an ID, full name or short name."""
+        team = team.strip()
+        if team.isdigit():
+            return int(team)
+        return self._team_names.get(team.lower())
+
+    def query(
+        self,
+        start_ms: int,
+        end_ms: int,
+        team_id: Optional[int] = None,
+        series_id: Optional[int] = None,
+        venue: Optional[str] = None,
+        match_format: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Fixtures starting in [start_ms, end_ms), ordered by start time.
+
+        The most selective of the given filters picks the index to range-scan;
+        the remaining filters are checked on the (already small) slice.
+        """
+        candidates = [self._by_time]
+        if team_id is not None:
+            candidates.append(self._by_team.get(team_id, []))
+        if series_id is not None:
+            candidates.append(self._by_series.get(series_id, []))
+        if venue is not None:
+            candidates.append(self._by_venue.get(venue.strip().lower(), []))
+        if match_format is not None:
+            candidates.append(self._by_format.get(match_format.upper(), []))
+        entries = min(candidates, key=len)
+
+        low = bisect.bisect_left(entries, (start_ms, -1))
+        high = bisect.bisect_left(entries, (end_ms, -1))
+        result = []
+        for _, match_id in entries[low:high]:
+            fixture = self._fixtures[match_id]
+            if team_id is not None and team_id not in (fixture["team1"]["teamId"], fixture["team2"]["teamId"]):
+                continue
+            if series_id is not None and fixture["seriesId"] != series_id:
+                continue
+            if venue is not None and venue.strip().lower() not in _venue_keys(fixture["venue"]):
+                continue
+            if match_format is not None and fixture["matchFormat"] != match_format.upper():
+                continue
+            result.append(fixture)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+
+def date_range_ms(from_date: Optional[str], to_date: Optional[str], default_days: int = 7) -> Tuple[int, int]:
+    """Epoch-ms bounds for an inclusive YYYY-MM-DD date range in the calendar timezone."""
+    today = datetime.now(TZ).replace(hour=0, minute=0, second=0, microsecond=0)
+    start = datetime.strptime(from_date, "%Y-%m-%d").replace(tzinfo=TZ) if from_date else today
+    end = datetime.strptime(to_date, "%Y-%m-%d").replace(tzinfo=TZ) if to_date else start + timedelta(days=default_days - 1)
+    return int(start.timestamp() * 1000), int((end + timedelta(days=1)).timestamp() * 1000)
+
+
+fixture_calendar = FixtureCalendar()
@@ -0,0 +1,343 @@
+"""
+Disk-backed image cache for Cricket Chat MCP Server.
+
+Cricbuzz images are immutable per image ID, size and quality, so the image
+proxy route keeps every fetched variant as a file in a size-bounded LRU
+directory and serves hits straight from disk (FileResponse, which uses
+zero-copy `pathsend` where the ASGI server supports it). Upstream bytes are
+streamed into a temporary file and renamed into place, so a response is
+never buffered whole in memory. The first fetch of an image also prefetches
+its `thumb` and `gthumb` variants once in the low-priority upstream lane,
+so player grids (trending players, rankings) are served from disk. Only
+images whose IDs this worker handed out in a tool result (`issue`) are
+pre-generated, so requests for arbitrary IDs cannot fan out into extra
+upstream fetches.
+
+File names carry the content hash, `<image>_<size>_<quality>.<sha1>.jpg`,
+so the index and ETags are rebuilt from a directory listing on startup.
+Every hit touches its file, so file times give the LRU order on disk, and a
+file served within IMAGE_EVICT_GRACE is never evicted from under a response.
+
+In multi-worker mode all workers share the directory. A miss goes through
+the shared cache (key -> content hash), so each variant is downloaded by
+one worker and adopted by the others from disk. Because no worker's index
+sees every file, the byte budget is enforced on the directory itself: after
+every IMAGE_SHARED_RESCAN_BYTES downloaded, a worker takes a file lock,
+totals the directory and removes the least recently used files.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from cachetools import LRUCache
+
+from config import (
+    IMAGE_CACHE_DIR,
+    IMAGE_CACHE_MAX_BYTES,
+    IMAGE_SIZES,
+    IMAGE_QUALITIES,
+    IMAGE_PREGENERATE_SIZES,
+    IMAGE_MAX_AGE,
+    IMAGE_EVICT_GRACE,
+    IMAGE_SHARED_RESCAN_BYTES,
+    IMAGE_TEMP_MAX_AGE,
+    IMAGE_ISSUED_MAX,
+)
+from cric_buzz_service.photos_api import PhotosAPI
+from cric_buzz_service.upstream import low_priority
+from shared_cache import shared_cache
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not POSIX
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+IMAGE_ID = re.compile(r"^c?(\d{1,12})$")
+_FILE_NAME = re.compile(r"^(c\d+_[a-z]+_[a-z]+)\.([0-9a-f]{40})\.jpg$")
+
+Key = str  # "<image>_<size>_<quality>"
+
+
+def image_key(image_id: str, size: Optional[str], quality: Optional[str]) -> Key:
+    """Cache key for a normalised image ID ('c123') and variant."""
+    return f"{image_id}_{size or 'orig'}_{quality or 'std'}"
+
+
+def normalise_image_id(image_id: str) -> Optional[str]:
+    """'123' or 'c123' -> 'c123'; None for anything else."""
+    match = IMAGE_ID.match(image_id.strip())
+    return f"c{match.group(1)}" if match else None
+
+
+def image_ids(data: Any) -> Iterator[str]:
+    """Normalised IDs under any '...imageId' key (imageId, faceImageId, ...) of a tool result."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if isinstance(value, (dict, list)):
+                yield from image_ids(value)
+            elif value is not None and key.lower().endswith("imageid"):
+                image_id = normalise_image_id(str(value))
+                if image_id is not None:
+                    yield image_id
+    elif isinstance(data, list):
+        for item in data:
+            yield from image_ids(item)
+
+
+class DiskImageCache:
+    """LRU of image files under a byte budget, with single-flight upstream fetches."""
+
+    def __init__(self, directory: str, max_bytes: int, shared: bool = False):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.shared = shared  # directory shared with other workers
+        self._downloaded_since_scan = 0
+        self._index: "OrderedDict[Key, Tuple[Path, int, str]]" = OrderedDict()  # key -> (path, bytes, sha1)
+        self._bytes = 0
+        self._inflight: Dict[Key, asyncio.Future] = {}
+        self._pregenerated: LRUCache = LRUCache(maxsize=16384)  # image IDs whose variants were fetched
+        self._issued: LRUCache = LRUCache(maxsize=IMAGE_ISSUED_MAX)  # image IDs handed out in tool results
+        self._background: Set[asyncio.Task] = set()
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> None:
+        """Rebuild the index from the cache directory, oldest access first."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for _, key, path, size, digest in self._scan():
+            self._index[key] = (path, size, digest)
+            self._bytes += size
+        self._loaded = True
+        if self.shared:
+            self._forget(self._enforce_directory_budget())
+        else:
+            self._evict()
+        logger.info(f"🖼️ Image cache loaded: {len(self._index)} files, {self._bytes / 1e6:.1f} MB")
+
+    def _scan(self) -> List[Tuple[float, Key, Path, int, str]]:
+        """Cached files as (last used, key, path, bytes, sha1), least recently used first."""
+        found = []
+        stale_temp = time.time() - IMAGE_TEMP_MAX_AGE
+        for entry in os.scandir(self.directory):
+            match = _FILE_NAME.match(entry.name)
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue  # removed by another worker
+            if match is None:
+                # Partial downloads may belong to another worker; only abandoned ones are removed
+                if entry.name.startswith(".tmp-") and stat.st_mtime < stale_temp:
+                    Path(entry.path).unlink(missing_ok=True)
+                continue
+            found.append((max(stat.st_atime, stat.st_mtime), match.group(1), Path(entry.path), stat.st_size, match.group(2)))
+        return sorted(found)
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._index:
+            _, (path, size, _) = self._index.popitem(last=False)
+            self._bytes -= size
+            path.unlink(missing_ok=True)
+
+    def _enforce_directory_budget(self) -> List[Key]:
+        """
+        Remove least recently used files until the shared directory fits the budget (runs in a thread).
+
+        Files used within IMAGE_EVICT_GRACE are kept, as a worker may be serving them.
+        Returns the evicted keys.
+        """
+        with open(self.directory / ".lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            found = self._scan()
+            total = sum(size for _, _, _, size, _ in found)
+            grace = time.time() - IMAGE_EVICT_GRACE
+            evicted = []
+            for used, key, path, size, _ in found:
+                if total <= self.max_bytes or used >= grace:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                evicted.append(key)
+        if evicted:
+            logger.info(f"🖼️ Evicted {len(evicted)} images, shared cache now {total / 1e6:.1f} MB")
+        return evicted
+
+    def _forget(self, keys: List[Key]) -> None:
+        """Drop index entries whose files were removed."""
+        for key in keys:
+            entry = self._index.get(key)
+            if entry is not None and not entry[0].exists():
+                del self._index[key]
+                self._bytes -= entry[1]
+
+    def _add(self, key: Key, path: Path, file_size: int, digest: str) -> None:
+        previous = self._index.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous[1]
+            if previous[0] != path:
+                previous[0].unlink(missing_ok=True)
+        self._index[key] = (path, file_size, digest)
+        self._bytes += file_size
+
+    def lookup(self, key: Key) -> Optional[Tuple[Path, str]]:
+        """(path, ETag) of a cached variant, marking it recently used (in the index and on disk)."""
+        if not self._loaded:
+            self._load()
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        try:
+            os.utime(entry[0])
+        except FileNotFoundError:
+            # Removed behind our back (by another worker or by hand)
+            del self._index[key]
+            self._bytes -= entry[1]
+            return None
+        self._index.move_to_end(key)
+        return entry[0], f'"{entry[2]}"'
+
+    async def _download(self, image_id: str, size: Optional[str], quality: Optional[str]) -> Tuple[Path, str]:
+        key = image_key(image_id, size, quality)
+        fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                async with PhotosAPI() as api:
+                    digest = await api.download_image(image_id, file, size=size, quality=quality)
+            path = self.directory / f"{key}.{digest}.jpg"
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        file_size = path.stat().st_size
+        self._add(key, path, file_size, digest)
+        if not self.shared:
+            self._evict()
+            return path, f'"{digest}"'
+
+        self._downloaded_since_scan += file_size
+        if self._downloaded_since_scan >= IMAGE_SHARED_RESCAN_BYTES:
+            self._downloaded_since_scan = 0
+            self._forget(await asyncio.to_thread(self._enforce_directory_budget))
+        return path, f'"{digest}"'
+
+    async def _fetch(self, image_id: str, size: Optional[str], quality: Optional[str]) -> Tuple[Path, str]:
+        """Download a variant, or adopt the file another worker downloaded (multi-worker mode)."""
+        if shared_cache is None or not self.shared:
+            return await self._download(image_id, size, quality)
+
+        key = image_key(image_id, size, quality)
+        downloaded: List[Tuple[Path, str]] = []
+
+        async def download() -> str:
+            downloaded.append(await self._download(image_id, size, quality))
+            return downloaded[0][1].strip('"')
+
+        digest = await shared_cache.get_or_fetch("images", key, IMAGE_MAX_AGE, download)
+        if downloaded:
+            return downloaded[0]
+        path = self.directory / f"{key}.{digest}.jpg"
+        try:
+            os.utime(path)
+            file_size = path.stat().st_size
+        except FileNotFoundError:
+            # Evicted since the other worker downloaded it
+            result = await self._download(image_id, size, quality)
+            await shared_cache.put("images", key, result[1].strip('"'), IMAGE_MAX_AGE)
+            return result
+        self._add(key, path, file_size, digest)
+        return path, f'"{digest}"'
+
+    async def get(self, image_id: str, size: Optional[str] = None, quality: Optional[str] = None) -> Tuple[Path, str]:
+        """
+        Path and ETag of an image variant, fetching it from upstream on a miss.
+
+        Args:
+            image_id: Normalised image ID ('c231889')
+            size: One of IMAGE_SIZES (optional)
+            quality: One of IMAGE_QUALITIES (optional)
+
+        Raises:
+            DataIsEmpty / APINotSubscribed / RateLimitExceeded / CricBuzzAPIError: From the upstream fetch
+        """
+        key = image_key(image_id, size, quality)
+        cached = self.lookup(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._fetch(image_id, size, quality)
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            self._inflight.pop(key, None)
+
+        self._pregenerate(image_id, quality)
+        return result
+
+    def issue(self, ids: Iterable[str]) -> None:
+        """Remember image IDs handed out in a tool result, making them eligible for pre-generation."""
+        for image_id in ids:
+            self._issued[image_id] = True
+
+    def _pregenerate(self, image_id: str, quality: Optional[str]) -> None:
+        """Fetch the grid variants of a handed-out image once, in the background and low-priority lane."""
+        if image_id in self._pregenerated or image_id not in self._issued:
+            return
+        self._pregenerated[image_id] = True
+
+        async def fetch_variants():
+            with low_priority():
+                for size in IMAGE_PREGENERATE_SIZES:
+                    if self.lookup(image_key(image_id, size, quality)) is None:
+                        try:
+                            await self.get(image_id, size, quality)
+                        except Exception as exc:
+                            logger.debug(f"Pre-generating {size} of image {image_id} failed: {exc}")
+
+        task = asyncio.create_task(fetch_variants())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def stats(self) -> dict:
+        return {
+            "files": len(self._index),
+            "bytes": self._bytes,
+            "maxBytes": self.max_bytes,
+            "shared": self.shared,
+            "issuedIds": len(self._issued),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def valid_variant(size: Optional[str], quality: Optional[str]) -> bool:
+    return (size is None or size in IMAGE_SIZES) and (quality is None or quality in IMAGE_QUALITIES)
+
+
+image_cache = DiskImageCache(IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_BYTES, shared=shared_cache is not None)
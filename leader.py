@@ -0,0 +1,88 @@
+"""
+Leader election between workers for Cricket Chat MCP Server.
+
+Background pollers and prefetchers (pre-match warmer, news refresh) must
+run in exactly one worker, or upstream traffic grows with the worker
+count. The worker that holds an exclusive `flock` on
+SHARED_STATE_DIR/leader.lock is the leader. Others retry every
+LEADER_RETRY_INTERVAL. The kernel drops the lock when its process exits,
+even when it crashes, so another worker takes over within one retry
+interval.
+
+In single-worker mode (no SHARED_STATE_DIR) this worker is always the
+leader.
+"""
+
+import asyncio
+import logging
+import os
+from typing import IO, Optional
+
+from config import SHARED_STATE_DIR, LEADER_RETRY_INTERVAL
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not POSIX
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderElection:
+    """Exclusive file lock deciding which worker runs the background pollers."""
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.is_leader = False
+        self._file: Optional[IO] = None
+
+    def try_acquire(self) -> bool:
+        """Take leadership if no other worker holds it (non-blocking)."""
+        if self.is_leader:
+            return True
+        if self.path is None or fcntl is None:
+            self.is_leader = True
+            return True
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        file = open(self.path, "a+")
+        try:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            file.close()
+            return False
+        file.truncate(0)
+        file.write(f"{os.getpid()}\n")
+        file.flush()
+        self._file = file
+        self.is_leader = True
+        logger.info(f"👑 Worker {os.getpid()} elected leader, running background pollers")
+        return True
+
+    async def wait(self) -> None:
+        """Return once this worker is the leader."""
+        while not self.try_acquire():
+            await asyncio.sleep(LEADER_RETRY_INTERVAL)
+
+    def release(self) -> None:
+        """Give up leadership (on shutdown) so another worker takes over without waiting for exit."""
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        self.is_leader = False
+
+    def leader_pid(self) -> Optional[int]:
+        """PID of the current leader, as written to the lock file."""
+        if self.path is None:
+            return os.getpid() if self.is_leader else None
+        try:
+            with open(self.path) as file:
+                return int(file.read().strip() or 0) or None
+        except (OSError, ValueError):
+            return None
+
+    def stats(self) -> dict:
+        return {"pid": os.getpid(), "leader": self.is_leader, "leaderPid": self.leader_pid()}
+
+
+election = LeaderElection(os.path.join(SHARED_STATE_DIR, "leader.lock") if SHARED_STATE_DIR else None)
@@ -0,0 +1,233 @@
+"""
+Live score streaming for Cricket Chat MCP Server.
+
+Fans out scorecard and commentary deltas to Server-Sent Events subscribers.
+One poller per match keeps the shared scorecard and commentary stores fresh
+while anyone is subscribed, and every update is encoded once and offered to
+each subscriber's bounded queue. A subscriber that falls behind has its queue
+replaced by a single full snapshot (drop-to-latest) instead of slowing the
+poller or growing without bound. When a sync brings more commentary than one
+LIVE_COMMENTARY_BATCH, every subscriber gets a snapshot flagged with the
+number of skipped entries before the latest batch, so the gap is visible.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional, Set
+
+from starlette.responses import StreamingResponse
+
+from config import (
+    LIVE_POLL_INTERVAL,
+    LIVE_QUEUE_SIZE,
+    LIVE_HEARTBEAT_INTERVAL,
+    LIVE_MAX_SUBSCRIBERS,
+    LIVE_COMMENTARY_BATCH,
+)
+import commentary_store
+import scorecard_store
+from commentary_store import CommentaryStore, get_commentary_store
+from scorecard_store import ScorecardStore, get_scorecard_store
+from cric_buzz_service.matches_api import MatchesAPI
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT = b": keep-alive\n\n"
+
+
+def encode_event(event: str, data: dict) -> bytes:
+    """Encode a Server-Sent Event frame."""
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode()
+
+
+class TooManySubscribers(Exception):
+    """Raised when the live hub is at its subscriber limit"""
+    pass
+
+
+class Subscriber:
+    """A single SSE client with a bounded queue of encoded frames."""
+
+    def __init__(self, match_id: int):
+        self.match_id = match_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=LIVE_QUEUE_SIZE)
+        self.dropped = 0
+
+    def offer(self, frame: bytes) -> bool:
+        """Queue a frame without waiting; False if the subscriber is full."""
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def reset(self, frame: bytes) -> None:
+        """Drop everything queued and replace it with the latest snapshot."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(frame)
+
+
+class LiveHub:
+    """Tracks subscribers per match and runs one upstream poller per subscribed match."""
+
+    def __init__(self):
+        self._subscribers: Dict[int, Set[Subscriber]] = {}
+        self._pollers: Dict[int, asyncio.Task] = {}
+        self._published_entries: Dict[int, int] = {}
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    def at_capacity(self) -> bool:
+        return self.subscriber_count >= LIVE_MAX_SUBSCRIBERS
+
+    def has_subscribers(self, match_id: int) -> bool:
+        return bool(self._subscribers.get(match_id))
+
+    def subscribe(self, match_id: int) -> Subscriber:
+        """Register a subscriber and start the match poller if needed."""
+        if self.at_capacity():
+            raise TooManySubscribers(f"Live stream is at capacity ({LIVE_MAX_SUBSCRIBERS} subscribers)")
+        subscriber = Subscriber(match_id)
+        self._subscribers.setdefault(match_id, set()).add(subscriber)
+        subscriber.offer(self.snapshot_frame(match_id))
+
+        if match_id not in self._pollers:
+            commentary_store.pin(match_id)
+            scorecard_store.pin(match_id)
+            self._published_entries[match_id] = len(get_commentary_store(match_id))
+            self._pollers[match_id] = asyncio.create_task(self._poll(match_id))
+            logger.info(f"📡 Started live poller for match {match_id}")
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Remove a subscriber and stop the match poller when nobody is left."""
+        match_id = subscriber.match_id
+        subs = self._subscribers.get(match_id)
+        if subs is None:
+            return
+        subs.discard(subscriber)
+        if not subs:
+            del self._subscribers[match_id]
+            self._published_entries.pop(match_id, None)
+            commentary_store.unpin(match_id)
+            scorecard_store.unpin(match_id)
+            poller = self._pollers.pop(match_id, None)
+            if poller is not None:
+                poller.cancel()
+                logger.info(f"📡 Stopped live poller for match {match_id}")
+
+    def snapshot_frame(self, match_id: int, skipped_entries: int = 0) -> bytes:
+        """Full-state frame used on connect, when a subscriber falls behind and when commentary was skipped."""
+        scorecard = get_scorecard_store(match_id)
+        commentary = get_commentary_store(match_id)
+        return encode_event("snapshot", {
+            "matchId": match_id,
+            "version": scorecard.version,
+            "scorecard": scorecard.current,
+            "miniscore": commentary.miniscore,
+            "lastTimestamp": commentary.last_timestamp,
+            "skippedEntries": skipped_entries,
+        })
+
+    def _broadcast(self, match_id: int, frame: bytes) -> None:
+        subs = self._subscribers.get(match_id)
+        if not subs:
+            return
+        snapshot: Optional[bytes] = None
+        for subscriber in subs:
+            if not subscriber.offer(frame):
+                if snapshot is None:
+                    snapshot = self.snapshot_frame(match_id)
+                subscriber.reset(snapshot)
+
+    def publish_scorecard(self, store: ScorecardStore) -> None:
+        """Publish the latest scorecard patch to the match's subscribers."""
+        if not self.has_subscribers(store.match_id):
+            return
+        self._broadcast(store.match_id, encode_event("scorecard", {
+            "matchId": store.match_id,
+            "version": store.version,
+            "patch": store.last_patch,
+        }))
+
+    def publish_commentary(self, store: CommentaryStore) -> None:
+        """Publish commentary entries the match's subscribers have not seen yet."""
+        match_id = store.match_id
+        if not self.has_subscribers(match_id):
+            return
+        previous = self._published_entries.get(match_id, 0)
+        published = max(previous, len(store) - LIVE_COMMENTARY_BATCH)
+        new_entries: List[dict] = store.entries_since(published)
+        self._published_entries[match_id] = len(store)
+        if published > previous:
+            # More than one batch arrived: resync from a snapshot before sending the latest entries
+            self._broadcast(match_id, self.snapshot_frame(match_id, skipped_entries=published - previous))
+        if not new_entries:
+            return
+        self._broadcast(match_id, encode_event("commentary", {
+            "matchId": match_id,
+            "commentaryList": list(reversed(new_entries)),
+            "miniscore": store.miniscore,
+            "lastTimestamp": store.last_timestamp,
+        }))
+
+    async def _poll(self, match_id: int) -> None:
+        """Keep the match's stores fresh while it has subscribers."""
+        delay = LIVE_POLL_INTERVAL
+        async with MatchesAPI() as api:
+            while self.has_subscribers(match_id):
+                # Looked up each time, so the poller always syncs the stores tool calls read
+                scorecard = get_scorecard_store(match_id)
+                commentary = get_commentary_store(match_id)
+                try:
+                    if await scorecard.sync_if_stale(api):
+                        self.publish_scorecard(scorecard)
+                    if await commentary.sync_if_stale(api):
+                        self.publish_commentary(commentary)
+                    delay = LIVE_POLL_INTERVAL
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    delay = min(delay * 2, LIVE_POLL_INTERVAL * 8)
+                    logger.warning(f"Live poll failed for match {match_id}: {exc} (retrying in {delay}s)")
+                await asyncio.sleep(delay)
+
+    async def stream(self, subscriber: Subscriber):
+        """Yield a subscriber's encoded frames, with periodic heartbeats (the caller unsubscribes)."""
+        while True:
+            try:
+                yield await asyncio.wait_for(subscriber.queue.get(), timeout=LIVE_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT
+
+
+class LiveResponse(StreamingResponse):
+    """
+    SSE response for a subscriber reserved before the headers are sent, so a
+    full hub is reported as a 503 rather than an error inside a 200 stream.
+    The subscriber is released however the response ends, even if the client
+    disconnects before the stream starts.
+    """
+
+    def __init__(self, hub: "LiveHub", subscriber: Subscriber):
+        super().__init__(
+            hub.stream(subscriber),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        self._hub = hub
+        self._subscriber = subscriber
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            self._hub.unsubscribe(self._subscriber)
+
+
+live_hub = LiveHub()
@@ -0,0 +1,137 @@
+"""
+Event-loop lag monitor for Cricket Chat MCP Server.
+
+Runs for the lifetime of the app as a background job. Every
+LOOP_MONITOR_INTERVAL the loop is asked to wake a heartbeat, and the delay
+between the requested and the actual wake-up is the scheduling lag: the time
+other callbacks kept the loop busy. Lag samples feed a histogram and a
+recent-window summary, exported on `/metrics` and included in `/health`.
+
+A watchdog thread (the same one `/debug/profile?mode=blocking` uses) watches
+the heartbeat. When it is late by more than LOOP_BLOCK_THRESHOLD, the
+watchdog captures the stack of whatever is holding the loop, such as a
+synchronous bundle read, a stderr flush or a large JSON encode. The episode
+is logged and kept in a short history with its duration and coroutine, so
+these regressions show up in production and in `benchmarks/loop_lag.py`.
+"""
+
+import asyncio
+import bisect
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+from config import (
+    LOOP_MONITOR_INTERVAL,
+    LOOP_BLOCK_THRESHOLD,
+    LOOP_BLOCK_HISTORY,
+    LOOP_LAG_WINDOW,
+)
+from profiler import LoopWatchdog
+
+logger = logging.getLogger(__name__)
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class LoopMonitor:
+    """Measures scheduling lag of the running loop and records callbacks that block it."""
+
+    def __init__(self, interval: float = LOOP_MONITOR_INTERVAL, threshold: float = LOOP_BLOCK_THRESHOLD):
+        self.interval = interval
+        self.threshold = threshold
+        self.bucket_counts = [0] * (len(LAG_BUCKETS) + 1)
+        self.lag_sum = 0.0
+        self.samples = 0
+        self.max_lag = 0.0
+        self._recent: Deque[float] = deque(maxlen=LOOP_LAG_WINDOW)
+        self.blocked: Deque[dict] = deque(maxlen=LOOP_BLOCK_HISTORY)
+        self.blocked_total = 0
+        self._watchdog: Optional[LoopWatchdog] = None
+
+    def observe(self, lag: float) -> None:
+        self.bucket_counts[bisect.bisect_left(LAG_BUCKETS, lag)] += 1
+        self.lag_sum += lag
+        self.samples += 1
+        self.max_lag = max(self.max_lag, lag)
+        self._recent.append(lag)
+
+    def _on_block(self, duration: float, stack: str, coroutine: Optional[str]) -> None:
+        self.blocked_total += 1
+        self.blocked.append({
+            "at": time.time(),
+            "blockedMs": round(duration * 1000, 1),
+            "coroutine": coroutine,
+            "stack": stack,
+        })
+        innermost = " <- ".join(reversed(stack.split(";")[-4:]))
+        logger.warning(f"🐢 Event loop blocked for {duration * 1000:.0f} ms in {coroutine}: {innermost}")
+
+    def start_watchdog(self) -> None:
+        if self._watchdog is None:
+            self._watchdog = LoopWatchdog(threading.get_ident(), self.threshold, min(self.interval, self.threshold) / 2)
+            self._watchdog.on_block = self._on_block
+            self._watchdog.start()
+
+    def stop_watchdog(self) -> None:
+        if self._watchdog is not None:
+            self._watchdog.stopped.set()
+            self._watchdog = None
+
+    async def run(self) -> None:
+        """Background loop: heartbeat every interval, recording lag and feeding the watchdog."""
+        loop = asyncio.get_running_loop()
+        self.start_watchdog()
+        try:
+            while True:
+                expected = loop.time() + self.interval
+                await asyncio.sleep(self.interval)
+                self.observe(max(0.0, loop.time() - expected))
+                self._watchdog.beat()
+        finally:
+            self.stop_watchdog()
+
+    def percentile(self, q: float) -> float:
+        recent = sorted(self._recent)
+        if not recent:
+            return 0.0
+        return recent[min(len(recent) - 1, int(q * len(recent)))]
+
+    def stats(self) -> dict:
+        return {
+            "running": self._watchdog is not None,
+            "intervalMs": self.interval * 1000,
+            "lagMs": {
+                "p50": round(self.percentile(0.5) * 1000, 2),
+                "p99": round(self.percentile(0.99) * 1000, 2),
+                "max": round(self.max_lag * 1000, 2),
+            },
+            "blockThresholdMs": self.threshold * 1000,
+            "blockedTotal": self.blocked_total,
+            "recentBlocks": list(self.blocked),
+        }
+
+    def prometheus(self) -> List[str]:
+        """Lag histogram and blocked-callback counter in Prometheus text format."""
+        lines = [
+            "# HELP event_loop_lag_seconds Delay between a scheduled heartbeat and when it ran",
+            "# TYPE event_loop_lag_seconds histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(LAG_BUCKETS, self.bucket_counts):
+            cumulative += count
+            lines.append(f'event_loop_lag_seconds_bucket{{le="{bound}"}} {cumulative}')
+        lines.append(f'event_loop_lag_seconds_bucket{{le="+Inf"}} {self.samples}')
+        lines.append(f"event_loop_lag_seconds_sum {self.lag_sum:.6f}")
+        lines.append(f"event_loop_lag_seconds_count {self.samples}")
+        lines += [
+            "# HELP event_loop_blocked_total Callbacks that held the event loop longer than the threshold",
+            "# TYPE event_loop_blocked_total counter",
+            f"event_loop_blocked_total {self.blocked_total}",
+        ]
+        return lines
+
+
+loop_monitor = LoopMonitor()
@@ -0,0 +1,224 @@
+"""
+Memory accounting and budget for Cricket Chat MCP Server.
+
+Caches and stores register a size estimator and a shrink callback here
+(`register(name, nbytes, shrink)`, done in server.py next to the background
+jobs). Sizes are estimated by deep-sizing a sample of entries and scaling
+by the entry count, so checking them is cheap enough to run periodically.
+
+A background job enforces two limits every MEMORY_CHECK_INTERVAL:
+- the tracked caches together must stay under MEMORY_CACHE_BUDGET
+- process RSS must stay under MEMORY_BUDGET
+
+While either limit is exceeded, the largest shrinkable caches evict their
+least recently used MEMORY_SHRINK_FRACTION of entries, largest first.
+RSS rarely falls after objects are freed (pymalloc keeps its arenas), and
+may be high for reasons other than the caches, so RSS pressure only shrinks
+caches while they hold at least MEMORY_RSS_MIN_CACHE_SHARE of RSS. The RSS
+limit is skipped where current RSS cannot be read (no /proc).
+
+`/debug/memory` reports every registered size, RSS, and (once tracemalloc is
+started) the top allocation sites and their growth since the previous
+snapshot.
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import sys
+import tracemalloc
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Callable, Container, Dict, Iterable, List, Optional, Tuple
+
+from config import (
+    MEMORY_BUDGET,
+    MEMORY_CACHE_BUDGET,
+    MEMORY_CHECK_INTERVAL,
+    MEMORY_SHRINK_FRACTION,
+    MEMORY_RSS_MIN_CACHE_SHARE,
+    MEMORY_SAMPLE_SIZE,
+    MEMORY_TRACEMALLOC_FRAMES,
+)
+
+logger = logging.getLogger(__name__)
+
+_CONTAINERS = (dict, list, tuple, set, frozenset, deque)
+_ATOMS = (str, bytes, bytearray, int, float, bool, type(None))
+
+
+def deep_sizeof(obj, seen: Optional[set] = None) -> int:
+    """Bytes held by obj and everything it references through containers and instance dicts."""
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, _ATOMS):
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, _CONTAINERS):
+            stack.extend(item)
+        elif not isinstance(item, type):
+            if hasattr(item, "__dict__"):
+                stack.append(vars(item))
+            for slot in getattr(type(item), "__slots__", ()):
+                if hasattr(item, slot):
+                    stack.append(getattr(item, slot))
+    return total
+
+
+def estimate(items: Iterable, count: int, sample: int = MEMORY_SAMPLE_SIZE) -> int:
+    """Estimated bytes of `count` items from the deep size of the first `sample` of them."""
+    if count <= 0:
+        return 0
+    sampled = list(islice(items, sample))
+    if not sampled:
+        return 0
+    seen: set = set()
+    return int(sum(deep_sizeof(item, seen) for item in sampled) / len(sampled) * count)
+
+
+def evict_lru(
+    entries: "OrderedDict", fraction: float, on_evict: Optional[Callable] = None, keep: Container = ()
+) -> int:
+    """Pop the oldest `fraction` of an LRU OrderedDict (at least one entry), skipping keys in `keep`; returns how many."""
+    count = min(len(entries), max(1, int(len(entries) * fraction))) if entries else 0
+    victims = list(islice((key for key in entries if key not in keep), count))
+    for key in victims:
+        value = entries.pop(key)
+        if on_evict is not None:
+            on_evict(key, value)
+    return len(victims)
+
+
+def rss() -> Optional[int]:
+    """Current resident set size of this process in bytes, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class MemoryAccount:
+    """Registry of cache sizes with budget enforcement and tracemalloc snapshots."""
+
+    def __init__(self):
+        self._sizers: Dict[str, Callable[[], int]] = {}
+        self._shrinkers: Dict[str, Callable[[float], int]] = {}
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+        self.shrink_rounds = 0
+        self.evicted = 0
+
+    def register(self, name: str, nbytes: Callable[[], int], shrink: Optional[Callable[[float], int]] = None) -> None:
+        """Track a cache; caches with a shrink callback are evicted from under memory pressure."""
+        self._sizers[name] = nbytes
+        if shrink is not None:
+            self._shrinkers[name] = shrink
+
+    def sizes(self) -> Dict[str, int]:
+        sizes = {}
+        for name, nbytes in self._sizers.items():
+            try:
+                sizes[name] = int(nbytes())
+            except Exception as exc:
+                logger.debug(f"Sizing {name} failed: {exc}")
+                sizes[name] = -1
+        return sizes
+
+    @staticmethod
+    def _over_budget(tracked: int, resident: Optional[int]) -> bool:
+        if tracked > MEMORY_CACHE_BUDGET:
+            return True
+        # Over the RSS limit, shrinking only helps while the caches are a real share of it
+        return resident is not None and resident > MEMORY_BUDGET and tracked >= resident * MEMORY_RSS_MIN_CACHE_SHARE
+
+    def enforce(self) -> int:
+        """Shrink the largest caches while over a budget; returns entries evicted."""
+        sizes = self.sizes()
+        tracked = sum(s for s in sizes.values() if s > 0)
+        resident = rss()
+        if not self._over_budget(tracked, resident):
+            return 0
+
+        self.shrink_rounds += 1
+        evicted = 0
+        for name in sorted(self._shrinkers, key=lambda n: sizes.get(n, 0), reverse=True):
+            if not self._over_budget(tracked, resident):
+                break
+            before = sizes.get(name, 0)
+            evicted += self._shrinkers[name](MEMORY_SHRINK_FRACTION)
+            freed = max(0, before - self._sizers[name]())
+            tracked -= freed
+            if resident is not None:
+                resident -= freed
+        gc.collect()
+        self.evicted += evicted
+        resident = rss()
+        logger.warning(
+            f"🧠 Memory pressure (tracked {sum(sizes.values()) / 2**20:.0f} MB, "
+            f"RSS {'n/a' if resident is None else f'{resident / 2**20:.0f} MB'}): evicted {evicted} cache entries"
+        )
+        return evicted
+
+    async def run(self) -> None:
+        """Background loop: enforce the budgets every check interval."""
+        while True:
+            await asyncio.sleep(MEMORY_CHECK_INTERVAL)
+            try:
+                self.enforce()
+            except Exception as exc:
+                logger.warning(f"⚠️ Memory budget check failed: {exc}")
+
+    @staticmethod
+    def start_tracing() -> bool:
+        """Start tracemalloc if needed; returns whether it was already running."""
+        if tracemalloc.is_tracing():
+            return True
+        tracemalloc.start(MEMORY_TRACEMALLOC_FRAMES)
+        return False
+
+    def snapshot(self, limit: int = 25) -> Dict[str, List[dict]]:
+        """Top allocation sites now, and the sites that grew most since the previous snapshot."""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        top = [
+            {"site": str(stat.traceback[0]), "bytes": stat.size, "blocks": stat.count}
+            for stat in snapshot.statistics("lineno")[:limit]
+        ]
+        growth: List[dict] = []
+        if self._snapshot is not None:
+            growth = [
+                {"site": str(stat.traceback[0]), "growthBytes": stat.size_diff, "bytes": stat.size}
+                for stat in snapshot.compare_to(self._snapshot, "lineno")[:limit]
+                if stat.size_diff > 0
+            ]
+        self._snapshot = snapshot
+        return {"top": top, "growth": growth}
+
+    def report(self) -> dict:
+        sizes = self.sizes()
+        traced: Optional[Tuple[int, int]] = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else None
+        return {
+            "rssBytes": rss(),
+            "budgetBytes": MEMORY_BUDGET,
+            "cacheBudgetBytes": MEMORY_CACHE_BUDGET,
+            "trackedBytes": sum(s for s in sizes.values() if s > 0),
+            "caches": dict(sorted(sizes.items(), key=lambda kv: kv[1], reverse=True)),
+            "shrinkRounds": self.shrink_rounds,
+            "evictedEntries": self.evicted,
+            "tracemalloc": None if traced is None else {"currentBytes": traced[0], "peakBytes": traced[1]},
+        }
+
+
+memory = MemoryAccount()
@@ -0,0 +1,436 @@
+"""
+News ingestion store for Cricket Chat MCP Server.
+
+Periodically pulls the news index plus every category and trending-topic
+feed, and merges them into one store of stories. Stories are deduplicated by
+ID and by a hash of their normalised headline and intro (the same story is
+re-published under new IDs across feeds). An inverted index over headline,
+intro, context and feed tags (topic and category names, player entities)
+answers full-text and entity queries such as "news about the Ashes" locally;
+per-player feeds are kept too, so get-player-news is served from memory.
+
+After each background refresh, the full text of the top index and
+trending-topic stories is prefetched into the news detail cache (bounded per
+cycle, in the low-priority lane), so opening a headline is a cache hit.
+
+In multi-worker mode only the leader worker polls upstream. It publishes
+every feed payload to the shared cache, and the other workers replay those
+payloads into their own stores on the same schedule. search-news reads the
+store as it is and only triggers a refresh (through the same leader/replay
+path) while the store is still empty.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from config import (
+    NEWS_REFRESH_INTERVAL,
+    NEWS_LISTS_REFRESH_INTERVAL,
+    NEWS_MAX_TOPIC_FEEDS,
+    NEWS_MAX_STORIES,
+    NEWS_PLAYER_TTL,
+    NEWS_DETAIL_PREFETCH_INDEX,
+    NEWS_DETAIL_PREFETCH_PER_TOPIC,
+    NEWS_DETAIL_PREFETCH_QUOTA,
+    NEWS_DETAIL_PREFETCH_CONCURRENCY,
+    LEADER_RETRY_INTERVAL,
+)
+from cric_buzz_service.base_client import DataIsEmpty
+from cric_buzz_service.news_api import NewsAPI
+from cric_buzz_service.players_api import PlayersAPI
+from cric_buzz_service.upstream import low_priority
+from response_cache import cached_news_detail, news_detail_cache
+from memory import estimate
+from leader import election
+from shared_cache import MISSING, shared_cache, shared_fetch
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is", "it",
+    "its", "of", "on", "or", "the", "to", "was", "were", "with", "about", "news", "after", "into",
+}
+_INDEXED_FIELDS = ("hline", "intro", "context", "seoHeadline")
+
+
+def tokenize(text: str) -> Set[str]:
+    """Lowercase word tokens without stopwords, with simple plurals folded ('centuries' -> 'century')."""
+    tokens = set()
+    for word in _WORD.findall(text.lower()):
+        if word in _STOPWORDS or len(word) < 2:
+            continue
+        if len(word) > 4 and word.endswith("ies"):
+            word = word[:-3] + "y"
+        elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.add(word)
+    return tokens
+
+
+def content_hash(story: dict) -> str:
+    """Hash of the normalised headline and intro, identical for re-published copies."""
+    text = " ".join(_WORD.findall(f"{story.get('hline', '')} {story.get('intro', '')}".lower()))
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def _stories(payload: dict) -> Iterable[dict]:
+    for item in payload.get("storyList") or []:
+        story = item.get("story")
+        if isinstance(story, dict) and story.get("id") is not None:
+            yield story
+
+
+_FEED_SHARE_TTL = NEWS_REFRESH_INTERVAL * 3
+
+
+class _Publishing:
+    """NewsAPI wrapper for the leader: every feed payload is also written to the shared cache."""
+
+    def __init__(self, api: NewsAPI):
+        self._api = api
+
+    def __getattr__(self, method: str):
+        async def call(*args):
+            payload = await getattr(self._api, method)(*args)
+            await shared_cache.put("news-feed", [method, *args], payload, _FEED_SHARE_TTL)
+            return payload
+        return call
+
+
+class _Replaying:
+    """NewsAPI stand-in for the other workers: serves the leader's latest feed payloads."""
+
+    def __getattr__(self, method: str):
+        async def call(*args):
+            payload = await shared_cache.get("news-feed", [method, *args])
+            if payload is MISSING:
+                raise DataIsEmpty(f"{method}{list(args)} not published by the leader yet")
+            return payload
+        return call
+
+
+def _listing(payload: dict) -> List[dict]:
+    """Rows of a topics/categories response, whatever the list key is called."""
+    for value in payload.values():
+        if isinstance(value, list) and value and isinstance(value[0], dict) and "id" in value[0]:
+            return value
+    return []
+
+
+class NewsStore:
+    """Deduplicated stories with feed membership and an inverted index."""
+
+    def __init__(self):
+        self._stories: Dict[int, dict] = {}
+        self._tags: Dict[int, Set[str]] = {}
+        self._hashes: Dict[str, int] = {}
+        self._aliases: Dict[int, int] = {}          # duplicate story ID -> canonical ID
+        self._postings: Dict[str, Set[int]] = {}
+        self._tokens: Dict[int, Set[str]] = {}
+        self._feeds: Dict[str, Tuple[float, List[int]]] = {}
+        self._topics: List[dict] = []
+        self._categories: List[dict] = []
+        self._lists_refreshed: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self.last_refreshed: Optional[float] = None
+        self.duplicates = 0
+        self.details_prefetched = 0
+
+    def __len__(self) -> int:
+        return len(self._stories)
+
+    # ----- ingestion -----
+
+    def _index(self, story_id: int) -> None:
+        story = self._stories[story_id]
+        text = " ".join(str(story.get(field) or "") for field in _INDEXED_FIELDS)
+        tokens = tokenize(text)
+        for tag in self._tags.get(story_id, ()):
+            if ":" in tag:
+                tokens.add(tag)  # entity key, e.g. 'player:1413'
+            else:
+                tokens.update(tokenize(tag))
+        for token in self._tokens.get(story_id, set()) - tokens:
+            self._postings[token].discard(story_id)
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(story_id)
+        self._tokens[story_id] = tokens
+
+    def _remove(self, story_id: int) -> None:
+        story = self._stories.pop(story_id)
+        for token in self._tokens.pop(story_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(story_id)
+                if not postings:
+                    del self._postings[token]
+        self._tags.pop(story_id, None)
+        if self._hashes.get(content_hash(story)) == story_id:
+            del self._hashes[content_hash(story)]
+
+    def ingest(self, payload: dict, feed: str, tags: Iterable[str] = ()) -> List[int]:
+        """
+        Merge a feed response into the store.
+
+        Args:
+            payload: Upstream response with a storyList
+            feed: Feed key ('index', 'category:5', 'topic:349', 'player:1413')
+            tags: Labels attached to every story of the feed (topic or category
+                names, entity keys such as 'player:1413'); they are indexed too
+
+        Returns:
+            list: Canonical story IDs in feed order
+        """
+        tags = set(tags)
+        ordered = []
+        for story in _stories(payload):
+            story_id = int(story["id"])
+            story_id = self._aliases.get(story_id, story_id)
+            digest = content_hash(story)
+            canonical = self._hashes.get(digest)
+            if canonical is not None and canonical != story_id:
+                self._aliases[story_id] = canonical
+                self.duplicates += 1
+                story_id = canonical
+            elif story_id not in self._stories:
+                self._stories[story_id] = {**story, "id": story_id}
+                self._hashes[digest] = story_id
+            else:
+                self._stories[story_id].update({k: v for k, v in story.items() if k != "id"})
+
+            self._tags.setdefault(story_id, set()).update(tags)
+            self._index(story_id)
+            if story_id not in ordered:
+                ordered.append(story_id)
+
+        self._feeds[feed] = (time.monotonic(), ordered)
+        return ordered
+
+    def _trim(self, keep: int = NEWS_MAX_STORIES) -> int:
+        """Drop the oldest stories beyond `keep`."""
+        excess = len(self._stories) - keep
+        if excess <= 0:
+            return 0
+        oldest = sorted(self._stories, key=lambda i: int(self._stories[i].get("pubTime") or 0))[:excess]
+        for story_id in oldest:
+            self._remove(story_id)
+        dropped = set(oldest)
+        self._aliases = {a: c for a, c in self._aliases.items() if c not in dropped}
+        for feed, (fetched, ids) in list(self._feeds.items()):
+            self._feeds[feed] = (fetched, [i for i in ids if i not in dropped])
+        return excess
+
+    # ----- refresh -----
+
+    def is_stale(self) -> bool:
+        return self.last_refreshed is None or time.monotonic() - self.last_refreshed >= NEWS_REFRESH_INTERVAL
+
+    async def _feed(self, fetch: Awaitable[dict], feed: str, tags: Iterable[str] = ()) -> List[int]:
+        try:
+            return self.ingest(await fetch, feed, tags)
+        except DataIsEmpty:
+            return []
+
+    async def refresh(self, api: NewsAPI, when: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Pull the index, every category feed and the top trending-topic feeds.
+
+        Args:
+            api: NewsAPI client (or the leader's publishing / replaying stand-in)
+            when: Condition re-checked once the refresh lock is held; callers that
+                queued behind a refresh which already satisfied it skip theirs
+
+        Returns:
+            int: Number of stories held after the refresh
+        """
+        async with self._lock:
+            if when is not None and not when():
+                return len(self._stories)
+            if self._lists_refreshed is None or time.monotonic() - self._lists_refreshed >= NEWS_LISTS_REFRESH_INTERVAL:
+                try:
+                    self._categories = _listing(await api.get_news_categories())
+                    self._topics = _listing(await api.get_news_topics())
+                except DataIsEmpty:
+                    pass
+                self._lists_refreshed = time.monotonic()
+
+            await self._feed(api.get_news_index(), "index")
+            for category in self._categories:
+                await self._feed(
+                    api.get_news_by_category(category["id"]),
+                    f"category:{category['id']}",
+                    [category.get("name") or ""],
+                )
+            for topic in self._topics[:NEWS_MAX_TOPIC_FEEDS]:
+                await self._feed(
+                    api.get_news_by_topic(topic["id"]),
+                    f"topic:{topic['id']}",
+                    [topic.get("headline") or topic.get("name") or ""],
+                )
+
+            dropped = self._trim()
+            self.last_refreshed = time.monotonic()
+            logger.info(
+                f"📰 News refreshed: {len(self._stories)} stories, {self.duplicates} duplicates merged, "
+                f"{dropped} dropped"
+            )
+            return len(self._stories)
+
+    async def refresh_if_stale(self, api: NewsAPI) -> int:
+        return await self.refresh(api, when=self.is_stale)
+
+    async def ensure_loaded(self) -> int:
+        """
+        Refresh once if the store is still empty (before the background loop's first
+        pass lands): the leader, or a single worker, from upstream and publishing the
+        feeds; other workers by replaying the leader's feeds. A loaded store is served
+        as is, so searches never add upstream calls of their own.
+
+        Returns:
+            int: Number of stories held
+        """
+        if len(self):
+            return len(self)
+        if shared_cache is not None and not election.is_leader:
+            return await self.refresh(_Replaying(), when=lambda: not self._stories)
+        async with NewsAPI() as api:
+            return await self.refresh(api if shared_cache is None else _Publishing(api), when=lambda: not self._stories)
+
+    def prefetch_candidates(self) -> List[int]:
+        """Top index stories, then the top of each trending-topic feed, not yet in the detail cache."""
+        candidates = list((self._feeds.get("index") or (0, []))[1][:NEWS_DETAIL_PREFETCH_INDEX])
+        for topic in self._topics[:NEWS_MAX_TOPIC_FEEDS]:
+            entry = self._feeds.get(f"topic:{topic['id']}")
+            if entry is not None:
+                candidates.extend(entry[1][:NEWS_DETAIL_PREFETCH_PER_TOPIC])
+        seen = set()
+        due = []
+        for story_id in candidates:
+            if story_id not in seen and story_id in self._stories and story_id not in news_detail_cache:
+                seen.add(story_id)
+                due.append(story_id)
+        return due[:NEWS_DETAIL_PREFETCH_QUOTA]
+
+    async def prefetch_details(self, api: NewsAPI) -> int:
+        """Load the details of the prefetch candidates; returns how many were fetched."""
+        semaphore = asyncio.Semaphore(NEWS_DETAIL_PREFETCH_CONCURRENCY)
+
+        async def prefetch(story_id: int) -> bool:
+            async with semaphore:
+                try:
+                    await cached_news_detail(api, story_id)
+                    return True
+                except DataIsEmpty:
+                    return False
+                except Exception as exc:
+                    logger.debug(f"Prefetching news detail {story_id} failed: {exc}")
+                    return False
+
+        with low_priority():
+            fetched = sum(await asyncio.gather(*(prefetch(i) for i in self.prefetch_candidates())))
+        self.details_prefetched += fetched
+        if fetched:
+            logger.info(f"📰 Prefetched {fetched} news details")
+        return fetched
+
+    async def run(self) -> None:
+        """
+        Background loop, every refresh interval: the leader worker refreshes and prefetches details
+        in the low-priority lane; other workers replay the leader's feeds from the shared cache.
+        """
+        while True:
+            leading = election.try_acquire()
+            try:
+                if leading:
+                    with low_priority():
+                        async with NewsAPI() as api:
+                            await self.refresh(api if shared_cache is None else _Publishing(api))
+                            await self.prefetch_details(api)
+                else:
+                    self._lists_refreshed = None  # replaying the lists costs no upstream calls
+                    await self.refresh(_Replaying())
+            except Exception as exc:
+                logger.warning(f"⚠️ News refresh failed: {exc}")
+            # Until the leader has published, followers check back sooner
+            await asyncio.sleep(NEWS_REFRESH_INTERVAL if leading or len(self) else LEADER_RETRY_INTERVAL)
+
+    # ----- queries -----
+
+    def canonical_id(self, story_id: int) -> int:
+        """ID under which a (possibly re-published) story is stored."""
+        return self._aliases.get(story_id, story_id)
+
+    def story(self, story_id: int) -> Optional[dict]:
+        return self._stories.get(self.canonical_id(story_id))
+
+    def feed(self, feed: str) -> Optional[List[dict]]:
+        entry = self._feeds.get(feed)
+        if entry is None:
+            return None
+        return [self._stories[i] for i in entry[1] if i in self._stories]
+
+    async def player_news(self, api: PlayersAPI, player_id: str) -> List[dict]:
+        """A player's news feed, fetched at most once per player TTL and merged into the store."""
+        feed = f"player:{player_id}"
+        entry = self._feeds.get(feed)
+        if entry is None or time.monotonic() - entry[0] >= NEWS_PLAYER_TTL:
+            try:
+                payload = await shared_fetch("news-feed", ["player", player_id], NEWS_PLAYER_TTL,
+                                             lambda: api.get_news(player_id))
+            except DataIsEmpty:
+                payload = {}
+            self.ingest(payload, feed, [feed])
+        return self.feed(feed) or []
+
+    def search(self, query: str, limit: int = 20, entity: Optional[str] = None) -> List[dict]:
+        """
+        Stories matching every query token (and the entity key, if given), newest first.
+
+        Headline matches rank above matches in the intro, context or tags only.
+        """
+        tokens = tokenize(query)
+        if entity is not None:
+            tokens.add(entity)
+        if not tokens:
+            return []
+        postings = sorted((self._postings.get(t, set()) for t in tokens), key=len)
+        matches = set.intersection(*postings) if postings else set()
+
+        def rank(story_id: int):
+            story = self._stories[story_id]
+            in_headline = len(tokens & tokenize(story.get("hline") or ""))
+            return (-in_headline, -int(story.get("pubTime") or 0))
+
+        return [self._stories[i] for i in sorted(matches, key=rank)[:limit]]
+
+    def nbytes(self) -> int:
+        return (
+            estimate(self._stories.values(), len(self._stories))
+            + estimate(self._postings.items(), len(self._postings))
+        )
+
+    def shrink(self, fraction: float) -> int:
+        """Drop the oldest fraction of stories; returns how many."""
+        return self._trim(keep=int(len(self._stories) * (1 - fraction)))
+
+    def stats(self) -> dict:
+        return {
+            "stories": len(self._stories),
+            "tokens": len(self._postings),
+            "feeds": len(self._feeds),
+            "duplicatesMerged": self.duplicates,
+            "detailsPrefetched": self.details_prefetched,
+        }
+
+
+def story_list(stories: List[dict]) -> dict:
+    """Wrap stories in the upstream storyList shape the news widget expects."""
+    return {"storyList": [{"story": story} for story in stories]}
+
+
+news_store = NewsStore()
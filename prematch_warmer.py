@@ -0,0 +1,134 @@
+"""
+Pre-match cache warmer for Cricket Chat MCP Server.
+
+Reads upcoming fixtures from the local calendar and, shortly before each
+match starts, prefetches both squads (the announced match squad via
+`get_match_team`, falling back to the series squad via
+`get_series_squad_players`) along with every player's profile and batting
+and bowling stats. All of it runs in the low-priority upstream lane, so the
+player cache is hot by toss time without competing with user requests.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Set
+
+from config import (
+    WARMUP_LEAD_TIME,
+    WARMUP_SCAN_INTERVAL,
+    WARMUP_PLAYER_CONCURRENCY,
+)
+from cric_buzz_service.base_client import DataIsEmpty
+from cric_buzz_service.matches_api import MatchesAPI
+from cric_buzz_service.players_api import PlayersAPI
+from cric_buzz_service.schedules_api import SchedulesAPI
+from cric_buzz_service.series_api import SeriesAPI
+from cric_buzz_service.upstream import low_priority
+from fixture_calendar import fixture_calendar
+from response_cache import PLAYER_ENDPOINTS, cached_player
+from team_index import team_index
+
+logger = logging.getLogger(__name__)
+
+
+def _match_team_player_ids(payload: dict) -> Set[str]:
+    """Player IDs from a get_match_team response (playing XI, bench and any other groups)."""
+    ids = set()
+    players = payload.get("players") or {}
+    groups = players.values() if isinstance(players, dict) else [players]
+    for group in groups:
+        for player in group or []:
+            if isinstance(player, dict) and player.get("id") is not None:
+                ids.add(str(player["id"]))
+    return ids
+
+
+class PrematchWarmer:
+    """Warms squads and player data for fixtures starting within the lead time."""
+
+    def __init__(self):
+        self._warmed: Dict[int, float] = {}   # match ID -> start time (epoch ms)
+        self.players_warmed = 0
+
+    async def squad_player_ids(self, fixture: dict) -> Set[str]:
+        """Player IDs of both sides: match squads when announced, else the series squads."""
+        ids: Set[str] = set()
+        team_ids = [t["teamId"] for t in (fixture["team1"], fixture["team2"]) if t.get("teamId") is not None]
+
+        async with MatchesAPI() as api:
+            for team_id in team_ids:
+                try:
+                    ids |= _match_team_player_ids(await api.get_match_team(fixture["matchId"], team_id))
+                except DataIsEmpty:
+                    pass
+
+        if not ids and fixture.get("seriesId") is not None:
+            async with SeriesAPI() as api:
+                await team_index.load_series(api, fixture["seriesId"])
+            for team_id in team_ids:
+                ids |= {str(p["id"]) for p in team_index.team_players(team_id, fixture["seriesId"])}
+        return ids
+
+    async def warm_players(self, player_ids: Set[str]) -> int:
+        """Prefetch profile, batting and bowling for each player; returns calls made."""
+        semaphore = asyncio.Semaphore(WARMUP_PLAYER_CONCURRENCY)
+
+        async def warm(api: PlayersAPI, kind: str, player_id: str) -> None:
+            async with semaphore:
+                try:
+                    await cached_player(api, kind, player_id)
+                except DataIsEmpty:
+                    pass
+                except Exception as exc:
+                    logger.debug(f"Warm-up of {kind} for player {player_id} failed: {exc}")
+
+        async with PlayersAPI() as api:
+            jobs = [warm(api, kind, pid) for pid in player_ids for kind in PLAYER_ENDPOINTS]
+            await asyncio.gather(*jobs)
+        return len(jobs)
+
+    async def warm_match(self, fixture: dict) -> None:
+        with low_priority():
+            player_ids = await self.squad_player_ids(fixture)
+            calls = await self.warm_players(player_ids)
+        self.players_warmed += len(player_ids)
+        logger.info(
+            f"🔥 Warmed match {fixture['matchId']} ({fixture['team1'].get('teamSName')} v "
+            f"{fixture['team2'].get('teamSName')}): {len(player_ids)} players, {calls} lookups"
+        )
+
+    async def scan(self) -> int:
+        """Warm every fixture starting within the lead time that has not been warmed yet."""
+        with low_priority():
+            async with SchedulesAPI() as api:
+                await fixture_calendar.refresh_if_stale(api)
+
+        now_ms = int(time.time() * 1000)
+        for match_id in [m for m, start in self._warmed.items() if start < now_ms]:
+            del self._warmed[match_id]
+
+        due = [
+            f for f in fixture_calendar.query(now_ms, now_ms + WARMUP_LEAD_TIME * 1000)
+            if f["matchId"] not in self._warmed
+        ]
+        for fixture in due:
+            try:
+                await self.warm_match(fixture)
+            except Exception as exc:
+                logger.warning(f"⚠️ Warm-up of match {fixture['matchId']} failed: {exc}")
+                continue
+            self._warmed[fixture["matchId"]] = fixture["startDate"]
+        return len(due)
+
+    async def run(self) -> None:
+        """Background loop: scan for upcoming matches every scan interval."""
+        while True:
+            try:
+                await self.scan()
+            except Exception as exc:
+                logger.warning(f"⚠️ Pre-match warm-up scan failed: {exc}")
+            await asyncio.sleep(WARMUP_SCAN_INTERVAL)
+
+
+prematch_warmer = PrematchWarmer()
@@ -0,0 +1,181 @@
+"""
+On-demand sampling profiler for Cricket Chat MCP Server.
+
+`/debug/profile` runs one of two modes for a few seconds without
+redeploying or restarting:
+
+- `cpu`: a background thread samples the event-loop thread's Python stack
+  every few milliseconds (`sys._current_frames`) and counts collapsed
+  stacks. The output is the `frame;frame;frame count` format read by
+  flamegraph.pl, speedscope and similar tools. Sampling costs one stack
+  walk per interval; the loop itself is not instrumented.
+- `blocking`: the loop posts a heartbeat every few milliseconds, and a
+  watchdog thread captures the loop thread's stack whenever a heartbeat is
+  late by more than the threshold. Each episode reports how long the loop
+  was blocked, the innermost coroutine that was running and its stack (for
+  example a synchronous `read_text()` in `_load_bundle`).
+"""
+
+import asyncio
+import inspect
+import sys
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Dict, List, Optional
+
+from config import PROFILE_SAMPLE_INTERVAL, PROFILE_HEARTBEAT_INTERVAL
+
+_IDLE_FUNCTIONS = {"select", "poll", "epoll", "kqueue", "control"}
+
+
+def _frames(frame: Optional[FrameType]) -> List[FrameType]:
+    """Frames from the outermost call to the innermost."""
+    stack = []
+    while frame is not None:
+        stack.append(frame)
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _label(frame: FrameType) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", code.co_filename)
+    return f"{module}:{code.co_name}"
+
+
+def collapse(frame: Optional[FrameType]) -> str:
+    """One stack as 'outer;...;inner', with selector waits labelled '(idle)'."""
+    stack = _frames(frame)
+    if stack and stack[-1].f_code.co_name in _IDLE_FUNCTIONS and "selector" in stack[-1].f_code.co_filename:
+        return "(idle)"
+    return ";".join(_label(f) for f in stack)
+
+
+def innermost_coroutine(frame: Optional[FrameType]) -> Optional[str]:
+    """Qualified name of the innermost coroutine function on the stack."""
+    while frame is not None:
+        if frame.f_code.co_flags & inspect.CO_COROUTINE:
+            return _label(frame)
+        frame = frame.f_back
+    return None
+
+
+class _Sampler(threading.Thread):
+    """Samples one thread's stack at a fixed interval until stopped."""
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[collapse(frame)] += 1
+                self.samples += 1
+
+
+class LoopWatchdog(threading.Thread):
+    """Flags heartbeats that arrive later than the threshold and captures the blocking stack."""
+
+    def __init__(self, thread_id: int, threshold: float, interval: float):
+        super().__init__(name="loop-watchdog", daemon=True)
+        self.thread_id = thread_id
+        self.threshold = threshold
+        self.interval = interval
+        self.last_beat = time.monotonic()
+        self.stopped = threading.Event()
+        self.on_block = None      # callback(duration, stack, coroutine), called on the loop thread
+        self._episode: Optional[dict] = None
+
+    def beat(self) -> None:
+        """Called on the loop thread; closes any open episode."""
+        now = time.monotonic()
+        episode, self._episode = self._episode, None
+        if episode is not None and self.on_block is not None:
+            self.on_block(now - episode["since"], episode["stack"], episode["coroutine"])
+        self.last_beat = now
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            since = self.last_beat
+            if self._episode is None and time.monotonic() - since > self.threshold:
+                frame = sys._current_frames().get(self.thread_id)
+                episode = {"since": since, "stack": collapse(frame), "coroutine": innermost_coroutine(frame)}
+                if episode["stack"] == "(idle)":
+                    # Loop is in select(), late only because it is waiting for the GIL
+                    continue
+                if self.last_beat == since:
+                    # Still blocked after the stack walk; otherwise the loop recovered meanwhile
+                    self._episode = episode
+
+
+async def heartbeat(watchdog: LoopWatchdog, interval: float) -> None:
+    while True:
+        watchdog.beat()
+        await asyncio.sleep(interval)
+
+
+class Profiler:
+    """Runs one profiling session at a time on the current event loop."""
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+
+    @property
+    def busy(self) -> bool:
+        return self._lock.locked()
+
+    async def sample(self, seconds: float) -> Dict[str, object]:
+        """CPU mode: collapsed stacks of the loop thread over the window."""
+        async with self._lock:
+            sampler = _Sampler(threading.get_ident(), PROFILE_SAMPLE_INTERVAL)
+            started = time.monotonic()
+            sampler.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                sampler.stopped.set()
+                await asyncio.to_thread(sampler.join)
+            return {
+                "seconds": round(time.monotonic() - started, 3),
+                "samples": sampler.samples,
+                "intervalMs": PROFILE_SAMPLE_INTERVAL * 1000,
+                "stacks": sampler.stacks,
+            }
+
+    async def find_blocking(self, seconds: float, threshold: float) -> Dict[str, object]:
+        """Blocking mode: every stretch the loop was blocked longer than threshold, with its stack."""
+        async with self._lock:
+            episodes: List[dict] = []
+            watchdog = LoopWatchdog(threading.get_ident(), threshold, PROFILE_HEARTBEAT_INTERVAL / 2)
+            watchdog.on_block = lambda duration, stack, coroutine: episodes.append({
+                "blockedMs": round(duration * 1000, 1),
+                "coroutine": coroutine,
+                "stack": stack,
+            })
+            beating = asyncio.create_task(heartbeat(watchdog, PROFILE_HEARTBEAT_INTERVAL))
+            watchdog.start()
+            try:
+                await asyncio.sleep(seconds)
+            finally:
+                beating.cancel()
+                watchdog.stopped.set()
+                await asyncio.to_thread(watchdog.join)
+            episodes.sort(key=lambda e: e["blockedMs"], reverse=True)
+            return {"seconds": seconds, "thresholdMs": threshold * 1000, "episodes": episodes}
+
+
+def collapsed_text(stacks: Counter) -> str:
+    """Flamegraph input: one 'stack count' line per distinct stack."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+profiler = Profiler()
@@ -0,0 +1,289 @@
+"""
+Points-table qualification scenarios for Cricket Chat MCP Server.
+
+Takes a series points table and its remaining fixtures, then enumerates (or,
+for long run-ins, Monte-Carlo samples) every way the remaining matches can go.
+Points and an approximate net run rate are computed for all outcomes at once
+with NumPy, giving each team's qualification probability, the matches it
+must win and its chances for each number of further wins.
+
+Probabilities lean on the NRR approximation (and, when sampled, on chance),
+so they are estimates. Status and must-win matches are only stated when
+points alone settle them: over every enumerated outcome, or from points
+bounds when the run-in was sampled. Anything a tie on points could decide
+stays "in contention".
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
+
+from config import (
+    QUALIFICATION_POINTS_PER_WIN,
+    QUALIFICATION_ENUMERATION_LIMIT,
+    QUALIFICATION_SAMPLES,
+    QUALIFICATION_NRR_MARGIN,
+    QUALIFICATION_INPUT_TTL,
+    QUALIFICATION_CACHE_SIZE,
+)
+from cric_buzz_service.series_api import SeriesAPI
+import executors
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATES = {"Complete", "Abandon", "Abandoned", "No Result"}
+
+
+@dataclass
+class LeagueState:
+    """Current standings and remaining fixtures of one points-table group."""
+    team_ids: List[int]
+    team_names: List[str]
+    points: np.ndarray     # float64, current points per team
+    played: np.ndarray     # int64, matches played per team
+    nrr: np.ndarray        # float64, current net run rate per team
+    home: np.ndarray       # int64, team index of team1 per remaining match
+    away: np.ndarray       # int64, team index of team2 per remaining match
+    fixtures: List[Dict[str, Any]]
+
+    @property
+    def signature(self) -> Tuple:
+        """Changes whenever a result lands (or a fixture is added or removed)."""
+        return (
+            tuple(self.team_ids),
+            tuple(self.points.tolist()),
+            tuple(self.played.tolist()),
+            tuple(f["matchId"] for f in self.fixtures),
+        )
+
+
+def _parse_nrr(value: Any) -> float:
+    try:
+        return float(str(value).replace("+", ""))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def build_league_state(points_table: dict, series_matches: dict, group: Optional[str] = None) -> LeagueState:
+    """
+    Build the league state from upstream points table and series match list.
+
+    Args:
+        points_table: Response of SeriesAPI.get_series_points_table
+        series_matches: Response of SeriesAPI.get_series_matches
+        group: Points-table group name (defaults to the first group)
+
+    Returns:
+        LeagueState: Standings plus the remaining fixtures between teams of the group
+
+    Raises:
+        ValueError: When the points table has no (matching) group
+    """
+    groups = points_table.get("pointsTable") or []
+    if group is not None:
+        groups = [g for g in groups if (g.get("groupName") or "").lower() == group.lower()]
+    if not groups:
+        raise ValueError(f"No points table group found{f' named {group}' if group else ''}")
+    rows = groups[0].get("pointsTableInfo") or []
+
+    team_ids = [int(row["teamId"]) for row in rows]
+    index = {team_id: i for i, team_id in enumerate(team_ids)}
+
+    fixtures = []
+    for day in series_matches.get("matchDetails") or []:
+        for match in (day.get("matchDetailsMap") or {}).get("match") or []:
+            info = match.get("matchInfo") or {}
+            if info.get("state") in FINISHED_STATES:
+                continue
+            team1 = (info.get("team1") or {}).get("teamId")
+            team2 = (info.get("team2") or {}).get("teamId")
+            if team1 in index and team2 in index:
+                fixtures.append({
+                    "matchId": info.get("matchId"),
+                    "matchDesc": info.get("matchDesc"),
+                    "startDate": info.get("startDate"),
+                    "team1": index[team1],
+                    "team2": index[team2],
+                })
+
+    return LeagueState(
+        team_ids=team_ids,
+        team_names=[row.get("teamName") or row.get("teamFullName") or str(row["teamId"]) for row in rows],
+        points=np.array([float(row.get("points") or 0) for row in rows]),
+        played=np.array([int(row.get("matchesPlayed") or 0) for row in rows]),
+        nrr=np.array([_parse_nrr(row.get("nrr")) for row in rows]),
+        home=np.array([f["team1"] for f in fixtures], dtype=np.int64),
+        away=np.array([f["team2"] for f in fixtures], dtype=np.int64),
+        fixtures=fixtures,
+    )
+
+
+def _outcomes(matches: int, samples: int, rng: np.random.Generator) -> Tuple[np.ndarray, bool]:
+    """Outcome matrix (scenario x match, True = team1 wins) and whether it is exhaustive."""
+    if 2 ** matches <= QUALIFICATION_ENUMERATION_LIMIT:
+        codes = np.arange(2 ** matches, dtype=np.int64)[:, None]
+        return ((codes >> np.arange(matches)) & 1).astype(bool), True
+    return rng.random((samples, matches)) < 0.5, False
+
+
+def _status(surely_in: bool, surely_out: bool) -> str:
+    return "qualified" if surely_in else "eliminated" if surely_out else "in contention"
+
+
+def simulate(state: LeagueState, qualify_top: int, samples: int = QUALIFICATION_SAMPLES,
+             seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Simulate the remaining fixtures and summarise each team's qualification chances.
+
+    Args:
+        state: League state from build_league_state
+        qualify_top: Number of teams that qualify
+        samples: Monte-Carlo scenarios when the run-in is too long to enumerate
+        seed: Optional RNG seed
+
+    Returns:
+        dict: Per-team estimated probabilities, definite status and must-win
+            fixtures, and estimated chances by number of wins
+    """
+    rng = np.random.default_rng(seed)
+    teams, matches = len(state.team_ids), len(state.fixtures)
+    outcome, exact = _outcomes(matches, samples, rng)
+    scenarios = outcome.shape[0]
+
+    winners = np.where(outcome, state.home, state.away)
+    losers = np.where(outcome, state.away, state.home)
+    offsets = (np.arange(scenarios) * teams)[:, None]
+
+    wins = np.bincount((winners + offsets).ravel(), minlength=scenarios * teams).reshape(scenarios, teams)
+    points = state.points + QUALIFICATION_POINTS_PER_WIN * wins
+
+    # NRR approximation: every result moves the winner up and the loser down by a
+    # margin, averaged into the season so far.
+    if exact:
+        margin = np.full((scenarios, matches), QUALIFICATION_NRR_MARGIN)
+    else:
+        margin = np.abs(rng.normal(0.0, QUALIFICATION_NRR_MARGIN * 1.25, (scenarios, matches)))
+    shift = (
+        np.bincount((winners + offsets).ravel(), weights=margin.ravel(), minlength=scenarios * teams)
+        - np.bincount((losers + offsets).ravel(), weights=margin.ravel(), minlength=scenarios * teams)
+    ).reshape(scenarios, teams)
+    remaining = np.bincount(np.concatenate((state.home, state.away)), minlength=teams)
+    games = np.maximum(state.played + remaining, 1)
+    nrr = (state.nrr * state.played + shift) / games
+
+    # Rank on points, then NRR (clipped so it can never outweigh a point)
+    key = points + np.clip(nrr, -9.99, 9.99) / 20.0
+    top = np.argsort(-key, axis=1, kind="stable")[:, :qualify_top]
+    qualified = np.zeros((scenarios, teams), dtype=bool)
+    np.put_along_axis(qualified, top, True, axis=1)
+
+    probability = qualified.mean(axis=0)
+    remaining_points = state.points + QUALIFICATION_POINTS_PER_WIN * remaining
+    if exact:
+        # Per scenario, on points alone: surely in when fewer than qualify_top
+        # others reach the team's points, surely out when qualify_top others pass it.
+        ahead = (points[:, None, :] > points[:, :, None]).sum(axis=2)
+        level = (points[:, None, :] >= points[:, :, None]).sum(axis=2) - 1
+        surely_in, surely_out = level < qualify_top, ahead >= qualify_top
+    result_teams = []
+    for t in range(teams):
+        team_matches = np.flatnonzero((state.home == t) | (state.away == t))
+        team_wins = outcome[:, team_matches] == (state.home[team_matches] == t)
+        must_win = []
+        if exact:
+            status = _status(surely_in[:, t].all(), surely_out[:, t].all())
+            if status != "eliminated":
+                for column, j in enumerate(team_matches):
+                    if surely_out[~team_wins[:, column], t].all():
+                        must_win.append(state.fixtures[j]["matchId"])
+        else:
+            # Sampled run-in: only what holds for every outcome, from points bounds
+            others = np.arange(teams) != t
+            status = _status(
+                (remaining_points[others] >= state.points[t]).sum() < qualify_top,
+                (state.points[others] > remaining_points[t]).sum() >= qualify_top,
+            )
+            if status != "eliminated":
+                lose_one = remaining_points[t] - QUALIFICATION_POINTS_PER_WIN
+                if (state.points[others] > lose_one).sum() >= qualify_top:
+                    must_win = [state.fixtures[j]["matchId"] for j in team_matches]
+
+        total_wins = team_wins.sum(axis=1)
+        by_wins = {
+            int(k): round(float(qualified[total_wins == k, t].mean()), 4)
+            for k in range(len(team_matches) + 1)
+            if (total_wins == k).any()
+        }
+        result_teams.append({
+            "teamId": state.team_ids[t],
+            "teamName": state.team_names[t],
+            "points": float(state.points[t]),
+            "remainingMatches": len(team_matches),
+            "qualificationProbability": round(float(probability[t]), 4),
+            "status": status,
+            "mustWinMatchIds": must_win,
+            "probabilityByWins": by_wins,
+        })
+
+    result_teams.sort(key=lambda r: -r["qualificationProbability"])
+    return {
+        "qualifyTop": qualify_top,
+        "remainingMatches": matches,
+        "scenarios": int(scenarios),
+        "exact": exact,
+        "probabilitiesAreEstimates": True,
+        "note": (
+            "Status and must-win matches are certain on points; probabilities and probabilityByWins "
+            "are estimates that break points ties with an approximate net run rate"
+            + ("." if exact else f" over {int(scenarios)} sampled outcomes.")
+        ),
+        "teams": result_teams,
+        "fixtures": [
+            {**f, "team1": state.team_ids[f["team1"]], "team2": state.team_ids[f["team2"]]}
+            for f in state.fixtures
+        ],
+    }
+
+
+_inputs: TTLCache = TTLCache(maxsize=QUALIFICATION_CACHE_SIZE, ttl=QUALIFICATION_INPUT_TTL)
+_results: LRUCache = LRUCache(maxsize=QUALIFICATION_CACHE_SIZE)
+
+
+async def qualification_scenarios(
+    api: SeriesAPI,
+    series_id: int,
+    qualify_top: int,
+    group: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Qualification scenarios for a series, reusing the simulation until a new result lands.
+
+    Args:
+        api: SeriesAPI client
+        series_id: ID of the series
+        qualify_top: Number of teams that qualify from the group
+        group: Points-table group name (optional)
+
+    Returns:
+        dict: Simulation summary (see simulate) plus the series ID
+    """
+    inputs = _inputs.get(series_id)
+    if inputs is None:
+        inputs = (await api.get_series_points_table(series_id), await api.get_series_matches(series_id))
+        _inputs[series_id] = inputs
+
+    state = build_league_state(*inputs, group=group)
+    key = (series_id, group, qualify_top, state.signature)
+    result = _results.get(key)
+    if result is None:
+        # Sized by scenario count: short run-ins stay inline, long ones go to the records pool
+        matches = len(state.fixtures)
+        scenarios = 2 ** matches if 2 ** matches <= QUALIFICATION_ENUMERATION_LIMIT else QUALIFICATION_SAMPLES
+        summary = await executors.run("records", simulate, state, qualify_top, size=scenarios)
+        result = {"seriesId": series_id, **summary}
+        _results[key] = result
+        logger.debug(f"Simulated {result['scenarios']} scenarios for series {series_id}")
+    return result
@@ -0,0 +1,183 @@
+"""
+Upstream response caching for Cricket Chat MCP Server.
+
+A small TTL cache with single-flight loading: concurrent requests for the
+same key share one upstream call instead of stampeding the API (the toss-time
+pattern, where thousands of users ask about the same 22 players at once).
+The pre-match warmer fills the player cache ahead of time and the news
+refresh job prefetches story details the same way.
+
+In multi-worker mode a miss goes through the shared cache, so one worker
+fetches and the others read its result (see shared_cache.py).
+
+Entries carry a wall-clock expiry, so `snapshot()` / `restore()` can carry
+hot entries across a restart with their remaining TTL (see warm_restart.py).
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List
+
+from cachetools import TLRUCache
+
+from config import (
+    PLAYER_CACHE_TTL,
+    PLAYER_CACHE_SIZE,
+    NEWS_DETAIL_CACHE_TTL,
+    NEWS_DETAIL_CACHE_SIZE,
+    RANKINGS_CACHE_TTL,
+    RECORD_FILTERS_CACHE_TTL,
+    TRENDING_CACHE_TTL,
+)
+from cric_buzz_service.news_api import NewsAPI
+from cric_buzz_service.players_api import PlayersAPI
+from cric_buzz_service.stats_api import StatsAPI, FormatType, RankingCategory
+from memory import estimate
+from shared_cache import shared_cache, shared_fetch
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """TTL cache whose misses are loaded once, however many callers are waiting."""
+
+    def __init__(self, name: str, maxsize: int, ttl: float):
+        self.name = name
+        self.ttl = ttl
+        # Values are stored as (expires, value) with wall-clock expiry
+        self._cache: TLRUCache = TLRUCache(maxsize=maxsize, ttu=lambda _key, entry, _now: entry[0], timer=time.time)
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._cache
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Cached value for key, calling fetch on a miss.
+
+        Callers arriving while the first fetch is running wait for its result;
+        errors are not cached.
+        """
+        while True:
+            try:
+                value = self._cache[key][1]
+            except KeyError:
+                pass
+            else:
+                self.hits += 1
+                return value
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                # The loading caller was cancelled, not us - try again
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await shared_fetch(self.name, key, self.ttl, fetch)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved: waiters re-raise it, no warning if there are none
+            raise
+        else:
+            self._cache[key] = (time.time() + self.ttl, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def nbytes(self) -> int:
+        return estimate(self._cache.items(), len(self._cache))
+
+    def shrink(self, fraction: float) -> int:
+        """Drop the oldest fraction of entries; returns how many."""
+        count = min(len(self._cache), max(1, int(len(self._cache) * fraction))) if len(self._cache) else 0
+        for _ in range(count):
+            self._cache.popitem()
+        return count
+
+    async def snapshot(self) -> List[list]:
+        """Unexpired entries as [key, expires, value] rows, including other workers' shared entries."""
+        rows = [[key, entry[0], entry[1]] for key, entry in list(self._cache.items())]
+        if shared_cache is not None:
+            rows += await shared_cache.entries(self.name)
+        return rows
+
+    def restore(self, rows: List[list]) -> int:
+        """Reload snapshot rows that have not expired, keeping their original expiry; returns how many."""
+        now = time.time()
+        restored = 0
+        for key, expires, value in rows:
+            if expires > now:
+                self._cache[tuple(key) if isinstance(key, list) else key] = (expires, value)
+                restored += 1
+        return restored
+
+    def stats(self) -> dict:
+        return {"name": self.name, "size": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+player_cache = ResponseCache("player", maxsize=PLAYER_CACHE_SIZE, ttl=PLAYER_CACHE_TTL)
+
+PLAYER_ENDPOINTS = {
+    "info": "get_player_info",
+    "batting": "get_batting",
+    "bowling": "get_bowling",
+}
+
+
+async def cached_player(api: PlayersAPI, kind: str, player_id: str) -> dict:
+    """Player profile ('info') or batting/bowling stats, served from the player cache."""
+    player_id = str(player_id)
+    return await player_cache.get_or_fetch(
+        (kind, player_id),
+        lambda: getattr(api, PLAYER_ENDPOINTS[kind])(player_id),
+    )
+
+
+news_detail_cache = ResponseCache("news-detail", maxsize=NEWS_DETAIL_CACHE_SIZE, ttl=NEWS_DETAIL_CACHE_TTL)
+
+
+async def cached_news_detail(api: NewsAPI, news_id: int) -> dict:
+    """Full news story, served from the news detail cache."""
+    news_id = int(news_id)
+    return await news_detail_cache.get_or_fetch(news_id, lambda: api.get_news_detail(news_id))
+
+
+rankings_cache = ResponseCache("rankings", maxsize=32, ttl=RANKINGS_CACHE_TTL)
+record_filters_cache = ResponseCache("record-filters", maxsize=1, ttl=RECORD_FILTERS_CACHE_TTL)
+trending_cache = ResponseCache("trending", maxsize=1, ttl=TRENDING_CACHE_TTL)
+
+
+async def cached_rankings(api: StatsAPI, category: RankingCategory, format_type: FormatType, is_women: bool) -> dict:
+    """ICC rankings table, served from the rankings cache."""
+    return await rankings_cache.get_or_fetch(
+        (category.value, format_type.value, bool(is_women)),
+        lambda: api.get_rankings(category=category, format_type=format_type, is_women=is_women),
+    )
+
+
+async def cached_record_filters(api: StatsAPI) -> dict:
+    """Record filters and statistics types, served from the record filters cache."""
+    return await record_filters_cache.get_or_fetch("filters", api.get_record_filters)
+
+
+async def cached_trending(api: PlayersAPI) -> dict:
+    """Trending players, served from the trending cache."""
+    return await trending_cache.get_or_fetch("trending", api.list_trending)
@@ -2,11 +2,42 @@
 HTTP routes for Cricket Chat MCP Server.
 """
 
-from starlette.responses import JSONResponse
+import asyncio
+import os
+import secrets
+import tracemalloc
+from typing import Optional
+
+from starlette.responses import FileResponse, JSONResponse, Response
 from starlette.routing import Route
 
-from config import SERVER_NAME, SERVER_VERSION, SERVER_DESCRIPTION, TOOL_NAMES
+from config import (
+    SERVER_NAME,
+    SERVER_VERSION,
+    SERVER_DESCRIPTION,
+    TOOL_NAMES,
+    LIVE_STREAM_PATH,
+    IMAGE_ROUTE_PATH,
+    IMAGE_MAX_AGE,
+    DEBUG_TOKEN,
+    PROFILE_MAX_SECONDS,
+    PROFILE_BLOCKING_THRESHOLD,
+)
+from cric_buzz_service.base_client import DataIsEmpty, RateLimitExceeded
 from widgets import widgets, HAS_UI, WIDGETS_BY_URI, MIME_TYPE
+from live_stream import LiveResponse, TooManySubscribers, live_hub
+from image_cache import image_cache, image_key, normalise_image_id, valid_variant
+from admission import admission
+from clients import identify_request, usage
+from cric_buzz_service.upstream import current_client, scheduler
+from cric_buzz_service.tracing import exporter
+from profiler import profiler, collapsed_text
+from loop_monitor import loop_monitor
+from memory import memory
+import executors
+from leader import election
+from shared_cache import shared_cache
+import warm_restart
 
 
 async def root(request):
@@ -20,19 +51,40 @@ async def root(request):
             "mcp_sse": "/mcp (SSE - for MCP clients only)",
             "mcp_messages": "/mcp/messages (HTTP POST - for stateless MCP)",
             "health": "/health",
+            "metrics": "/metrics",
             "info": "/info",
-            "widgets": "/debug/widgets"
+            "live": "/live/{match_id} (SSE - scorecard and commentary deltas)",
+            "images": "/images/{image_id}?p=thumb&d=high (cached Cricbuzz image proxy)",
+            "widgets": "/debug/widgets",
+            "profile": "/debug/profile?seconds=10&mode=cpu|blocking (requires DEBUG_TOKEN)",
+            "admission": "/debug/admission",
+            "clients": "/debug/clients (requires DEBUG_TOKEN)",
+            "traces": "/debug/traces?limit=20&tool=get-player-info (requires DEBUG_TOKEN)",
+            "executors": "/debug/executors",
+            "memory": "/debug/memory?tracemalloc=start&limit=25 (requires DEBUG_TOKEN)"
         },
         "note": "The /mcp endpoint requires 'Accept: text/event-stream' header and is meant for MCP clients (like Claude Desktop), not browsers."
     })
 
 
 async def health(request):
-    """Health check endpoint."""
+    """Health check endpoint; 503 until startup (snapshot restore) completes and while draining for shutdown."""
+    if warm_restart.ready:
+        status = "healthy"
+    else:
+        status = "draining" if warm_restart.draining else "starting"
     return JSONResponse({
-        "status": "healthy",
-        "server": SERVER_NAME
-    })
+        "status": status,
+        "server": SERVER_NAME,
+        "worker": {**election.stats(), "sharedCache": shared_cache.stats() if shared_cache else None},
+        "lifecycle": warm_restart.stats(),
+        "eventLoop": loop_monitor.stats(),
+    }, status_code=200 if warm_restart.ready else 503)
+
+
+async def metrics(request):
+    """Prometheus metrics: event-loop lag and blocked callbacks."""
+    return Response("\n".join(loop_monitor.prometheus()) + "\n", media_type="text/plain; version=0.0.4")
 
 
 async def server_info(request):
@@ -77,11 +129,206 @@ async def debug_widgets(request):
     })
 
 
+def _debug_authorized(request) -> bool:
+    """True when the request carries DEBUG_TOKEN (header X-Debug-Token or ?token=)."""
+    token = request.headers.get("x-debug-token") or request.query_params.get("token") or ""
+    return DEBUG_TOKEN is not None and secrets.compare_digest(token, DEBUG_TOKEN)
+
+
+async def debug_profile(request):
+    """
+    Sample the event loop for N seconds (guarded by DEBUG_TOKEN).
+
+    Query params: seconds (1-60, default 10); mode 'cpu' (collapsed stacks
+    for flamegraphs, or JSON with format=json) or 'blocking' (stretches where
+    a callback held the loop longer than threshold_ms).
+    """
+    if DEBUG_TOKEN is None:
+        return JSONResponse({"error": "Profiling is disabled, set DEBUG_TOKEN to enable it"}, status_code=404)
+    if not _debug_authorized(request):
+        return JSONResponse({"error": "Invalid or missing debug token"}, status_code=403)
+    try:
+        seconds = float(request.query_params.get("seconds", "10"))
+        threshold = float(request.query_params.get("threshold_ms", PROFILE_BLOCKING_THRESHOLD * 1000)) / 1000
+    except ValueError:
+        return JSONResponse({"error": "seconds and threshold_ms must be numbers"}, status_code=400)
+    if not 0 < seconds <= PROFILE_MAX_SECONDS or threshold <= 0:
+        return JSONResponse({"error": f"seconds must be in (0, {PROFILE_MAX_SECONDS}], threshold_ms positive"}, status_code=400)
+    if profiler.busy:
+        return JSONResponse({"error": "A profile is already running"}, status_code=409)
+
+    mode = request.query_params.get("mode", "cpu")
+    if mode == "blocking":
+        return JSONResponse(await profiler.find_blocking(seconds, threshold))
+    if mode != "cpu":
+        return JSONResponse({"error": "mode must be 'cpu' or 'blocking'"}, status_code=400)
+
+    result = await profiler.sample(seconds)
+    if request.query_params.get("format") == "json":
+        stacks = result.pop("stacks")
+        return JSONResponse({**result, "top": [{"stack": k, "samples": v} for k, v in stacks.most_common(50)]})
+    return Response(
+        collapsed_text(result["stacks"]),
+        media_type="text/plain",
+        headers={"Content-Disposition": 'attachment; filename="profile.collapsed"'},
+    )
+
+
+async def debug_memory(request):
+    """
+    Memory report (guarded by DEBUG_TOKEN): RSS, estimated bytes per cache and,
+    while tracemalloc runs, the top allocation sites and their growth since the
+    previous call. Pass tracemalloc=start to begin tracing (it slows
+    allocation, so it is off until asked for) and tracemalloc=stop to end it.
+    """
+    if DEBUG_TOKEN is None:
+        return JSONResponse({"error": "Memory debugging is disabled, set DEBUG_TOKEN to enable it"}, status_code=404)
+    if not _debug_authorized(request):
+        return JSONResponse({"error": "Invalid or missing debug token"}, status_code=403)
+    try:
+        limit = min(int(request.query_params.get("limit", "25")), 200)
+    except ValueError:
+        return JSONResponse({"error": "limit must be an integer"}, status_code=400)
+
+    action = request.query_params.get("tracemalloc")
+    if action == "start":
+        memory.start_tracing()
+    elif action == "stop":
+        tracemalloc.stop()
+
+    report = memory.report()
+    report["imageCache"] = image_cache.stats()
+    if tracemalloc.is_tracing():
+        # Snapshots walk every traced block; keep that off the event loop
+        report["allocations"] = await asyncio.to_thread(memory.snapshot, limit)
+    return JSONResponse(report)
+
+
+async def debug_admission(request):
+    """Debug endpoint showing per-tool admission limits and upstream lane usage (queued clients need DEBUG_TOKEN)."""
+    upstream = scheduler.stats()
+    if not _debug_authorized(request):
+        upstream.pop("waitingByClient", None)
+    return JSONResponse({
+        "tools": admission.stats(),
+        "upstream": upstream,
+    })
+
+
+async def debug_clients(request):
+    """Per-client tool calls, shed calls and upstream budget use (guarded by DEBUG_TOKEN, as it lists caller identities)."""
+    if DEBUG_TOKEN is None:
+        return JSONResponse({"error": "Client usage is disabled, set DEBUG_TOKEN to enable it"}, status_code=404)
+    if not _debug_authorized(request):
+        return JSONResponse({"error": "Invalid or missing debug token"}, status_code=403)
+    return JSONResponse({"clients": usage.stats()})
+
+
+async def debug_executors(request):
+    """Debug endpoint showing worker pool backlog and how many transforms ran inline or offloaded."""
+    return JSONResponse({"pools": executors.stats()})
+
+
+async def debug_traces(request):
+    """Slowest recent tool calls with their span breakdown (guarded by DEBUG_TOKEN, as traces carry client IDs)."""
+    if DEBUG_TOKEN is None:
+        return JSONResponse({"error": "Trace listing is disabled, set DEBUG_TOKEN to enable it"}, status_code=404)
+    if not _debug_authorized(request):
+        return JSONResponse({"error": "Invalid or missing debug token"}, status_code=403)
+    try:
+        limit = min(int(request.query_params.get("limit", "20")), 200)
+    except ValueError:
+        return JSONResponse({"error": "limit must be an integer"}, status_code=400)
+    tool = request.query_params.get("tool")
+    return JSONResponse({
+        "buffered": len(exporter.traces),
+        "jsonlDropped": exporter.dropped,
+        "traces": exporter.slowest(limit=limit, name=tool),
+    })
+
+
+async def live_stream(request):
+    """Server-Sent Events stream of scorecard and commentary deltas for a match."""
+    try:
+        # Reserve the slot before any header is sent, so a full hub is still a clean 503
+        subscriber = live_hub.subscribe(request.path_params["match_id"])
+    except TooManySubscribers:
+        return JSONResponse(
+            {"error": "Live stream is at capacity, retry shortly"},
+            status_code=503,
+            headers={"Retry-After": "30"},
+        )
+    
+    return LiveResponse(live_hub, subscriber)
+
+
+async def image_proxy(request):
+    """Serve a Cricbuzz image from the disk cache, fetching it from upstream on a miss."""
+    image_id = normalise_image_id(request.path_params["image_id"])
+    size = request.query_params.get("p")
+    quality = request.query_params.get("d")
+    if image_id is None or not valid_variant(size, quality):
+        return JSONResponse({"error": "Invalid image ID or variant"}, status_code=400)
+    
+    client = identify_request(request)
+    if image_cache.lookup(image_key(image_id, size, quality)) is None and usage.over_budget(client):
+        usage.record_shed(client)
+        retry_after = round(usage.budget_reset_in())
+        return JSONResponse(
+            {"error": "Client upstream budget exhausted", "retryAfter": retry_after},
+            status_code=429,
+            headers={"Retry-After": str(retry_after)},
+        )
+    client_token = current_client.set(client)
+    try:
+        return await _serve_image(request, image_id, size, quality)
+    finally:
+        current_client.reset(client_token)
+
+
+async def _serve_image(request, image_id: str, size: Optional[str], quality: Optional[str]):
+    """Image proxy response, fetching once more if the file is evicted between lookup and stat."""
+    for attempt in range(2):
+        try:
+            path, etag = await image_cache.get(image_id, size, quality)
+        except DataIsEmpty:
+            return JSONResponse({"error": f"Image {image_id} not found"}, status_code=404)
+        except RateLimitExceeded:
+            return JSONResponse({"error": "Upstream rate limit exceeded"}, status_code=429, headers={"Retry-After": "10"})
+        except Exception as exc:
+            return JSONResponse({"error": f"Error fetching image: {exc}"}, status_code=502)
+        try:
+            # Stat here, so a file evicted since the lookup is fetched again instead of failing mid-response
+            stat_result = os.stat(path)
+            break
+        except FileNotFoundError:
+            continue
+    else:
+        return JSONResponse({"error": f"Image {image_id} was evicted, please retry"}, status_code=503, headers={"Retry-After": "1"})
+    
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={IMAGE_MAX_AGE}, immutable",
+    }
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type="image/jpeg", headers=headers, stat_result=stat_result)
+
+
 def get_routes():
     """Get all HTTP routes."""
     return [
         Route("/", root),
         Route("/health", health),
+        Route("/metrics", metrics),
         Route("/info", server_info),
+        Route(LIVE_STREAM_PATH, live_stream),
+        Route(IMAGE_ROUTE_PATH, image_proxy),
         Route("/debug/widgets", debug_widgets),
+        Route("/debug/profile", debug_profile),
+        Route("/debug/admission", debug_admission),
+        Route("/debug/clients", debug_clients),
+        Route("/debug/traces", debug_traces),
+        Route("/debug/executors", debug_executors),
+        Route("/debug/memory", debug_memory),
     ]
@@ -2,8 +2,11 @@
 Input validation schemas for Cricket Chat MCP Server tools.
 """
 
+from datetime import date
 from typing import Any, Dict, Literal, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
+
+from config import SERIES_STATS_MIN_BALLS, SERIES_STATS_MIN_OVERS
 
 
 class GetPlayerInfoInput(BaseModel):
@@ -109,6 +112,224 @@ class GetRecordsInput(BaseModel):
     model_config = ConfigDict(populate_by_name=True, extra="forbid")
 
 
+class GetMatchCommentaryInput(BaseModel):
+    """Schema for get-match-commentary tool."""
+    match_id: int = Field(
+        ...,
+        description="The match ID to get ball-by-ball commentary for",
+    )
+    over_limit: int = Field(
+        default=3,
+        ge=1,
+        description="Number of most recent overs to return (default: 3)",
+    )
+    innings_id: Optional[int] = Field(
+        default=None,
+        description="Innings ID to read commentary from (optional, defaults to the current innings)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
+class GetMatchScorecardInput(BaseModel):
+    """Schema for get-match-scorecard tool."""
+    match_id: int = Field(
+        ...,
+        description="The match ID to get the scorecard for",
+    )
+    since_version: Optional[int] = Field(
+        default=None,
+        description=(
+            "Scorecard version the caller already has (optional). When given, only a JSON Patch of the "
+            "changes since that version is returned instead of the full scorecard."
+        ),
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
+class GetMatchAnalyticsInput(BaseModel):
+    """Schema for get-match-analytics tool."""
+    match_id: int = Field(
+        ...,
+        description="The match ID to compute over-by-over analytics for",
+    )
+    innings_id: Optional[int] = Field(
+        default=None,
+        description="Innings ID to analyse (optional, defaults to the current innings)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
+class GetQualificationScenariosInput(BaseModel):
+    """Schema for get-qualification-scenarios tool."""
+    series_id: int = Field(
+        ...,
+        description="The series ID whose points table and remaining fixtures should be simulated",
+    )
+    qualify_top: int = Field(
+        default=4,
+        ge=1,
+        description="Number of teams that qualify from the table (default: 4, e.g., IPL playoffs)",
+    )
+    group: Optional[str] = Field(
+        default=None,
+        description="Points-table group name for multi-group events (optional, defaults to the first group)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
+class GetFixturesInput(BaseModel):
+    """Schema for get-fixtures tool."""
+    team: Optional[str] = Field(
+        default=None,
+        description="Team ID, full name or short name to filter fixtures by (optional, e.g., 'India' or 'IND')",
+    )
+    series_id: Optional[int] = Field(
+        default=None,
+        description="Series ID to filter fixtures by (optional)",
+    )
+    venue: Optional[str] = Field(
+        default=None,
+        description="Venue ID or ground name to filter fixtures by (optional)",
+    )
+    match_format: Optional[Literal["TEST", "ODI", "T20"]] = Field(
+        default=None,
+        description="Match format to filter fixtures by (optional)",
+    )
+    from_date: Optional[str] = Field(
+        default=None,
+        pattern=r"^\d{4}-\d{2}-\d{2}$",
+        description="First day of the range, YYYY-MM-DD in IST (optional, defaults to today)",
+    )
+    to_date: Optional[str] = Field(
+        default=None,
+        pattern=r"^\d{4}-\d{2}-\d{2}$",
+        description="Last day of the range, YYYY-MM-DD in IST (optional, defaults to 7 days from from_date)",
+    )
+    limit: int = Field(
+        default=50,
+        ge=1,
+        le=200,
+        description="Maximum number of fixtures to return (default: 50)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+    @field_validator("from_date", "to_date")
+    @classmethod
+    def _date_exists(cls, value: Optional[str]) -> Optional[str]:
+        """The pattern admits '2025-02-30'; reject dates that do not exist."""
+        if value is not None:
+            try:
+                date.fromisoformat(value)
+            except ValueError:
+                raise ValueError(f"{value} is not a valid date")
+        return value
+
+
+class GetTeamPlayersInput(BaseModel):
+    """Schema for get-team-players tool."""
+    team: str = Field(
+        ...,
+        description="Team ID, full name or short name (e.g., '2', 'India' or 'IND')",
+    )
+    series_id: Optional[int] = Field(
+        default=None,
+        description="Series ID to get the team's squad for that series instead of its current roster (optional)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
+class GetPlayerTeamsInput(BaseModel):
+    """Schema for get-player-teams tool."""
+    player_id: str = Field(
+        ...,
+        pattern=r"^\d+$",
+        description="The player ID to find teams for (e.g., '1413' for Virat Kohli)",
+    )
+    series_id: Optional[int] = Field(
+        default=None,
+        description="Series ID whose squads should be loaded first, to check squad membership (optional)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
+class GetVenueStatsInput(BaseModel):
+    """Schema for get-venue-stats tool."""
+    venue_id: int = Field(
+        ...,
+        description="The venue ID (e.g., 31 for Wankhede Stadium; venue IDs appear in get-fixtures results)",
+    )
+    match_format: Optional[Literal["TEST", "ODI", "T20"]] = Field(
+        default=None,
+        description="Only return the ground record for this format (optional)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
+class GetSeriesStatsInput(BaseModel):
+    """Schema for get-series-stats tool."""
+    series_id: int = Field(
+        ...,
+        description="The series ID to get statistics for",
+    )
+    stats_type: Optional[str] = Field(
+        default=None,
+        description=(
+            "Leaderboard to return, e.g., 'mostRuns', 'mostWickets', 'derivedStrikeRate' or 'derivedEconomy' "
+            "(optional, omit to list the available types)"
+        ),
+    )
+    match_format: Optional[Literal["TEST", "ODI", "T20"]] = Field(
+        default=None,
+        description="Only return the leaderboard for this format (optional)",
+    )
+    min_balls: int = Field(
+        default=SERIES_STATS_MIN_BALLS,
+        ge=0,
+        description=f"Minimum balls faced for derivedStrikeRate (default: {SERIES_STATS_MIN_BALLS})",
+    )
+    min_overs: float = Field(
+        default=SERIES_STATS_MIN_OVERS,
+        ge=0,
+        description=f"Minimum overs bowled for derivedEconomy (default: {SERIES_STATS_MIN_OVERS})",
+    )
+    limit: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Maximum rows per format (default: 20)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
+class SearchNewsInput(BaseModel):
+    """Schema for search-news tool."""
+    query: str = Field(
+        ...,
+        min_length=1,
+        description="Words to search for in headlines, intros, series context, topics and categories (e.g., 'Ashes')",
+    )
+    player_id: Optional[str] = Field(
+        default=None,
+        description="Only return stories tagged with this player (optional)",
+    )
+    limit: int = Field(
+        default=20,
+        ge=1,
+        le=100,
+        description="Maximum number of stories to return (default: 20)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
+class GetNewsDetailInput(BaseModel):
+    """Schema for get-news-detail tool."""
+    news_id: int = Field(
+        ...,
+        description="The news story ID (the story 'id' from get-player-news or search-news)",
+    )
+    model_config = ConfigDict(populate_by_name=True, extra="forbid")
+
+
 # Generate JSON schemas for all input models
 def get_schemas() -> Dict[str, Dict[str, Any]]:
     """Get all tool input schemas as JSON."""
@@ -131,5 +352,16 @@ def get_schemas() -> Dict[str, Dict[str, Any]]:
             "properties": {},
             "required": []
         },
+        "get-match-commentary": GetMatchCommentaryInput.model_json_schema(),
+        "get-match-scorecard": GetMatchScorecardInput.model_json_schema(),
+        "get-match-analytics": GetMatchAnalyticsInput.model_json_schema(),
+        "get-qualification-scenarios": GetQualificationScenariosInput.model_json_schema(),
+        "get-fixtures": GetFixturesInput.model_json_schema(),
+        "get-team-players": GetTeamPlayersInput.model_json_schema(),
+        "get-player-teams": GetPlayerTeamsInput.model_json_schema(),
+        "get-venue-stats": GetVenueStatsInput.model_json_schema(),
+        "get-series-stats": GetSeriesStatsInput.model_json_schema(),
+        "search-news": SearchNewsInput.model_json_schema(),
+        "get-news-detail": GetNewsDetailInput.model_json_schema(),
     }
 
@@ -0,0 +1,211 @@
+"""
+Scorecard snapshot store for Cricket Chat MCP Server.
+
+Keeps a short history of versioned scorecard snapshots per match and computes
+structural diffs between them as JSON Patch (RFC 6902) operations, so callers
+can ask for "changes since version N" instead of the full scorecard.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+from config import (
+    SCORECARD_SYNC_INTERVAL,
+    SCORECARD_MAX_VERSIONS,
+    SCORECARD_MAX_MATCHES,
+    SCORECARD_VOLATILE_KEYS,
+)
+from cric_buzz_service.matches_api import MatchesAPI
+from memory import estimate, evict_lru
+import executors
+from shared_cache import shared_fetch
+
+logger = logging.getLogger(__name__)
+
+
+def _escape(token: Any) -> str:
+    """Escape a JSON Pointer reference token."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def json_diff(old: Any, new: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Compute a JSON Patch that turns `old` into `new`.
+
+    Dicts are diffed key by key and lists index by index (trailing items are
+    added or removed), which suits scorecards where rows are appended as an
+    innings progresses.
+
+    Args:
+        old: Previous document
+        new: Current document
+        path: JSON Pointer of the documents being compared
+
+    Returns:
+        List[dict]: RFC 6902 operations (add, remove, replace)
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: List[Dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(json_diff(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for index in range(common):
+            ops.extend(json_diff(old[index], new[index], f"{path}/{index}"))
+        for index in range(common, len(new)):
+            ops.append({"op": "add", "path": f"{path}/{index}", "value": new[index]})
+        # Remove from the end so earlier indices stay valid while applying
+        for index in range(len(old) - 1, common - 1, -1):
+            ops.append({"op": "remove", "path": f"{path}/{index}"})
+        return ops
+
+    if old == new and type(old) is type(new):
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+class ScorecardStore:
+    """Versioned scorecard snapshots for a single match."""
+
+    def __init__(self, match_id: int):
+        self.match_id = match_id
+        self.version = 0
+        self._snapshots: Deque[Tuple[int, dict]] = deque(maxlen=SCORECARD_MAX_VERSIONS)
+        self._lock = asyncio.Lock()
+        self.last_synced: Optional[float] = None
+        self.last_patch: List[Dict[str, Any]] = []
+
+    @property
+    def current(self) -> Optional[dict]:
+        """Latest scorecard snapshot."""
+        return self._snapshots[-1][1] if self._snapshots else None
+
+    @property
+    def oldest_version(self) -> Optional[int]:
+        """Oldest version still available for diffing."""
+        return self._snapshots[0][0] if self._snapshots else None
+
+    def is_stale(self) -> bool:
+        """Whether the store is due for a sync."""
+        if self.last_synced is None:
+            return True
+        return time.monotonic() - self.last_synced >= SCORECARD_SYNC_INTERVAL
+
+    async def update(self, scorecard: dict) -> bool:
+        """
+        Record a freshly fetched scorecard (diffed in the 'diff' worker pool).
+
+        Args:
+            scorecard: Scorecard document as returned by the upstream API
+
+        Returns:
+            bool: True if the scorecard changed and a new version was created
+        """
+        snapshot = {k: v for k, v in scorecard.items() if k not in SCORECARD_VOLATILE_KEYS}
+        current = self.current
+        if current is not None:
+            patch = await executors.run("diff", json_diff, current, snapshot)
+            if not patch:
+                return False
+        else:
+            patch = [{"op": "replace", "path": "", "value": snapshot}]
+
+        self.version += 1
+        self._snapshots.append((self.version, snapshot))
+        self.last_patch = patch
+        logger.debug(f"Scorecard for match {self.match_id} is now version {self.version} ({len(patch)} ops)")
+        return True
+
+    async def sync(self, api: MatchesAPI) -> bool:
+        """Fetch the detailed scorecard and record it as a new version if it changed."""
+        async with self._lock:
+            # Shared for one sync interval, so workers following the same match fetch it once
+            scorecard = await shared_fetch(
+                "scorecard", self.match_id, SCORECARD_SYNC_INTERVAL,
+                lambda: api.get_match_scorecard_detailed(self.match_id),
+            )
+            self.last_synced = time.monotonic()
+            return await self.update(scorecard)
+
+    async def sync_if_stale(self, api: MatchesAPI) -> bool:
+        """Sync with the upstream scorecard unless it was synced recently."""
+        if not self.is_stale():
+            return False
+        return await self.sync(api)
+
+    async def changes_since(self, since_version: Optional[int]) -> Dict[str, Any]:
+        """
+        Get the changes between a previous version and the current scorecard.
+
+        Args:
+            since_version: Version the caller already has (None for the full scorecard)
+
+        Returns:
+            dict: Either a JSON Patch (`patch`) against `sinceVersion`, or the
+                full scorecard (`scorecard`, `full: True`) when the requested
+                version is unknown or no longer retained
+        """
+        result: Dict[str, Any] = {"matchId": self.match_id, "version": self.version}
+        if since_version is not None:
+            for version, snapshot in self._snapshots:
+                if version == since_version:
+                    result.update({
+                        "full": False,
+                        "sinceVersion": since_version,
+                        "patch": await executors.run("diff", json_diff, snapshot, self.current),
+                    })
+                    return result
+        result.update({"full": True, "scorecard": self.current})
+        return result
+
+
+_stores: "OrderedDict[int, ScorecardStore]" = OrderedDict()
+_pinned: Set[int] = set()  # matches with live subscribers, never evicted
+
+
+def get_scorecard_store(match_id: int) -> ScorecardStore:
+    """Get (or create) the scorecard store for a match, evicting the least recently used unpinned store."""
+    store = _stores.get(match_id)
+    if store is None:
+        store = ScorecardStore(match_id)
+        _stores[match_id] = store
+        excess = len(_stores) - SCORECARD_MAX_MATCHES
+        for evicted_id in list(islice((m for m in _stores if m not in _pinned and m != match_id), max(0, excess))):
+            del _stores[evicted_id]
+            logger.info(f"Evicted scorecard store for match {evicted_id}")
+    else:
+        _stores.move_to_end(match_id)
+    return store
+
+
+def pin(match_id: int) -> None:
+    """Keep a match's store through LRU and memory-budget eviction (while it has live subscribers)."""
+    _pinned.add(match_id)
+
+
+def unpin(match_id: int) -> None:
+    _pinned.discard(match_id)
+
+
+def stores_nbytes() -> int:
+    """Estimated memory held by all scorecard snapshots."""
+    return sum(estimate(store._snapshots, len(store._snapshots)) for store in list(_stores.values()))
+
+
+def shrink_stores(fraction: float) -> int:
+    """Drop the least recently used fraction of scorecard stores; returns how many."""
+    return evict_lru(_stores, fraction, keep=_pinned)
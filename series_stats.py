@@ -0,0 +1,296 @@
+"""
+Series statistics engine for Cricket Chat MCP Server.
+
+Fetches a series' stats filters and every leaderboard they list once per
+refresh window, keeps all of them in memory, and merges the rows per player
+so derived leaderboards can be computed locally: strike rate above a
+minimum number of balls faced and economy above a minimum number of overs
+bowled are answered without another upstream request.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from config import (
+    SERIES_STATS_TTL,
+    SERIES_STATS_MAX_SERIES,
+    SERIES_STATS_FETCH_CONCURRENCY,
+)
+from cric_buzz_service.base_client import DataIsEmpty
+from cric_buzz_service.series_api import SeriesAPI
+from cric_buzz_service.upstream import DeadlineExceeded, gather_partial
+from memory import estimate, evict_lru
+import executors
+
+logger = logging.getLogger(__name__)
+
+DERIVED_STRIKE_RATE = "derivedStrikeRate"
+DERIVED_ECONOMY = "derivedEconomy"
+DERIVED_TYPES = {
+    DERIVED_STRIKE_RATE: "Best strike rate (minimum balls faced, computed locally)",
+    DERIVED_ECONOMY: "Best economy (minimum overs bowled, computed locally)",
+}
+
+# Upstream column headers -> canonical field names
+_COLUMNS = {
+    "m": "matches", "mat": "matches", "matches": "matches",
+    "i": "innings", "inn": "innings", "inns": "innings", "innings": "innings",
+    "r": "runs", "runs": "runs",
+    "b": "balls", "bf": "balls", "balls": "balls",
+    "avg": "average", "ave": "average", "average": "average",
+    "sr": "strikeRate",
+    "hs": "highest", "highest": "highest",
+    "4s": "fours", "fours": "fours",
+    "6s": "sixes", "sixes": "sixes",
+    "50s": "fifties", "100s": "hundreds",
+    "o": "overs", "ov": "overs", "overs": "overs",
+    "w": "wickets", "wkts": "wickets", "wickets": "wickets",
+    "econ": "economy", "eco": "economy", "economy": "economy",
+    "bbi": "bestBowling",
+}
+
+
+def _number(value: Any) -> Optional[float]:
+    """Numeric cell value ('113*' -> 113.0, '-' -> None)."""
+    try:
+        return float(str(value).rstrip("*").replace(",", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def _overs_to_balls(overs: float) -> int:
+    whole = int(overs)
+    return whole * 6 + round((overs - whole) * 10)
+
+
+def parse_leaderboards(payload: dict) -> Dict[str, List[dict]]:
+    """Leaderboard rows per format ('T20', 'ODI', 'TEST' or 'ALL') from a stats response."""
+    tables = {}
+    for key, table in payload.items():
+        if key.endswith("StatsList") and isinstance(table, dict):
+            tables[key[: -len("StatsList")].upper()] = table
+    if not tables and "headers" in payload:
+        tables["ALL"] = payload
+
+    boards = {}
+    for match_format, table in tables.items():
+        headers = table.get("headers") or []
+        rows = []
+        for row in table.get("values") or []:
+            values = row.get("values") or []
+            if len(values) < 2:
+                continue
+            # First value is the player ID, followed by one value per header
+            record = {"playerId": values[0], "playerName": values[1], "cells": {}}
+            for header, value in zip(headers[1:], values[2:]):
+                record["cells"][header] = value
+            rows.append(record)
+        boards[match_format] = rows
+    return boards
+
+
+def merge_players(boards: Dict[str, Dict[str, List[dict]]], categories: Dict[str, str]) -> Dict[str, Dict[str, dict]]:
+    """
+    Merge every cached leaderboard into per-format player profiles.
+
+    Columns are mapped to canonical names and kept under 'batting' or
+    'bowling' according to the stat type's category, so a bowler's runs
+    conceded never mixes with runs scored.
+    """
+    players: Dict[str, Dict[str, dict]] = {}
+    for stats_type, by_format in boards.items():
+        side = "bowling" if (categories.get(stats_type) or "").lower().startswith("bowl") else "batting"
+        for match_format, rows in by_format.items():
+            for row in rows:
+                profile = players.setdefault(match_format, {}).setdefault(
+                    row["playerId"], {"playerId": row["playerId"], "playerName": row["playerName"],
+                                      "batting": {}, "bowling": {}}
+                )
+                for header, value in row["cells"].items():
+                    field = _COLUMNS.get(header.strip().lower())
+                    number = _number(value)
+                    if field is not None and number is not None:
+                        profile[side].setdefault(field, number)
+    return players
+
+
+def strike_rate_board(profiles: Dict[str, dict], min_balls: int) -> List[dict]:
+    """Batters ordered by strike rate, limited to those who faced at least min_balls."""
+    board = []
+    for profile in profiles.values():
+        batting = profile["batting"]
+        runs, balls = batting.get("runs"), batting.get("balls")
+        if balls is None and runs is not None and batting.get("strikeRate"):
+            balls = round(runs * 100 / batting["strikeRate"])
+        if runs is None or not balls or balls < min_balls:
+            continue
+        board.append({
+            "playerId": profile["playerId"],
+            "playerName": profile["playerName"],
+            "runs": int(runs),
+            "balls": int(balls),
+            "strikeRate": round(runs * 100 / balls, 2),
+        })
+    board.sort(key=lambda r: -r["strikeRate"])
+    return board
+
+
+def economy_board(profiles: Dict[str, dict], min_overs: float) -> List[dict]:
+    """Bowlers ordered by economy, limited to those who bowled at least min_overs."""
+    board = []
+    for profile in profiles.values():
+        bowling = profile["bowling"]
+        if bowling.get("overs") is None:
+            continue
+        balls = _overs_to_balls(bowling["overs"])
+        if not balls or balls < min_overs * 6:
+            continue
+        if bowling.get("economy") is not None:
+            conceded = bowling["economy"] * balls / 6
+        elif bowling.get("average") is not None and bowling.get("wickets"):
+            conceded = bowling["average"] * bowling["wickets"]
+        else:
+            continue
+        board.append({
+            "playerId": profile["playerId"],
+            "playerName": profile["playerName"],
+            "overs": bowling["overs"],
+            "wickets": int(bowling.get("wickets") or 0),
+            "runsConceded": round(conceded),
+            "economy": round(conceded * 6 / balls, 2),
+        })
+    board.sort(key=lambda r: r["economy"])
+    return board
+
+
+class SeriesStatsEngine:
+    """All leaderboards of recently asked-about series, refreshed once per window."""
+
+    def __init__(self):
+        self._series: "OrderedDict[int, dict]" = OrderedDict()
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    def _fresh(self, series_id: int) -> Optional[dict]:
+        entry = self._series.get(series_id)
+        if entry is not None and time.monotonic() - entry["fetched"] < SERIES_STATS_TTL:
+            self._series.move_to_end(series_id)
+            return entry
+        return None
+
+    async def load(self, api: SeriesAPI, series_id: int) -> dict:
+        """
+        Fetch the filters and every stats type of a series (once per refresh window).
+
+        Returns:
+            dict: Cache entry with types, boards (type -> format -> rows),
+                merged per-player profiles and the types whose fetch was cut
+                off by the call deadline ('missing'; such entries are not cached)
+        """
+        entry = self._fresh(series_id)
+        if entry is not None:
+            return entry
+        async with self._locks.setdefault(series_id, asyncio.Lock()):
+            entry = self._fresh(series_id)
+            if entry is not None:
+                return entry
+
+            try:
+                filters = await api.get_series_stats_filters(series_id)
+            except DataIsEmpty:
+                filters = {}
+            types, categories = {}, {}
+            category = None
+            for row in filters.get("types") or []:
+                category = row.get("category") or category
+                if row.get("value"):
+                    types[row["value"]] = row.get("header") or row["value"]
+                    categories[row["value"]] = category
+
+            semaphore = asyncio.Semaphore(SERIES_STATS_FETCH_CONCURRENCY)
+
+            async def fetch(stats_type: str) -> Dict[str, List[dict]]:
+                async with semaphore:
+                    try:
+                        payload = await api.get_series_stats(series_id, stats_type)
+                        return await executors.run("records", parse_leaderboards, payload)
+                    except DataIsEmpty:
+                        return {}
+
+            boards, missing = {}, []
+            for stats_type, result in zip(types, await gather_partial(*(fetch(t) for t in types))):
+                if isinstance(result, DeadlineExceeded):
+                    missing.append(stats_type)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    boards[stats_type] = result
+            entry = {
+                "fetched": time.monotonic(),
+                "types": types,
+                "categories": categories,
+                "boards": boards,
+                "players": await executors.run("records", merge_players, boards, categories),
+                "derived": {},
+                "missing": missing,
+            }
+            if missing:
+                logger.info(f"📊 Series {series_id} stats partial: {len(missing)} of {len(types)} leaderboards timed out")
+                return entry
+            self._series[series_id] = entry
+            self._series.move_to_end(series_id)
+            while len(self._series) > SERIES_STATS_MAX_SERIES:
+                evicted, _ = self._series.popitem(last=False)
+                self._locks.pop(evicted, None)
+            logger.info(f"📊 Series {series_id} stats loaded: {len(types)} leaderboards")
+            return entry
+
+    def nbytes(self) -> int:
+        return estimate(self._series.values(), len(self._series))
+
+    def shrink(self, fraction: float) -> int:
+        """Drop the least recently used fraction of series; returns how many."""
+        return evict_lru(self._series, fraction, lambda series_id, _: self._locks.pop(series_id, None))
+
+    @staticmethod
+    def available(entry: dict) -> Dict[str, str]:
+        return {**entry["types"], **DERIVED_TYPES}
+
+    @staticmethod
+    def leaderboard(
+        entry: dict,
+        stats_type: str,
+        match_format: Optional[str] = None,
+        min_balls: int = 0,
+        min_overs: float = 0,
+    ) -> Dict[str, List[dict]]:
+        """
+        Rows per format for an upstream or derived stats type.
+
+        Derived boards are memoised on the entry per threshold, so they are
+        recomputed only after the next refresh.
+        """
+        if stats_type in DERIVED_TYPES:
+            threshold = min_balls if stats_type == DERIVED_STRIKE_RATE else min_overs
+            key = (stats_type, threshold)
+            boards = entry["derived"].get(key)
+            if boards is None:
+                build = strike_rate_board if stats_type == DERIVED_STRIKE_RATE else economy_board
+                boards = {fmt: build(profiles, threshold) for fmt, profiles in entry["players"].items()}
+                entry["derived"][key] = boards
+        elif stats_type in entry["types"]:
+            boards = {
+                fmt: [{"playerId": r["playerId"], "playerName": r["playerName"], **r["cells"]} for r in rows]
+                for fmt, rows in entry["boards"].get(stats_type, {}).items()
+            }
+        else:
+            raise ValueError(f"Unknown stats type '{stats_type}'")
+
+        if match_format is not None:
+            return {fmt: rows for fmt, rows in boards.items() if fmt in (match_format.upper(), "ALL")}
+        return boards
+
+
+series_stats = SeriesStatsEngine()
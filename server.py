@@ -27,6 +27,21 @@ from config import (
 from mcp_handlers import register_mcp_handlers
 from routes import get_routes
 from widgets import widgets, HAS_UI
+from prematch_warmer import prematch_warmer
+from news_store import news_store
+from loop_monitor import loop_monitor
+from clients import usage
+from memory import memory, estimate
+from response_cache import player_cache, news_detail_cache, rankings_cache, record_filters_cache, trending_cache
+from team_index import team_index
+from venue_stats import venue_stats
+from series_stats import series_stats
+from fixture_calendar import fixture_calendar
+import commentary_store
+import scorecard_store
+from cric_buzz_service.tracing import exporter
+import background
+import warm_restart
 
 # ---------- Logging ----------
 logging.basicConfig(
@@ -71,6 +86,36 @@ def configure_app(mcp: FastMCP):
 
     # Extra routes (health, info, widgets, etc.)
     app.routes.extend(get_routes())
+
+    # Caches tracked against the memory budget, evicted from largest first under pressure
+    memory.register("player-cache", player_cache.nbytes, player_cache.shrink)
+    memory.register("news-detail-cache", news_detail_cache.nbytes, news_detail_cache.shrink)
+    memory.register("news-store", news_store.nbytes, news_store.shrink)
+    memory.register("team-index", team_index.nbytes, team_index.shrink)
+    memory.register("venue-stats", venue_stats.nbytes, venue_stats.shrink)
+    memory.register("series-stats", series_stats.nbytes, series_stats.shrink)
+    memory.register("commentary", commentary_store.stores_nbytes, commentary_store.shrink_stores)
+    memory.register("scorecards", scorecard_store.stores_nbytes, scorecard_store.shrink_stores)
+    memory.register("traces", lambda: estimate(exporter.traces, len(exporter.traces)), exporter.shrink)
+    memory.register("fixture-calendar", fixture_calendar.nbytes)
+    memory.register("client-usage", usage.nbytes)
+
+    # Background jobs run for the lifetime of the app; upstream pollers only in the leader worker
+    background.register("prematch-warmer", prematch_warmer.run, leader_only=True)
+    background.register("news-refresh", news_store.run)
+    background.register("loop-monitor", loop_monitor.run)
+    background.register("memory-budget", memory.run)
+    background.register("client-budget-sync", usage.run)
+    background.attach(app)
+
+    # Hot caches carried across restarts: saved after the shutdown drain, reloaded before serving
+    warm_restart.register("player-cache", player_cache.snapshot, player_cache.restore)
+    warm_restart.register("rankings", rankings_cache.snapshot, rankings_cache.restore)
+    warm_restart.register("record-filters", record_filters_cache.snapshot, record_filters_cache.restore)
+    warm_restart.register("trending", trending_cache.snapshot, trending_cache.restore)
+    warm_restart.register("fixtures", fixture_calendar.snapshot, fixture_calendar.restore)
+    warm_restart.restore()
+    warm_restart.attach(app)
     return app
 
 # FastCloud picks these up on import:
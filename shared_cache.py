@@ -0,0 +1,259 @@
+"""
+Cross-worker response cache for Cricket Chat MCP Server.
+
+With several uvicorn workers (WEB_CONCURRENCY > 1), each process has its own
+in-memory caches. Without a shared layer, every worker would fetch the same
+player or scorecard from upstream. This module keeps a second cache level in
+a SQLite database (WAL mode) under SHARED_STATE_DIR that every worker on the
+host reads and writes:
+
+- `get` / `put` store JSON values per namespace and key, with an absolute
+  expiry.
+- `get_or_fetch` extends the in-process single-flight to all workers. The
+  first worker to miss takes a lease on the key and fetches. The others
+  poll the database for its result instead of calling upstream. A lease
+  left by a crashed worker expires after SHARED_CACHE_LEASE.
+- `exchange_usage` publishes this worker's per-client upstream counts for
+  the current budget window and returns the other workers' totals, so the
+  per-client budget holds across workers (see clients.py).
+
+All database work runs on one dedicated thread, so the event loop never
+waits on SQLite locks or fsyncs. In single-worker mode `shared_cache` is
+None and `shared_fetch` simply calls fetch. If the database fails, callers
+fall back to fetching themselves.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from config import (
+    SHARED_STATE_DIR,
+    SHARED_CACHE_LEASE,
+    SHARED_CACHE_POLL_INTERVAL,
+    SHARED_CACHE_PURGE_EVERY,
+)
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    ns TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires REAL NOT NULL,
+    PRIMARY KEY (ns, key)
+);
+CREATE TABLE IF NOT EXISTS leases (
+    ns TEXT NOT NULL, key TEXT NOT NULL, owner INTEGER NOT NULL, expires REAL NOT NULL,
+    PRIMARY KEY (ns, key)
+);
+CREATE TABLE IF NOT EXISTS usage (
+    budget_window INTEGER NOT NULL, client TEXT NOT NULL, worker INTEGER NOT NULL, requests INTEGER NOT NULL,
+    PRIMARY KEY (budget_window, client, worker)
+);
+"""
+
+
+def _key(key: Hashable) -> str:
+    return json.dumps(key, default=str, separators=(",", ":"))
+
+
+class SharedCache:
+    """JSON key-value cache in a SQLite file shared by the workers on this host."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._db: Optional[sqlite3.Connection] = None
+        self._thread = ThreadPoolExecutor(1, thread_name_prefix="shared-cache")
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.errors = 0
+
+    # ----- database thread -----
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(_SCHEMA)
+            self._db = db
+        return self._db
+
+    def _get(self, ns: str, key: str) -> Any:
+        row = self._connect().execute(
+            "SELECT value FROM entries WHERE ns = ? AND key = ? AND expires > ?", (ns, key, time.time())
+        ).fetchone()
+        return MISSING if row is None else json.loads(row[0])
+
+    def _put(self, ns: str, key: str, value: Any, ttl: float) -> None:
+        db = self._connect()
+        now = time.time()
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute(
+                "INSERT OR REPLACE INTO entries (ns, key, value, expires) VALUES (?, ?, ?, ?)",
+                (ns, key, json.dumps(value, separators=(",", ":")), now + ttl),
+            )
+            db.execute("DELETE FROM leases WHERE ns = ? AND key = ?", (ns, key))
+            self._writes += 1
+            if self._writes % SHARED_CACHE_PURGE_EVERY == 0:
+                db.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+                db.execute("DELETE FROM leases WHERE expires <= ?", (now,))
+
+    def _acquire(self, ns: str, key: str) -> Tuple[bool, Any]:
+        """
+        Take the fetch lease for a key unless another worker holds a live one.
+
+        Returns (leased, value): the value is set instead when another worker
+        stored it since our last read.
+        """
+        db = self._connect()
+        now = time.time()
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            value = self._get(ns, key)
+            if value is not MISSING:
+                return False, value
+            db.execute("DELETE FROM leases WHERE ns = ? AND key = ? AND expires <= ?", (ns, key, now))
+            cursor = db.execute(
+                "INSERT OR IGNORE INTO leases (ns, key, owner, expires) VALUES (?, ?, ?, ?)",
+                (ns, key, os.getpid(), now + SHARED_CACHE_LEASE),
+            )
+            return cursor.rowcount == 1, MISSING
+
+    def _entries(self, ns: str) -> List[list]:
+        rows = self._connect().execute(
+            "SELECT key, expires, value FROM entries WHERE ns = ? AND expires > ?", (ns, time.time())
+        )
+        return [[json.loads(key), expires, json.loads(value)] for key, expires, value in rows]
+
+    def _exchange_usage(self, window: int, counts: Dict[str, int]) -> Dict[str, int]:
+        db = self._connect()
+        worker = os.getpid()
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            db.executemany(
+                "INSERT OR REPLACE INTO usage (budget_window, client, worker, requests) VALUES (?, ?, ?, ?)",
+                [(window, client, worker, requests) for client, requests in counts.items()],
+            )
+            db.execute("DELETE FROM usage WHERE budget_window < ?", (window,))
+            rows = db.execute(
+                "SELECT client, SUM(requests) FROM usage WHERE budget_window = ? AND worker != ? GROUP BY client",
+                (window, worker),
+            ).fetchall()
+        return dict(rows)
+
+    def _release(self, ns: str, key: str) -> None:
+        with self._connect() as db:
+            db.execute("DELETE FROM leases WHERE ns = ? AND key = ? AND owner = ?", (ns, key, os.getpid()))
+
+    async def _call(self, fn: Callable, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._thread, fn, *args)
+
+    # ----- API -----
+
+    async def get(self, ns: str, key: Hashable) -> Any:
+        """Cached value, or MISSING when absent, expired or unreadable."""
+        try:
+            return await self._call(self._get, ns, _key(key))
+        except (sqlite3.Error, ValueError) as exc:
+            self.errors += 1
+            logger.warning(f"⚠️ Shared cache read failed ({ns}): {exc}")
+            return MISSING
+
+    async def put(self, ns: str, key: Hashable, value: Any, ttl: float) -> None:
+        try:
+            await self._call(self._put, ns, _key(key), value, ttl)
+        except (sqlite3.Error, TypeError, ValueError) as exc:
+            self.errors += 1
+            logger.warning(f"⚠️ Shared cache write failed ({ns}): {exc}")
+
+    async def entries(self, ns: str) -> List[list]:
+        """Unexpired entries of a namespace as [key, expires, value] rows (for warm-restart snapshots)."""
+        try:
+            return await self._call(self._entries, ns)
+        except (sqlite3.Error, ValueError) as exc:
+            self.errors += 1
+            logger.warning(f"⚠️ Shared cache scan failed ({ns}): {exc}")
+            return []
+
+    async def exchange_usage(self, window: int, counts: Dict[str, int]) -> Optional[Dict[str, int]]:
+        """Publish this worker's per-client counts for a budget window; returns the other workers' totals (None on error)."""
+        try:
+            return await self._call(self._exchange_usage, window, counts)
+        except sqlite3.Error as exc:
+            self.errors += 1
+            logger.warning(f"⚠️ Shared usage exchange failed: {exc}")
+            return None
+
+    async def get_or_fetch(self, ns: str, key: Hashable, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Shared value for key, fetched by exactly one worker at a time on a miss.
+
+        Errors are not cached: the lease is released and the next caller fetches.
+        """
+        encoded = _key(key)
+        waited = False
+        while True:
+            value = await self.get(ns, key)
+            if value is not MISSING:
+                if waited:
+                    self.waits += 1
+                else:
+                    self.hits += 1
+                return value
+            try:
+                leased, value = await self._call(self._acquire, ns, encoded)
+            except (sqlite3.Error, ValueError) as exc:
+                self.errors += 1
+                logger.warning(f"⚠️ Shared cache lease failed ({ns}): {exc}")
+                return await fetch()
+            if value is not MISSING:
+                self.waits += 1
+                return value
+            if leased:
+                break
+            waited = True
+            await asyncio.sleep(SHARED_CACHE_POLL_INTERVAL)
+
+        self.misses += 1
+        try:
+            value = await fetch()
+        except BaseException:
+            try:
+                await self._call(self._release, ns, encoded)
+            except sqlite3.Error:
+                pass  # the lease expires by itself
+            raise
+        await self.put(ns, key, value, ttl)
+        return value
+
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "waitedForOtherWorker": self.waits,
+            "errors": self.errors,
+        }
+
+
+shared_cache: Optional[SharedCache] = (
+    SharedCache(os.path.join(SHARED_STATE_DIR, "cache.sqlite3")) if SHARED_STATE_DIR else None
+)
+
+
+async def shared_fetch(ns: str, key: Hashable, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """fetch() through the shared cache in multi-worker mode, or directly otherwise."""
+    if shared_cache is None:
+        return await fetch()
+    return await shared_cache.get_or_fetch(ns, key, ttl, fetch)
@@ -0,0 +1,283 @@
+"""
+Team and squad entity index for Cricket Chat MCP Server.
+
+Keeps team lists, team rosters and series squads in memory and maintains a
+two-way index between them: team ID → players and player ID → teams. Rosters
+come from the team endpoints, squads from `get_series_squads` plus
+`get_series_squad_players`. Each roster and each series is refreshed on its
+own TTL, so repeated team and squad questions are local dictionary lookups
+rather than fresh player searches.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from config import (
+    TEAMS_LIST_REFRESH_INTERVAL,
+    TEAMS_ROSTER_TTL,
+    TEAMS_SERIES_TTL,
+    TEAMS_MAX_SERIES,
+)
+from cric_buzz_service.base_client import DataIsEmpty
+from cric_buzz_service.series_api import SeriesAPI
+from cric_buzz_service.teams_api import TeamsAPI, TeamType
+from memory import estimate, evict_lru
+
+logger = logging.getLogger(__name__)
+
+ROSTER = "roster"       # membership source: the team's current roster
+PROFILE = "profile"     # membership source: the player's profile team list
+Source = Union[str, int]  # ROSTER, PROFILE or a series ID
+
+
+def _parse_players(payload: dict) -> Dict[int, dict]:
+    """Player rows keyed by ID; header rows (no ID) name the role of the rows below them."""
+    players: Dict[int, dict] = {}
+    role = None
+    for row in payload.get("player") or []:
+        if row.get("id") is None:
+            role = (row.get("name") or "").title() or None
+            continue
+        player_id = int(row["id"])
+        players[player_id] = {
+            "id": player_id,
+            "name": row.get("name"),
+            "role": row.get("role") or role,
+            "battingStyle": row.get("battingStyle"),
+            "bowlingStyle": row.get("bowlingStyle"),
+            "captain": bool(row.get("captain")),
+            "keeper": bool(row.get("keeper")),
+            "imageId": row.get("imageId"),
+        }
+    return players
+
+
+class TeamIndex:
+    """Team rosters and series squads with a player ↔ team index."""
+
+    def __init__(self):
+        self._teams: Dict[int, dict] = {}
+        self._team_names: Dict[str, int] = {}
+        self._rosters: Dict[int, Dict[int, dict]] = {}
+        self._roster_fetched: Dict[int, float] = {}
+        self._series: "OrderedDict[int, dict]" = OrderedDict()
+        self._players: Dict[int, dict] = {}
+        self._player_teams: Dict[int, Dict[int, Set[Source]]] = {}
+        self._locks: Dict[Tuple[str, int], asyncio.Lock] = {}
+        self.teams_refreshed: Optional[float] = None
+
+    # ----- index maintenance -----
+
+    def _lock(self, kind: str, key: int) -> asyncio.Lock:
+        return self._locks.setdefault((kind, key), asyncio.Lock())
+
+    def _add_team(self, team_id: int, name: Optional[str], short_name: Optional[str] = None, **extra) -> None:
+        team = self._teams.setdefault(team_id, {"teamId": team_id, "teamName": name, "teamSName": short_name})
+        team.update({k: v for k, v in (("teamName", name), ("teamSName", short_name), *extra.items()) if v})
+        for alias in (name, short_name):
+            if alias:
+                self._team_names[alias.strip().lower()] = team_id
+
+    def _link(self, players: Dict[int, dict], team_id: int, source: Source) -> None:
+        for player_id, player in players.items():
+            self._players[player_id] = {**self._players.get(player_id, {}), **player}
+            self._player_teams.setdefault(player_id, {}).setdefault(team_id, set()).add(source)
+
+    def _unlink(self, players: Dict[int, dict], team_id: int, source: Source) -> None:
+        for player_id in players:
+            teams = self._player_teams.get(player_id, {})
+            sources = teams.get(team_id)
+            if sources is None:
+                continue
+            sources.discard(source)
+            if not sources:
+                del teams[team_id]
+            if not teams:
+                self._player_teams.pop(player_id, None)
+                self._players.pop(player_id, None)
+
+    # ----- refresh -----
+
+    async def refresh_teams_if_stale(self, api: TeamsAPI) -> bool:
+        """Reload the team lists of every category once per refresh interval."""
+        if self.teams_refreshed is not None and time.monotonic() - self.teams_refreshed < TEAMS_LIST_REFRESH_INTERVAL:
+            return False
+        async with self._lock("teams", 0):
+            if self.teams_refreshed is not None and time.monotonic() - self.teams_refreshed < TEAMS_LIST_REFRESH_INTERVAL:
+                return False
+            for team_type in TeamType:
+                try:
+                    payload = await api.get_teams(team_type)
+                except DataIsEmpty:
+                    continue
+                for row in payload.get("list") or []:
+                    if row.get("teamId") is not None:
+                        self._add_team(int(row["teamId"]), row.get("teamName"), row.get("teamSName"),
+                                       category=team_type.value, imageId=row.get("imageId"))
+            self.teams_refreshed = time.monotonic()
+            logger.info(f"👥 Team lists refreshed: {len(self._teams)} teams")
+            return True
+
+    async def load_roster(self, api: TeamsAPI, team_id: int) -> Dict[int, dict]:
+        """A team's current roster, fetched at most once per roster TTL."""
+        fetched = self._roster_fetched.get(team_id)
+        if fetched is not None and time.monotonic() - fetched < TEAMS_ROSTER_TTL:
+            return self._rosters[team_id]
+        async with self._lock("roster", team_id):
+            fetched = self._roster_fetched.get(team_id)
+            if fetched is not None and time.monotonic() - fetched < TEAMS_ROSTER_TTL:
+                return self._rosters[team_id]
+            try:
+                players = _parse_players(await api.get_team_players(team_id))
+            except DataIsEmpty:
+                players = {}
+            self._unlink(self._rosters.get(team_id, {}), team_id, ROSTER)
+            self._link(players, team_id, ROSTER)
+            self._rosters[team_id] = players
+            self._roster_fetched[team_id] = time.monotonic()
+            logger.info(f"👥 Roster loaded for team {team_id}: {len(players)} players")
+            return players
+
+    async def load_series(self, api: SeriesAPI, series_id: int) -> Dict[int, dict]:
+        """
+        Every squad of a series keyed by team ID, fetched at most once per series TTL.
+
+        The squad list and all squad player lists are fetched together, so a
+        refresh replaces the series' index entries in one step.
+        """
+        entry = self._series.get(series_id)
+        if entry is not None and time.monotonic() - entry["fetched"] < TEAMS_SERIES_TTL:
+            self._series.move_to_end(series_id)
+            return entry["squads"]
+        async with self._lock("series", series_id):
+            entry = self._series.get(series_id)
+            if entry is not None and time.monotonic() - entry["fetched"] < TEAMS_SERIES_TTL:
+                return entry["squads"]
+
+            try:
+                listing = await api.get_series_squads(series_id)
+            except DataIsEmpty:
+                listing = {}
+            rows = [
+                row for row in listing.get("squads") or []
+                if not row.get("isHeader") and row.get("squadId") is not None and row.get("teamId") is not None
+            ]
+            payloads = await asyncio.gather(
+                *(api.get_series_squad_players(series_id, row["squadId"]) for row in rows),
+                return_exceptions=True,
+            )
+
+            squads: Dict[int, dict] = {}
+            for row, payload in zip(rows, payloads):
+                if isinstance(payload, DataIsEmpty):
+                    payload = {}
+                elif isinstance(payload, BaseException):
+                    raise payload
+                team_id = int(row["teamId"])
+                self._add_team(team_id, row.get("squadType"))
+                squads[team_id] = {
+                    "teamId": team_id,
+                    "squadId": row["squadId"],
+                    "squadName": row.get("squadType"),
+                    "players": _parse_players(payload),
+                }
+
+            if entry is not None:
+                for team_id, squad in entry["squads"].items():
+                    self._unlink(squad["players"], team_id, series_id)
+            for team_id, squad in squads.items():
+                self._link(squad["players"], team_id, series_id)
+            self._series[series_id] = {
+                "fetched": time.monotonic(),
+                "seriesName": listing.get("seriesName"),
+                "squads": squads,
+            }
+            self._series.move_to_end(series_id)
+
+            while len(self._series) > TEAMS_MAX_SERIES:
+                self._drop_series(*self._series.popitem(last=False))
+
+            logger.info(f"👥 Squads loaded for series {series_id}: {len(squads)} teams")
+            return squads
+
+    def _drop_series(self, series_id: int, entry: dict) -> None:
+        for team_id, squad in entry["squads"].items():
+            self._unlink(squad["players"], team_id, series_id)
+
+    def nbytes(self) -> int:
+        return (
+            estimate(self._series.values(), len(self._series))
+            + estimate(self._rosters.values(), len(self._rosters))
+            + estimate(self._players.values(), len(self._players))
+        )
+
+    def shrink(self, fraction: float) -> int:
+        """Forget the least recently used fraction of series squads; returns how many."""
+        return evict_lru(self._series, fraction, self._drop_series)
+
+    def record_profile_teams(self, player: dict) -> None:
+        """Index the comma-separated 'teams' field of a player profile against known team names."""
+        if player.get("id") is None or not player.get("teams"):
+            return
+        player_id = int(player["id"])
+        summary = {player_id: {"id": player_id, "name": player.get("name")}}
+        for name in str(player["teams"]).split(","):
+            team_id = self._team_names.get(name.strip().lower())
+            if team_id is not None:
+                self._link(summary, team_id, PROFILE)
+
+    # ----- lookups -----
+
+    def resolve_team(self, team: str) -> Optional[int]:
+        """Team ID from an ID, full name or short name."""
+        team = team.strip()
+        if team.isdigit():
+            return int(team)
+        return self._team_names.get(team.lower())
+
+    def team(self, team_id: int) -> dict:
+        return self._teams.get(team_id, {"teamId": team_id})
+
+    def series_name(self, series_id: int) -> Optional[str]:
+        entry = self._series.get(series_id)
+        return entry["seriesName"] if entry else None
+
+    def team_players(self, team_id: int, series_id: Optional[int] = None) -> List[dict]:
+        """Players of a team's roster, or of its squad for a series when one is given."""
+        if series_id is None:
+            players = self._rosters.get(team_id, {})
+        else:
+            squad = (self._series.get(series_id) or {}).get("squads", {}).get(team_id)
+            players = squad["players"] if squad else {}
+        return list(players.values())
+
+    def player_teams(self, player_id: int) -> List[dict]:
+        """Every indexed team of a player, with the series squads it was seen in."""
+        result = []
+        for team_id, sources in self._player_teams.get(player_id, {}).items():
+            result.append({
+                **self.team(team_id),
+                "currentRoster": ROSTER in sources,
+                "squads": [
+                    {"seriesId": s, "seriesName": self.series_name(s)}
+                    for s in sorted(s for s in sources if isinstance(s, int))
+                ],
+            })
+        return result
+
+    def player(self, player_id: int) -> Optional[dict]:
+        return self._players.get(player_id)
+
+    def stats(self) -> dict:
+        return {
+            "teams": len(self._teams),
+            "rosters": len(self._rosters),
+            "series": len(self._series),
+            "players": len(self._player_teams),
+        }
+
+
+team_index = TeamIndex()
@@ -0,0 +1,68 @@
+"""
+Tests for commentary ball parsing and the columnar ball log.
+"""
+
+import pytest
+
+from ball_events import (
+    EXTRA_BYE,
+    EXTRA_LEG_BYE,
+    EXTRA_NO_BALL,
+    EXTRA_NONE,
+    EXTRA_WIDE,
+    NOT_A_BALL,
+    BallLog,
+    parse_ball,
+)
+
+
+@pytest.mark.parametrize("text, event, expected", [
+    ("Bumrah to Smith, no run, defended", "", (0, 0, EXTRA_NONE)),
+    ("Bumrah to Smith, 2 runs, driven", "", (2, 0, EXTRA_NONE)),
+    ("Bumrah to Smith, FOUR, cut away", "FOUR", (4, 0, EXTRA_NONE)),
+    ("Bumrah to Smith, SIX, over midwicket", "SIX", (6, 0, EXTRA_NONE)),
+    ("Bumrah to Smith, wide, down leg", "", (1, 1, EXTRA_WIDE)),
+    ("Bumrah to Smith, 5 wides, past the keeper", "", (5, 5, EXTRA_WIDE)),
+    ("Bumrah to Smith, 2 leg byes, off the pad", "", (2, 2, EXTRA_LEG_BYE)),
+    ("Bumrah to Smith, byes, 1 run", "", (1, 1, EXTRA_BYE)),
+    ("Bumrah to Smith, 4 byes", "FOUR", (4, 4, EXTRA_BYE)),
+    ("Bumrah to Smith, no ball, 2 runs", "", (3, 1, EXTRA_NO_BALL)),
+])
+def test_parse_ball_from_text(text, event, expected):
+    over, ball, runs, extras, extra_kind, wicket = parse_ball({"overNumber": 12.3, "commText": text, "event": event})
+    assert (over, ball) == (12, 3)
+    assert (runs, extras, extra_kind) == expected
+    assert wicket is False
+
+
+def test_parse_ball_prefers_the_score_change():
+    entry = {"overNumber": 1.1, "commText": "Bumrah to Smith, 5 wides", "batTeamScore": 15}
+    assert parse_ball(entry, previous_score=10)[2] == 5
+    assert parse_ball({**entry, "batTeamScore": 13}, previous_score=10)[2:4] == (3, 3)
+
+
+def test_parse_ball_skips_non_deliveries():
+    assert parse_ball({"commText": "End of over 12"}) is None
+
+
+def test_ball_log_round_trip():
+    log = BallLog()
+    entries = [
+        {"inningsId": 1, "overNumber": 0.1, "timestamp": 1, "commText": "A to B, 1 run", "batTeamScore": 1,
+         "batsmanStriker": {"batId": 11}, "bowlerStriker": {"bowlId": 21}, "batTeamName": "IND"},
+        {"inningsId": 1, "timestamp": 2, "commText": "Drinks break", "batTeamName": "IND"},
+        {"inningsId": 1, "overNumber": 0.2, "timestamp": 3, "commText": "A to C, out", "event": "WICKET",
+         "batTeamScore": 1, "batsmanStriker": {"batId": 12}, "bowlerStriker": {"bowlId": 21}, "batTeamName": "IND"},
+        {"inningsId": 1, "overNumber": 0.3, "timestamp": 4, "commText": "A to D, FOUR", "event": "FOUR",
+         "batTeamScore": 5, "batsmanStriker": {"batId": 13}, "bowlerStriker": {"bowlId": 21}, "batTeamName": "IND"},
+    ]
+    for entry in entries:
+        log.append(entry)
+
+    assert len(log) == 4
+    assert log.column("runs").tolist() == [1, 0, 0, 4]
+    assert log.column("wicket").tolist() == [0, 0, 1, 0]
+    assert log.column("over")[1] == NOT_A_BALL
+    assert log.players.value(log.striker[3]) == 13
+    assert log.entries([0, 3]) == [entries[0], entries[3]]
+    assert log.nbytes() > 0
@@ -0,0 +1,94 @@
+"""
+Round-trip tests for the scorecard JSON Patch diff.
+"""
+
+import copy
+from typing import Any, Dict, List
+
+import pytest
+
+from scorecard_store import json_diff
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def apply_patch(document: Any, patch: List[Dict[str, Any]]) -> Any:
+    """Minimal RFC 6902 add/remove/replace, enough to check json_diff output."""
+    document = copy.deepcopy(document)
+    for op in patch:
+        if op["path"] == "":
+            assert op["op"] == "replace"
+            document = copy.deepcopy(op["value"])
+            continue
+        *parents, last = [_unescape(t) for t in op["path"].split("/")[1:]]
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+        if isinstance(target, list):
+            index = int(last)
+            if op["op"] == "add":
+                target.insert(index, copy.deepcopy(op["value"]))
+            elif op["op"] == "remove":
+                del target[index]
+            else:
+                target[index] = copy.deepcopy(op["value"])
+        elif op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = copy.deepcopy(op["value"])
+    return document
+
+
+SCORECARD = {
+    "matchHeader": {"state": "In Progress", "status": "India opt to bat"},
+    "scoreCard": [
+        {
+            "inningsId": 1,
+            "batTeamDetails": {"batsmenData": {"bat_1": {"runs": 12, "balls": 10}}},
+            "scoreDetails": {"runs": 20, "wickets": 0, "overs": 3.2},
+        }
+    ],
+}
+
+
+@pytest.mark.parametrize("old, new", [
+    ({}, {}),
+    ({"a": 1}, {"a": 2}),
+    ({"a": 1, "b": 2}, {"b": 2, "c": 3}),
+    ([1, 2, 3], [1, 2]),
+    ([1, 2], [1, 2, 3, 4]),
+    ([{"x": 1}, {"x": 2}, {"x": 3}], [{"x": 1}]),
+    ({"a/b": 1, "c~d": 2}, {"a/b": 3}),
+    ({"a": 1}, {"a": 1.0}),
+    ({"a": 1}, {"a": True}),
+    ({"a": {"b": [1, {"c": None}]}}, {"a": {"b": [1, {"c": "x"}, 2]}}),
+    ({"a": [1]}, {"a": {"0": 1}}),
+    ([1], {"a": 1}),
+    (None, {"a": 1}),
+])
+def test_patch_round_trips(old, new):
+    patched = apply_patch(old, json_diff(old, new))
+    assert patched == new
+    assert type(patched) is type(new)
+
+
+def test_scorecard_update_round_trips():
+    new = copy.deepcopy(SCORECARD)
+    new["matchHeader"]["status"] = "India 24/1"
+    new["scoreCard"][0]["batTeamDetails"]["batsmenData"]["bat_1"] = {"runs": 16, "balls": 12}
+    new["scoreCard"][0]["batTeamDetails"]["batsmenData"]["bat_2"] = {"runs": 0, "balls": 1}
+    new["scoreCard"][0]["scoreDetails"].update(runs=24, wickets=1, overs=4.1)
+
+    patch = json_diff(SCORECARD, new)
+    assert apply_patch(SCORECARD, patch) == new
+    assert all(op["path"].startswith(("/matchHeader", "/scoreCard/0")) for op in patch)
+
+
+def test_identical_documents_give_an_empty_patch():
+    assert json_diff(SCORECARD, copy.deepcopy(SCORECARD)) == []
+
+
+def test_type_change_is_a_replace():
+    assert json_diff({"a": 1}, {"a": "1"}) == [{"op": "replace", "path": "/a", "value": "1"}]
@@ -0,0 +1,77 @@
+"""
+Tests for news tokenization, deduplication and search.
+"""
+
+import asyncio
+
+from news_store import NewsStore, tokenize
+
+
+def _payload(*stories: dict) -> dict:
+    return {"storyList": [{"story": story} for story in stories]}
+
+
+def test_tokenize_drops_stopwords_and_folds_plurals():
+    assert tokenize("The Ashes: centuries for England's batters") == {"ashe", "century", "england", "batter"}
+    assert tokenize("Class of 2025") == {"class", "2025"}
+    assert tokenize("a an of") == set()
+
+
+def test_republished_story_is_merged():
+    store = NewsStore()
+    story = {"id": 1, "hline": "Kohli hits century", "intro": "A fine knock", "pubTime": "100"}
+    store.ingest(_payload(story), "index")
+    ordered = store.ingest(_payload({**story, "id": 2}), "topic:7", ["Kohli"])
+
+    assert ordered == [1]
+    assert len(store) == 1
+    assert store.duplicates == 1
+    assert store.canonical_id(2) == 1
+    assert store.story(2)["id"] == 1
+
+
+def test_search_matches_every_token_headline_first():
+    store = NewsStore()
+    store.ingest(_payload(
+        {"id": 1, "hline": "Ashes preview", "intro": "England squad named for the century test", "pubTime": "300"},
+        {"id": 2, "hline": "Root century in the Ashes", "intro": "England on top", "pubTime": "100"},
+        {"id": 3, "hline": "IPL auction", "intro": "Franchises spend big", "pubTime": "200"},
+    ), "index")
+
+    assert [s["id"] for s in store.search("ashes centuries")] == [2, 1]
+    assert [s["id"] for s in store.search("auction")] == [3]
+    assert store.search("the of") == []
+    assert store.search("ashes auction") == []
+
+
+def test_search_by_entity_tag():
+    store = NewsStore()
+    store.ingest(_payload({"id": 5, "hline": "Nets session", "intro": "Training update"}), "player:1413", ["player:1413"])
+    store.ingest(_payload({"id": 6, "hline": "Nets session ends", "intro": "More training"}), "index")
+
+    assert [s["id"] for s in store.search("nets", entity="player:1413")] == [5]
+
+
+def test_concurrent_stale_refreshes_fetch_once():
+    class FakeNewsAPI:
+        calls = 0
+
+        async def get_news_categories(self):
+            return {}
+
+        async def get_news_topics(self):
+            return {}
+
+        async def get_news_index(self):
+            FakeNewsAPI.calls += 1
+            await asyncio.sleep(0.01)
+            return _payload({"id": 1, "hline": "Ashes day one", "intro": "Report"})
+
+    async def scenario():
+        store = NewsStore()
+        await asyncio.gather(*(store.refresh_if_stale(FakeNewsAPI()) for _ in range(5)))
+        return store
+
+    store = asyncio.run(scenario())
+    assert FakeNewsAPI.calls == 1
+    assert len(store) == 1
@@ -0,0 +1,78 @@
+"""
+Tests for the points-table qualification simulation.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+import qualification
+from qualification import LeagueState, simulate
+
+
+def _state(points: List[float], fixtures: List[Tuple[int, int]], nrr: List[float] = None) -> LeagueState:
+    teams = len(points)
+    return LeagueState(
+        team_ids=list(range(1, teams + 1)),
+        team_names=[f"Team {i}" for i in range(1, teams + 1)],
+        points=np.array(points, dtype=float),
+        played=np.full(teams, 5),
+        nrr=np.array(nrr if nrr is not None else [0.0] * teams),
+        home=np.array([home for home, _ in fixtures], dtype=np.int64),
+        away=np.array([away for _, away in fixtures], dtype=np.int64),
+        fixtures=[{"matchId": 100 + i, "team1": home, "team2": away} for i, (home, away) in enumerate(fixtures)],
+    )
+
+
+def _by_id(result: dict) -> dict:
+    return {team["teamId"]: team for team in result["teams"]}
+
+
+# Top two of four: team 1 is clear, team 4 cannot catch up, 2 and 3 meet in match 101
+STANDINGS = ([8, 6, 4, 0], [(0, 3), (1, 2), (2, 3)])
+
+
+def test_exact_status_and_must_win():
+    result = simulate(_state(*STANDINGS), qualify_top=2)
+    teams = _by_id(result)
+
+    assert result["exact"] is True
+    assert result["scenarios"] == 8
+    assert teams[1]["status"] == "qualified"
+    assert teams[4]["status"] == "eliminated"
+    assert teams[2]["status"] == "in contention"
+    assert teams[3]["status"] == "in contention"
+    # Team 3 is out on points if it loses to team 2; team 2 losing still leaves a points tie
+    assert teams[3]["mustWinMatchIds"] == [101]
+    assert teams[2]["mustWinMatchIds"] == []
+
+
+def test_probabilities_fill_the_qualifying_places():
+    result = simulate(_state(*STANDINGS), qualify_top=2)
+    total = sum(team["qualificationProbability"] for team in result["teams"])
+    assert total == pytest.approx(2.0)
+
+
+def test_points_tie_is_never_a_definite_status():
+    # Teams 1 and 2 both finish on 4 points whatever happens; NRR (approximated) decides
+    result = simulate(_state([4, 4, 0], [], nrr=[1.5, -1.5, 0.0]), qualify_top=1)
+    teams = _by_id(result)
+
+    assert teams[1]["qualificationProbability"] == 1.0
+    assert teams[1]["status"] == "in contention"
+    assert teams[2]["status"] == "in contention"
+    assert teams[3]["status"] == "eliminated"
+
+
+def test_sampled_run_in_states_only_bound_checks(monkeypatch):
+    monkeypatch.setattr(qualification, "QUALIFICATION_ENUMERATION_LIMIT", 1)
+    result = simulate(_state(*STANDINGS), qualify_top=2, samples=500, seed=7)
+    teams = _by_id(result)
+
+    assert result["exact"] is False
+    assert result["scenarios"] == 500
+    assert teams[4]["status"] == "eliminated"
+    # Teams 2 and 3 could each reach team 1's 8 points, so it is not certain on bounds alone
+    assert teams[1]["status"] == "in contention"
+    assert all(team["mustWinMatchIds"] == [] for team in result["teams"])
@@ -2,12 +2,22 @@
 Tool definitions and handlers for Cricket Chat MCP Server.
 """
 
+import asyncio
 import logging
-from typing import List
-from pydantic import ValidationError
+from typing import List, Type
+from pydantic import BaseModel, ValidationError
 
 import mcp.types as types
 from cric_buzz_service.players_api import PlayersAPI
+from cric_buzz_service.matches_api import MatchesAPI
+from cric_buzz_service.series_api import SeriesAPI
+from cric_buzz_service.schedules_api import SchedulesAPI
+from cric_buzz_service.teams_api import TeamsAPI
+from cric_buzz_service.venues_api import VenuesAPI
+from cric_buzz_service.news_api import NewsAPI
+from cric_buzz_service.base_client import DataIsEmpty
+from cric_buzz_service.upstream import current_client, deadline
+from cric_buzz_service.tracing import sample_serialization, span, trace
 from cric_buzz_service.stats_api import StatsAPI, FormatType, RankingCategory
 from schemas import (
     GetPlayerInfoInput,
@@ -18,9 +28,36 @@ from schemas import (
     GetPlayerNewsInput,
     GetRankingsInput,
     GetRecordsInput,
+    GetMatchCommentaryInput,
+    GetMatchScorecardInput,
+    GetMatchAnalyticsInput,
+    GetQualificationScenariosInput,
+    GetFixturesInput,
+    GetTeamPlayersInput,
+    GetPlayerTeamsInput,
+    GetVenueStatsInput,
+    GetSeriesStatsInput,
+    SearchNewsInput,
+    GetNewsDetailInput,
     get_schemas,
 )
+from analytics import innings_analytics
+from qualification import qualification_scenarios
+from fixture_calendar import fixture_calendar, date_range_ms
+from team_index import team_index
+from venue_stats import venue_stats
+from series_stats import series_stats
+from response_cache import cached_player, cached_news_detail, cached_rankings, cached_record_filters, cached_trending
+from news_store import news_store, story_list
+from image_cache import image_cache, image_ids
+from commentary_store import get_commentary_store
+from scorecard_store import get_scorecard_store
+from live_stream import live_hub
 from widgets import widgets, _tool_meta
+from admission import admission, Overloaded
+import warm_restart
+from clients import identify_client
+from config import TOOL_DEADLINE, TOOL_DEADLINE_GRACE
 
 # Setup logging
 logging.basicConfig(level=logging.DEBUG)
@@ -78,6 +115,149 @@ def get_tool_definitions() -> List[types.Tool]:
         )
     )
     
+    logger.info("✅ Registering non-widget tool: get-match-commentary")
+    tools.append(
+        types.Tool(
+            name="get-match-commentary",
+            description=(
+                "Get ball-by-ball commentary for the last N overs of a match (latest ball first). "
+                "Commentary is synced incrementally and served from memory, so repeated calls during "
+                "a live match are cheap. Also returns the current miniscore when available."
+            ),
+            inputSchema=SCHEMAS["get-match-commentary"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: get-match-scorecard")
+    tools.append(
+        types.Tool(
+            name="get-match-scorecard",
+            description=(
+                "Get the detailed scorecard of a match. Each response carries a 'version'; pass it back as "
+                "since_version to receive only a compact JSON Patch of what changed (runs, balls, new batter "
+                "or bowler rows) instead of the full scorecard."
+            ),
+            inputSchema=SCHEMAS["get-match-scorecard"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: get-match-analytics")
+    tools.append(
+        types.Tool(
+            name="get-match-analytics",
+            description=(
+                "Get over-by-over analytics for an innings: worm (cumulative score), manhattan (runs and "
+                "wickets per over), powerplay/middle/death run rates, partnerships, and the required-rate "
+                "curve for chases. Built from ball-by-ball commentary."
+            ),
+            inputSchema=SCHEMAS["get-match-analytics"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: get-qualification-scenarios")
+    tools.append(
+        types.Tool(
+            name="get-qualification-scenarios",
+            description=(
+                "Answer 'what does a team need to qualify' for a league or group stage. Simulates every "
+                "remaining fixture of the series (exactly, or by Monte-Carlo sampling for long run-ins) with "
+                "an approximate NRR tiebreak, and returns each team's estimated qualification probability and "
+                "chances for each number of further wins. Status (qualified/eliminated) and must-win match "
+                "IDs are only given when points alone settle them; otherwise the team is 'in contention'."
+            ),
+            inputSchema=SCHEMAS["get-qualification-scenarios"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: get-fixtures")
+    tools.append(
+        types.Tool(
+            name="get-fixtures",
+            description=(
+                "Get upcoming fixtures for a date range, optionally filtered by team (ID or name), series, "
+                "venue or format. Answers questions like 'India's fixtures this week' from a local calendar "
+                "of international, league, domestic and women's schedules."
+            ),
+            inputSchema=SCHEMAS["get-fixtures"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: get-team-players")
+    tools.append(
+        types.Tool(
+            name="get-team-players",
+            description=(
+                "Get the players of a team by team ID or name: its current roster, or its squad for a given "
+                "series. Rosters and squads are held in a local team index that refreshes per team and per "
+                "series, so use this instead of searching players one by one."
+            ),
+            inputSchema=SCHEMAS["get-team-players"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: get-player-teams")
+    tools.append(
+        types.Tool(
+            name="get-player-teams",
+            description=(
+                "Get the teams a player belongs to, with the series squads they have been picked in. "
+                "Pass a series ID to load that series' squads before looking the player up."
+            ),
+            inputSchema=SCHEMAS["get-player-teams"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: get-venue-stats")
+    tools.append(
+        types.Tool(
+            name="get-venue-stats",
+            description=(
+                "Get a ground's record for pitch and conditions questions: average, highest and lowest "
+                "first-innings score, batting-first vs chasing wins (chasing win %), draws/ties, no results and recent results, "
+                "per format. Computed from the matches played at the venue and cached."
+            ),
+            inputSchema=SCHEMAS["get-venue-stats"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: get-series-stats")
+    tools.append(
+        types.Tool(
+            name="get-series-stats",
+            description=(
+                "Get series leaderboards such as most runs, most wickets or highest score. Omit stats_type to "
+                "list the available leaderboards. Also offers derivedStrikeRate (minimum balls faced) and "
+                "derivedEconomy (minimum overs bowled), computed from the cached leaderboards."
+            ),
+            inputSchema=SCHEMAS["get-series-stats"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: search-news")
+    tools.append(
+        types.Tool(
+            name="search-news",
+            description=(
+                "Search recent cricket news by keywords (e.g., 'Ashes', 'Kohli century') across the news index, "
+                "category and trending-topic feeds, deduplicated and newest first. Served from a local news "
+                "store that refreshes every few minutes."
+            ),
+            inputSchema=SCHEMAS["search-news"],
+        )
+    )
+    
+    logger.info("✅ Registering non-widget tool: get-news-detail")
+    tools.append(
+        types.Tool(
+            name="get-news-detail",
+            description=(
+                "Get the full text of a news story by its ID (from get-player-news or search-news). "
+                "Top stories are prefetched in the background, so these are usually served from cache."
+            ),
+            inputSchema=SCHEMAS["get-news-detail"],
+        )
+    )
+    
     # Note: get-rankings is now a widget-based tool (registered above with UI support)
     # Note: get-records will be a widget-based tool (UI component to be created)
     # Note: get-icc-standings has been removed (not needed)
@@ -89,6 +269,15 @@ async def handle_tool_call(req: types.CallToolRequest) -> types.ServerResult:
     """
     Handle tool execution requests.
     
+    Each call is attributed to a client (see clients.py) and must first be
+    admitted by the tool's adaptive concurrency limit (see admission.py);
+    shed calls get an immediate "busy, retry" result, as do calls arriving
+    while the server drains for a restart (see warm_restart.py). An
+    admitted call runs under a TOOL_DEADLINE time budget shared by every
+    upstream request it makes; work still running at the deadline is
+    cancelled. Results carry the timing in `_meta.timing` (budget, elapsed,
+    and whether the result is partial).
+    
     Args:
         req: The tool call request
         
@@ -101,40 +290,111 @@ async def handle_tool_call(req: types.CallToolRequest) -> types.ServerResult:
     logger.info(f"🔨 Tool call received: {tool_name}")
     logger.debug(f"   Arguments: {arguments}")
     
+    client = identify_client()
+    client_token = current_client.set(client)
     try:
-        # Route to appropriate handler
-        if tool_name == "get-player-info":
-            logger.info("   Routing to: _handle_get_player_info")
-            return await _handle_get_player_info(arguments)
-        elif tool_name == "search-player":
-            logger.info("   Routing to: _handle_search_player")
-            return await _handle_search_player(arguments)
-        elif tool_name == "get-player-career":
-            return await _handle_get_player_career(arguments)
-        elif tool_name == "get-player-bowling":
-            return await _handle_get_player_bowling(arguments)
-        elif tool_name == "get-player-batting":
-            return await _handle_get_player_batting(arguments)
-        elif tool_name == "get-player-news":
-            return await _handle_get_player_news(arguments)
-        elif tool_name == "get-trending-players":
-            return await _handle_get_trending_players()
-        elif tool_name == "get-rankings":
-            logger.info("   Routing to: _handle_get_rankings")
-            return await _handle_get_rankings(arguments)
-        elif tool_name == "get-records":
-            logger.info("   Routing to: _handle_get_records")
-            return await _handle_get_records(arguments)
-        elif tool_name == "get-record-filters":
-            logger.info("   Routing to: _handle_get_record_filters")
-            return await _handle_get_record_filters()
-        else:
-            return _create_error_result(f"Unknown tool: {tool_name}")
-    
-    except ValidationError as exc:
-        return _create_error_result(f"Input validation error: {exc.errors()}")
-    except Exception as exc:
-        return _create_error_result(f"Error executing tool: {str(exc)}")
+        with trace("tool_call", tool=tool_name, client=client) as root, deadline(TOOL_DEADLINE) as budget:
+            try:
+                with warm_restart.tool_call(tool_name):
+                    async with admission.admit(tool_name, client):
+                        async with asyncio.timeout_at(budget.expires_at + TOOL_DEADLINE_GRACE):
+                            with span("handler"):
+                                result = await _dispatch_tool_call(tool_name, arguments)
+                            image_cache.issue(image_ids(result.root.structuredContent))
+            except Overloaded as exc:
+                logger.warning(f"🚦 Shed {tool_name} call from {client}: {exc.reason}")
+                result = _create_error_result(
+                    f"Server busy: {tool_name} call not admitted ({exc.reason}), please retry in {exc.retry_after:g} seconds"
+                )
+                result.root.meta = {"admission": {"rejected": True, "reason": exc.reason, "retryAfter": exc.retry_after}}
+            except TimeoutError:
+                budget.partial = True
+                logger.warning(f"⏱️ Tool {tool_name} ran out of time after {budget.timing()['elapsedMs']} ms")
+                result = _create_error_result(
+                    f"Timed out: {tool_name} could not finish within {TOOL_DEADLINE:g}s, please retry shortly"
+                )
+            except ValidationError as exc:
+                result = _create_error_result(f"Input validation error: {exc.errors()}")
+            except Exception as exc:
+                result = _create_error_result(f"Error executing tool: {str(exc)}")
+        
+            timing = budget.timing()
+            if timing["partial"]:
+                logger.info(f"⏱️ Tool {tool_name} returned partial results ({timing['cancelledCalls']} calls cancelled)")
+            result.root.meta = {**(result.root.meta or {}), "timing": timing}
+            root.set(isError=bool(result.root.isError), partial=timing["partial"])
+            if sample_serialization():
+                # Measuring means serializing once more than the MCP transport does, so only a sample pays it
+                with span("serialize", sampled=True) as serialize:
+                    serialize.set(bytes=len(result.model_dump_json(by_alias=True, exclude_none=True)))
+    finally:
+        current_client.reset(client_token)
+    return result
+
+
+async def _dispatch_tool_call(tool_name: str, arguments: dict) -> types.ServerResult:
+    """Route a tool call to its handler."""
+    # Route to appropriate handler
+    if tool_name == "get-player-info":
+        logger.info("   Routing to: _handle_get_player_info")
+        return await _handle_get_player_info(arguments)
+    elif tool_name == "search-player":
+        logger.info("   Routing to: _handle_search_player")
+        return await _handle_search_player(arguments)
+    elif tool_name == "get-player-career":
+        return await _handle_get_player_career(arguments)
+    elif tool_name == "get-player-bowling":
+        return await _handle_get_player_bowling(arguments)
+    elif tool_name == "get-player-batting":
+        return await _handle_get_player_batting(arguments)
+    elif tool_name == "get-player-news":
+        return await _handle_get_player_news(arguments)
+    elif tool_name == "get-trending-players":
+        return await _handle_get_trending_players()
+    elif tool_name == "get-rankings":
+        logger.info("   Routing to: _handle_get_rankings")
+        return await _handle_get_rankings(arguments)
+    elif tool_name == "get-records":
+        logger.info("   Routing to: _handle_get_records")
+        return await _handle_get_records(arguments)
+    elif tool_name == "get-record-filters":
+        logger.info("   Routing to: _handle_get_record_filters")
+        return await _handle_get_record_filters()
+    elif tool_name == "get-match-commentary":
+        logger.info("   Routing to: _handle_get_match_commentary")
+        return await _handle_get_match_commentary(arguments)
+    elif tool_name == "get-match-scorecard":
+        logger.info("   Routing to: _handle_get_match_scorecard")
+        return await _handle_get_match_scorecard(arguments)
+    elif tool_name == "get-match-analytics":
+        logger.info("   Routing to: _handle_get_match_analytics")
+        return await _handle_get_match_analytics(arguments)
+    elif tool_name == "get-qualification-scenarios":
+        logger.info("   Routing to: _handle_get_qualification_scenarios")
+        return await _handle_get_qualification_scenarios(arguments)
+    elif tool_name == "get-fixtures":
+        logger.info("   Routing to: _handle_get_fixtures")
+        return await _handle_get_fixtures(arguments)
+    elif tool_name == "get-team-players":
+        logger.info("   Routing to: _handle_get_team_players")
+        return await _handle_get_team_players(arguments)
+    elif tool_name == "get-player-teams":
+        logger.info("   Routing to: _handle_get_player_teams")
+        return await _handle_get_player_teams(arguments)
+    elif tool_name == "get-venue-stats":
+        logger.info("   Routing to: _handle_get_venue_stats")
+        return await _handle_get_venue_stats(arguments)
+    elif tool_name == "get-series-stats":
+        logger.info("   Routing to: _handle_get_series_stats")
+        return await _handle_get_series_stats(arguments)
+    elif tool_name == "search-news":
+        logger.info("   Routing to: _handle_search_news")
+        return await _handle_search_news(arguments)
+    elif tool_name == "get-news-detail":
+        logger.info("   Routing to: _handle_get_news_detail")
+        return await _handle_get_news_detail(arguments)
+    else:
+        return _create_error_result(f"Unknown tool: {tool_name}")
 
 
 # Tool handler implementations
@@ -142,11 +402,11 @@ async def handle_tool_call(req: types.CallToolRequest) -> types.ServerResult:
 async def _handle_get_player_info(arguments: dict) -> types.ServerResult:
     """Handle get-player-info tool."""
     logger.info("🏏 Handling get-player-info request")
-    payload = GetPlayerInfoInput.model_validate(arguments)
+    payload = _validate(GetPlayerInfoInput, arguments)
     logger.debug(f"   Player ID: {payload.player_id}")
     
     async with PlayersAPI() as api:
-        player_info = await api.get_player_info(payload.player_id)
+        player_info = await cached_player(api, "info", payload.player_id)
     
     logger.info(f"✅ Player info retrieved successfully")
     logger.debug(f"   Data keys: {list(player_info.keys()) if isinstance(player_info, dict) else 'Not a dict'}")
@@ -170,7 +430,7 @@ async def _handle_get_player_info(arguments: dict) -> types.ServerResult:
 
 async def _handle_search_player(arguments: dict) -> types.ServerResult:
     """Handle search-player tool."""
-    payload = SearchPlayerInput.model_validate(arguments)
+    payload = _validate(SearchPlayerInput, arguments)
     
     async with PlayersAPI() as api:
         search_results = await api.search_player(payload.player_name)
@@ -188,7 +448,7 @@ async def _handle_search_player(arguments: dict) -> types.ServerResult:
 
 async def _handle_get_player_career(arguments: dict) -> types.ServerResult:
     """Handle get-player-career tool."""
-    payload = GetPlayerCareerInput.model_validate(arguments)
+    payload = _validate(GetPlayerCareerInput, arguments)
     
     async with PlayersAPI() as api:
         career_stats = await api.get_career(payload.player_id)
@@ -206,10 +466,10 @@ async def _handle_get_player_career(arguments: dict) -> types.ServerResult:
 
 async def _handle_get_player_bowling(arguments: dict) -> types.ServerResult:
     """Handle get-player-bowling tool."""
-    payload = GetPlayerBowlingInput.model_validate(arguments)
+    payload = _validate(GetPlayerBowlingInput, arguments)
     
     async with PlayersAPI() as api:
-        bowling_stats = await api.get_bowling(payload.player_id)
+        bowling_stats = await cached_player(api, "bowling", payload.player_id)
     
     return types.ServerResult(
         types.CallToolResult(
@@ -224,10 +484,10 @@ async def _handle_get_player_bowling(arguments: dict) -> types.ServerResult:
 
 async def _handle_get_player_batting(arguments: dict) -> types.ServerResult:
     """Handle get-player-batting tool."""
-    payload = GetPlayerBattingInput.model_validate(arguments)
+    payload = _validate(GetPlayerBattingInput, arguments)
     
     async with PlayersAPI() as api:
-        batting_stats = await api.get_batting(payload.player_id)
+        batting_stats = await cached_player(api, "batting", payload.player_id)
     
     return types.ServerResult(
         types.CallToolResult(
@@ -242,10 +502,10 @@ async def _handle_get_player_batting(arguments: dict) -> types.ServerResult:
 
 async def _handle_get_player_news(arguments: dict) -> types.ServerResult:
     """Handle get-player-news tool."""
-    payload = GetPlayerNewsInput.model_validate(arguments)
+    payload = _validate(GetPlayerNewsInput, arguments)
     
     async with PlayersAPI() as api:
-        player_news = await api.get_news(payload.player_id)
+        player_news = story_list(await news_store.player_news(api, payload.player_id))
     
     return types.ServerResult(
         types.CallToolResult(
@@ -261,7 +521,7 @@ async def _handle_get_player_news(arguments: dict) -> types.ServerResult:
 async def _handle_get_trending_players() -> types.ServerResult:
     """Handle get-trending-players tool."""
     async with PlayersAPI() as api:
-        trending_players = await api.list_trending()
+        trending_players = await cached_trending(api)
     
     return types.ServerResult(
         types.CallToolResult(
@@ -277,7 +537,7 @@ async def _handle_get_trending_players() -> types.ServerResult:
 async def _handle_get_rankings(arguments: dict) -> types.ServerResult:
     """Handle get-rankings tool."""
     logger.info("📊 Handling get-rankings request")
-    payload = GetRankingsInput.model_validate(arguments)
+    payload = _validate(GetRankingsInput, arguments)
     logger.debug(f"   Category: {payload.category}, Format: {payload.format_type}, Women: {payload.is_women}")
     
     # Convert string values to enums
@@ -285,11 +545,7 @@ async def _handle_get_rankings(arguments: dict) -> types.ServerResult:
     format_type = FormatType(payload.format_type)
     
     async with StatsAPI() as api:
-        rankings = await api.get_rankings(
-            category=category,
-            format_type=format_type,
-            is_women=payload.is_women
-        )
+        rankings = await cached_rankings(api, category, format_type, payload.is_women)
     
     logger.info(f"✅ Rankings retrieved successfully")
     
@@ -311,7 +567,7 @@ async def _handle_get_rankings(arguments: dict) -> types.ServerResult:
 async def _handle_get_records(arguments: dict) -> types.ServerResult:
     """Handle get-records tool."""
     logger.info("📊 Handling get-records request")
-    payload = GetRecordsInput.model_validate(arguments)
+    payload = _validate(GetRecordsInput, arguments)
     logger.debug(f"   Stats Type: {payload.stats_type}, Year: {payload.year}, Match Type: {payload.match_type}")
     
     async with StatsAPI() as api:
@@ -341,7 +597,7 @@ async def _handle_get_record_filters() -> types.ServerResult:
     logger.info("📊 Handling get-record-filters request")
     
     async with StatsAPI() as api:
-        filters = await api.get_record_filters()
+        filters = await cached_record_filters(api)
     
     logger.info(f"✅ Record filters retrieved successfully")
     
@@ -356,10 +612,366 @@ async def _handle_get_record_filters() -> types.ServerResult:
     )
 
 
+async def _handle_get_match_commentary(arguments: dict) -> types.ServerResult:
+    """Handle get-match-commentary tool."""
+    logger.info("🎙️ Handling get-match-commentary request")
+    payload = _validate(GetMatchCommentaryInput, arguments)
+    
+    store = get_commentary_store(payload.match_id)
+    async with MatchesAPI() as api:
+        new_entries = await store.sync_if_stale(api)
+    if new_entries:
+        live_hub.publish_commentary(store)
+    logger.debug(f"   Match {payload.match_id}: {new_entries} new entries, {len(store)} held")
+    
+    innings_id = payload.innings_id if payload.innings_id is not None else store.current_innings()
+    commentary = store.last_overs(payload.over_limit, innings_id)
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=f"Successfully retrieved commentary for the last {payload.over_limit} over(s) of match {payload.match_id}."
+            )],
+            structuredContent={
+                "matchId": payload.match_id,
+                "inningsId": innings_id,
+                "overLimit": payload.over_limit,
+                "commentaryList": commentary,
+                "miniscore": store.miniscore,
+                "matchHeader": store.match_header,
+                "lastTimestamp": store.last_timestamp,
+                "complete": store.complete,
+            },
+        )
+    )
+
+
+async def _handle_get_match_scorecard(arguments: dict) -> types.ServerResult:
+    """Handle get-match-scorecard tool."""
+    logger.info("📋 Handling get-match-scorecard request")
+    payload = _validate(GetMatchScorecardInput, arguments)
+    
+    store = get_scorecard_store(payload.match_id)
+    async with MatchesAPI() as api:
+        if await store.sync_if_stale(api):
+            live_hub.publish_scorecard(store)
+    
+    changes = await store.changes_since(payload.since_version)
+    if changes["full"]:
+        text = f"Successfully retrieved scorecard version {store.version} for match {payload.match_id}."
+    else:
+        text = (
+            f"Successfully retrieved {len(changes['patch'])} scorecard change(s) for match "
+            f"{payload.match_id} since version {payload.since_version}."
+        )
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(type="text", text=text)],
+            structuredContent=changes,
+        )
+    )
+
+
+async def _handle_get_match_analytics(arguments: dict) -> types.ServerResult:
+    """Handle get-match-analytics tool."""
+    logger.info("📈 Handling get-match-analytics request")
+    payload = _validate(GetMatchAnalyticsInput, arguments)
+    
+    store = get_commentary_store(payload.match_id)
+    async with MatchesAPI() as api:
+        if await store.sync_if_stale(api):
+            live_hub.publish_commentary(store)
+    
+    innings_id = payload.innings_id if payload.innings_id is not None else store.current_innings()
+    if innings_id is None:
+        return _create_error_result(f"No ball-by-ball data available yet for match {payload.match_id}.")
+    analytics = innings_analytics(store, innings_id)
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=f"Successfully computed analytics for innings {innings_id} of match {payload.match_id}."
+            )],
+            structuredContent={**analytics, "complete": store.complete},
+        )
+    )
+
+
+async def _handle_get_qualification_scenarios(arguments: dict) -> types.ServerResult:
+    """Handle get-qualification-scenarios tool."""
+    logger.info("🏆 Handling get-qualification-scenarios request")
+    payload = _validate(GetQualificationScenariosInput, arguments)
+    
+    async with SeriesAPI() as api:
+        scenarios = await qualification_scenarios(
+            api,
+            series_id=payload.series_id,
+            qualify_top=payload.qualify_top,
+            group=payload.group,
+        )
+    
+    method = "all" if scenarios["exact"] else "a sample of"
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=(
+                    f"Successfully simulated {method} {scenarios['scenarios']} outcomes of the "
+                    f"{scenarios['remainingMatches']} remaining match(es) in series {payload.series_id}."
+                )
+            )],
+            structuredContent=scenarios,
+        )
+    )
+
+
+async def _handle_get_fixtures(arguments: dict) -> types.ServerResult:
+    """Handle get-fixtures tool."""
+    logger.info("📅 Handling get-fixtures request")
+    payload = _validate(GetFixturesInput, arguments)
+    
+    async with SchedulesAPI() as api:
+        await fixture_calendar.refresh_if_stale(api)
+    
+    team_id = None
+    if payload.team is not None:
+        team_id = fixture_calendar.resolve_team(payload.team)
+        if team_id is None:
+            return _create_error_result(
+                f"No upcoming fixtures found for team '{payload.team}'. Try the team's full name or ID."
+            )
+    
+    start_ms, end_ms = date_range_ms(payload.from_date, payload.to_date)
+    fixtures = fixture_calendar.query(
+        start_ms,
+        end_ms,
+        team_id=team_id,
+        series_id=payload.series_id,
+        venue=payload.venue,
+        match_format=payload.match_format,
+        limit=payload.limit,
+    )
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=f"Successfully retrieved {len(fixtures)} fixture(s)."
+            )],
+            structuredContent={
+                "fixtures": fixtures,
+                "from": start_ms,
+                "to": end_ms,
+                "teamId": team_id,
+            },
+        )
+    )
+
+
+async def _handle_get_team_players(arguments: dict) -> types.ServerResult:
+    """Handle get-team-players tool."""
+    logger.info("👥 Handling get-team-players request")
+    payload = _validate(GetTeamPlayersInput, arguments)
+    
+    if payload.series_id is not None:
+        async with SeriesAPI() as api:
+            await team_index.load_series(api, payload.series_id)
+    async with TeamsAPI() as api:
+        await team_index.refresh_teams_if_stale(api)
+        team_id = team_index.resolve_team(payload.team)
+        if team_id is None:
+            return _create_error_result(f"Unknown team '{payload.team}'. Try the team's full name or ID.")
+        if payload.series_id is None:
+            await team_index.load_roster(api, team_id)
+    
+    players = team_index.team_players(team_id, payload.series_id)
+    source = f"squad for series {payload.series_id}" if payload.series_id is not None else "current roster"
+    if not players:
+        return _create_error_result(f"No players found in the {source} of team {team_id}.")
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=f"Successfully retrieved {len(players)} player(s) from the {source} of team {team_id}."
+            )],
+            structuredContent={
+                **team_index.team(team_id),
+                "seriesId": payload.series_id,
+                "players": players,
+            },
+        )
+    )
+
+
+async def _handle_get_player_teams(arguments: dict) -> types.ServerResult:
+    """Handle get-player-teams tool."""
+    logger.info("👥 Handling get-player-teams request")
+    payload = _validate(GetPlayerTeamsInput, arguments)
+    player_id = int(payload.player_id)
+    
+    if payload.series_id is not None:
+        async with SeriesAPI() as api:
+            await team_index.load_series(api, payload.series_id)
+    if not team_index.player_teams(player_id):
+        # Not in any loaded roster or squad yet: fall back to the profile's team list
+        async with TeamsAPI() as api:
+            await team_index.refresh_teams_if_stale(api)
+        try:
+            async with PlayersAPI() as api:
+                team_index.record_profile_teams(await cached_player(api, "info", payload.player_id))
+        except DataIsEmpty:
+            pass
+    
+    teams = team_index.player_teams(player_id)
+    if not teams:
+        return _create_error_result(f"No teams found for player {payload.player_id}.")
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=f"Successfully retrieved {len(teams)} team(s) for player {payload.player_id}."
+            )],
+            structuredContent={
+                "player": team_index.player(player_id),
+                "teams": teams,
+            },
+        )
+    )
+
+
+async def _handle_get_venue_stats(arguments: dict) -> types.ServerResult:
+    """Handle get-venue-stats tool."""
+    logger.info("🏟️ Handling get-venue-stats request")
+    payload = _validate(GetVenueStatsInput, arguments)
+    
+    async with VenuesAPI() as api:
+        stats = await venue_stats.get(api, payload.venue_id)
+    
+    if payload.match_format is not None:
+        stats = {
+            **stats,
+            "formats": {k: v for k, v in stats["formats"].items() if k == payload.match_format},
+            "recentResults": [r for r in stats["recentResults"] if r["matchFormat"] == payload.match_format],
+        }
+    ground = stats["venue"].get("ground") or f"venue {payload.venue_id}"
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=f"Successfully computed ground records for {ground} from {stats['matchesAnalysed']} completed match(es)."
+            )],
+            structuredContent=stats,
+        )
+    )
+
+
+async def _handle_get_series_stats(arguments: dict) -> types.ServerResult:
+    """Handle get-series-stats tool."""
+    logger.info("📊 Handling get-series-stats request")
+    payload = _validate(GetSeriesStatsInput, arguments)
+    
+    async with SeriesAPI() as api:
+        entry = await series_stats.load(api, payload.series_id)
+    available = series_stats.available(entry)
+    
+    if payload.stats_type is None:
+        return types.ServerResult(
+            types.CallToolResult(
+                content=[types.TextContent(
+                    type="text",
+                    text=f"Successfully retrieved {len(available)} stats type(s) for series {payload.series_id}."
+                )],
+                structuredContent={"seriesId": payload.series_id, "statsTypes": available},
+            )
+        )
+    if payload.stats_type not in available:
+        return _create_error_result(
+            f"Unknown stats type '{payload.stats_type}'. Available: {', '.join(available)}"
+        )
+    
+    boards = series_stats.leaderboard(
+        entry,
+        payload.stats_type,
+        match_format=payload.match_format,
+        min_balls=payload.min_balls,
+        min_overs=payload.min_overs,
+    )
+    boards = {fmt: rows[:payload.limit] for fmt, rows in boards.items()}
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=f"Successfully retrieved {available[payload.stats_type]} for series {payload.series_id}."
+            )],
+            structuredContent={
+                "seriesId": payload.series_id,
+                "statsType": payload.stats_type,
+                "leaderboards": boards,
+                "missingStatsTypes": entry["missing"],
+            },
+        )
+    )
+
+
+async def _handle_search_news(arguments: dict) -> types.ServerResult:
+    """Handle search-news tool."""
+    logger.info("📰 Handling search-news request")
+    payload = _validate(SearchNewsInput, arguments)
+    
+    await news_store.ensure_loaded()
+    entity = None
+    if payload.player_id is not None:
+        async with PlayersAPI() as api:
+            await news_store.player_news(api, payload.player_id)
+        entity = f"player:{payload.player_id}"
+    
+    stories = news_store.search(payload.query, limit=payload.limit, entity=entity)
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=f"Successfully found {len(stories)} news stor{'y' if len(stories) == 1 else 'ies'} for '{payload.query}'."
+            )],
+            structuredContent={"query": payload.query, **story_list(stories)},
+        )
+    )
+
+
+async def _handle_get_news_detail(arguments: dict) -> types.ServerResult:
+    """Handle get-news-detail tool."""
+    logger.info("📰 Handling get-news-detail request")
+    payload = _validate(GetNewsDetailInput, arguments)
+    
+    async with NewsAPI() as api:
+        detail = await cached_news_detail(api, news_store.canonical_id(payload.news_id))
+    
+    return types.ServerResult(
+        types.CallToolResult(
+            content=[types.TextContent(
+                type="text",
+                text=f"Successfully retrieved news story {payload.news_id}."
+            )],
+            structuredContent=detail,
+        )
+    )
 
 
 # Helper functions
 
+def _validate(schema: Type[BaseModel], arguments: dict) -> BaseModel:
+    """Validate tool arguments against their input schema (traced as a 'validate' span)."""
+    with span("validate", schema=schema.__name__):
+        return schema.model_validate(arguments)
+
+
 def _create_error_result(error_message: str) -> types.ServerResult:
     """Create an error result."""
     return types.ServerResult(
@@ -0,0 +1,214 @@
+"""
+Precomputed venue statistics for Cricket Chat MCP Server.
+
+Derives per-format ground records from a venue's fetched match list: average
+first-innings score, chasing win percentage and the most recent results.
+Stats are computed once when a venue is (re)loaded and then served from
+memory; a venue is only re-fetched lazily, the next time it is asked for
+after its TTL has passed.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from config import (
+    VENUES_STATS_TTL,
+    VENUES_MAX_VENUES,
+    VENUES_RECENT_RESULTS,
+)
+from cric_buzz_service.base_client import DataIsEmpty
+from cric_buzz_service.venues_api import VenuesAPI
+from memory import estimate, evict_lru
+import executors
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATES = {"Complete", "Abandon", "Abandoned", "No Result"}
+NO_RESULT_STATES = {"Abandon", "Abandoned", "No Result"}
+_MARGIN = re.compile(r"won by (an innings and )?(\d+) (runs?|wkts?|wickets?)", re.IGNORECASE)
+_NO_RESULT = re.compile(r"no result|abandon", re.IGNORECASE)
+_DRAW_OR_TIE = re.compile(r"\bdrawn\b|\bdraw\b|\btied\b|\btie\b", re.IGNORECASE)
+
+
+def _innings(team_score: dict) -> List[dict]:
+    return [team_score[key] for key in ("inngs1", "inngs2") if isinstance(team_score.get(key), dict)]
+
+
+def parse_result(match: dict) -> Optional[Dict[str, Any]]:
+    """
+    Reduce an upstream match (matchInfo + matchScore) to the fields venue stats need.
+
+    The side batting first comes from the innings IDs in the score, falling
+    back to the result margin ("won by N runs" means the winner batted first).
+    Finished matches without a winner are a "draw/tie" or, when abandoned or
+    washed out, "no result". Returns None for matches that have not finished.
+    """
+    info = match.get("matchInfo") or {}
+    if info.get("state") not in FINISHED_STATES or info.get("matchId") is None:
+        return None
+    teams = [info.get("team1") or {}, info.get("team2") or {}]
+    score = match.get("matchScore") or {}
+    innings = [_innings(score.get("team1Score") or {}), _innings(score.get("team2Score") or {})]
+    status = info.get("status") or ""
+
+    winner = None
+    for i, team in enumerate(teams):
+        for name in (team.get("teamName"), team.get("teamSName")):
+            if name and status.lower().startswith(name.lower()):
+                winner = i
+                break
+        if winner is not None:
+            break
+
+    bat_first = None
+    for i in (0, 1):
+        if any(inns.get("inningsId") == 1 for inns in innings[i]):
+            bat_first = i
+    margin = _MARGIN.search(status)
+    by_runs = bool(margin) and margin.group(3).lower().startswith("run")
+    if bat_first is None and winner is not None and margin:
+        bat_first = winner if by_runs else 1 - winner
+
+    first_innings = None
+    if bat_first is not None and innings[bat_first]:
+        first_innings = innings[bat_first][0].get("runs")
+
+    if info.get("state") in NO_RESULT_STATES or (winner is None and _NO_RESULT.search(status)):
+        result = "no result"
+    elif winner is None:
+        result = "draw/tie" if _DRAW_OR_TIE.search(status) else "unknown"
+    elif bat_first is None:
+        result = "unknown"
+    else:
+        result = "won batting first" if winner == bat_first else "won chasing"
+
+    return {
+        "matchId": int(info["matchId"]),
+        "seriesName": info.get("seriesName"),
+        "matchDesc": info.get("matchDesc"),
+        "matchFormat": (info.get("matchFormat") or "").upper() or None,
+        "startDate": int(info.get("startDate") or 0),
+        "team1": teams[0].get("teamSName") or teams[0].get("teamName"),
+        "team2": teams[1].get("teamSName") or teams[1].get("teamName"),
+        "battingFirst": None if bat_first is None else (teams[bat_first].get("teamSName") or teams[bat_first].get("teamName")),
+        "firstInningsScore": first_innings,
+        "result": result,
+        "status": status,
+    }
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Per-format ground record from parsed results."""
+    by_format: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        by_format.setdefault(result["matchFormat"] or "UNKNOWN", []).append(result)
+
+    summary = {}
+    for match_format, matches in by_format.items():
+        # A washed-out first innings is usually unfinished, so it would drag the averages down
+        scores = [
+            m["firstInningsScore"] for m in matches
+            if m["firstInningsScore"] is not None and m["result"] != "no result"
+        ]
+        defended = sum(m["result"] == "won batting first" for m in matches)
+        chased = sum(m["result"] == "won chasing" for m in matches)
+        decided = defended + chased
+        summary[match_format] = {
+            "matches": len(matches),
+            "avgFirstInningsScore": round(sum(scores) / len(scores), 1) if scores else None,
+            "highestFirstInningsScore": max(scores) if scores else None,
+            "lowestFirstInningsScore": min(scores) if scores else None,
+            "battingFirstWins": defended,
+            "chasingWins": chased,
+            "chasingWinPct": round(100.0 * chased / decided, 1) if decided else None,
+            "drawsAndTies": sum(m["result"] == "draw/tie" for m in matches),
+            "noResult": sum(m["result"] == "no result" for m in matches),
+        }
+    return summary
+
+
+class VenueStatsCache:
+    """Venue info and precomputed ground records, LRU-bounded and lazily refreshed."""
+
+    def __init__(self):
+        self._venues: "OrderedDict[int, dict]" = OrderedDict()
+        self._locks: Dict[int, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._venues)
+
+    def _fresh(self, venue_id: int) -> Optional[dict]:
+        entry = self._venues.get(venue_id)
+        if entry is not None and time.monotonic() - entry["fetched"] < VENUES_STATS_TTL:
+            self._venues.move_to_end(venue_id)
+            return entry
+        return None
+
+    async def get(self, api: VenuesAPI, venue_id: int) -> dict:
+        """
+        Venue info plus ground records, recomputed only when the cached copy has expired.
+
+        Returns:
+            dict: venue, formats (per-format summary), recentResults, matchesAnalysed
+        """
+        entry = self._fresh(venue_id)
+        if entry is not None:
+            return entry["stats"]
+        lock = self._locks.setdefault(venue_id, asyncio.Lock())
+        async with lock:
+            entry = self._fresh(venue_id)
+            if entry is not None:
+                return entry["stats"]
+
+            info, matches = await asyncio.gather(
+                api.get_venue_info(venue_id),
+                api.get_venue_matches(venue_id),
+                return_exceptions=True,
+            )
+            for payload in (info, matches):
+                if isinstance(payload, BaseException) and not isinstance(payload, DataIsEmpty):
+                    raise payload
+            info = {} if isinstance(info, DataIsEmpty) else info
+            matches = {} if isinstance(matches, DataIsEmpty) else matches
+
+            stats = await executors.run("records", self._compute, venue_id, info, matches)
+            self._venues[venue_id] = {"fetched": time.monotonic(), "stats": stats}
+            self._venues.move_to_end(venue_id)
+            while len(self._venues) > VENUES_MAX_VENUES:
+                evicted, _ = self._venues.popitem(last=False)
+                self._locks.pop(evicted, None)
+            logger.info(f"🏟️ Venue {venue_id} stats computed from {stats['matchesAnalysed']} matches")
+            return stats
+
+    def nbytes(self) -> int:
+        return estimate(self._venues.values(), len(self._venues))
+
+    def shrink(self, fraction: float) -> int:
+        """Drop the least recently used fraction of venues; returns how many."""
+        return evict_lru(self._venues, fraction, lambda venue_id, _: self._locks.pop(venue_id, None))
+
+    @staticmethod
+    def _compute(venue_id: int, info: dict, matches: dict) -> dict:
+        results: Dict[int, Dict[str, Any]] = {}
+        for group in matches.get("matchDetails") or []:
+            for match in (group.get("matchDetailsMap") or {}).get("match") or []:
+                result = parse_result(match)
+                if result is not None:
+                    results[result["matchId"]] = result
+        ordered = sorted(results.values(), key=lambda r: r["startDate"], reverse=True)
+        return {
+            "venue": {
+                "id": venue_id,
+                **{k: info.get(k) for k in ("ground", "city", "country", "capacity", "ends", "homeTeam", "floodlights")},
+            },
+            "formats": summarize(ordered),
+            "recentResults": ordered[:VENUES_RECENT_RESULTS],
+            "matchesAnalysed": len(ordered),
+        }
+
+
+venue_stats = VenueStatsCache()
@@ -0,0 +1,187 @@
+"""
+Warm restarts for Cricket Chat MCP Server.
+
+A fresh process normally starts with empty caches, so the first minutes
+after a deploy pay upstream latency for rankings, player profiles and
+fixtures that the old process already held. This module carries them over:
+
+- Hot caches register a section with `register(name, dump, load)`.
+- On graceful shutdown, `attach(app)` stops admitting tool calls (new ones
+  get a "busy, retry" result) and waits up to SHUTDOWN_DRAIN_TIMEOUT for
+  the running ones. The leader worker then writes every section to
+  SNAPSHOT_PATH as gzipped JSON.
+- On startup, `restore()` loads the snapshot before the app serves. Cache
+  entries keep their original wall-clock expiry, so anything that expired
+  while the server was down is dropped and the rest lives out its
+  remaining TTL. `/health` reports ready only after this.
+
+A missing, unreadable or older than SNAPSHOT_MAX_AGE snapshot is ignored
+and the server starts cold.
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from config import SNAPSHOT_PATH, SNAPSHOT_MAX_AGE, SHUTDOWN_DRAIN_TIMEOUT, DRAIN_RETRY_AFTER
+from admission import Overloaded
+from leader import election
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+Dump = Callable[[], Union[Any, Awaitable[Any]]]
+Load = Callable[[Any], int]
+
+_sections: Dict[str, Tuple[Dump, Load]] = {}
+_idle: Optional[asyncio.Event] = None
+
+ready = False
+draining = False
+inflight = 0
+restored: Dict[str, int] = {}
+last_saved: Optional[dict] = None
+
+
+def register(name: str, dump: Dump, load: Load) -> None:
+    """Register a snapshot section: dump() returns JSON-able data (or awaits it), load(data) returns entries restored."""
+    _sections[name] = (dump, load)
+
+
+# ----- tool calls -----
+
+@contextmanager
+def tool_call(tool: str):
+    """Count a tool call as in flight; refused with Overloaded once shutdown has begun."""
+    global inflight
+    if draining:
+        raise Overloaded(tool, "server restarting", DRAIN_RETRY_AFTER)
+    inflight += 1
+    try:
+        yield
+    finally:
+        inflight -= 1
+        if inflight == 0 and _idle is not None:
+            _idle.set()
+
+
+async def drain(timeout: float = SHUTDOWN_DRAIN_TIMEOUT) -> int:
+    """Stop admitting tool calls and wait for running ones; returns how many were still running at the timeout."""
+    global ready, draining, _idle
+    ready = False
+    draining = True
+    if inflight:
+        logger.info(f"🛑 Draining {inflight} in-flight tool calls")
+        _idle = asyncio.Event()
+        try:
+            await asyncio.wait_for(_idle.wait(), timeout)
+        except TimeoutError:
+            logger.warning(f"⚠️ {inflight} tool calls still running after {timeout:g}s drain")
+    return inflight
+
+
+# ----- snapshot file -----
+
+def _read(path: str) -> Optional[dict]:
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError) as exc:
+        logger.warning(f"⚠️ Ignoring unreadable snapshot {path}: {exc}")
+        return None
+
+
+def _write(path: str, data: dict) -> int:
+    """Write atomically (temp file + rename), so a crash mid-write leaves the previous snapshot intact."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(temp, "wt", encoding="utf-8", compresslevel=6) as file:
+        json.dump(data, file, separators=(",", ":"), default=str)
+    os.replace(temp, path)
+    return os.path.getsize(path)
+
+
+def restore(path: str = SNAPSHOT_PATH) -> Dict[str, int]:
+    """Load the previous process's snapshot into the registered sections (call before serving)."""
+    data = _read(path)
+    if data is None:
+        return {}
+    age = time.time() - data.get("savedAt", 0)
+    if data.get("version") != SNAPSHOT_VERSION or age > SNAPSHOT_MAX_AGE:
+        logger.info(f"♻️ Ignoring snapshot {path} (version {data.get('version')}, {age:.0f}s old)")
+        return {}
+    for name, section in (data.get("sections") or {}).items():
+        if name not in _sections:
+            continue
+        try:
+            restored[name] = _sections[name][1](section)
+        except Exception as exc:
+            logger.warning(f"⚠️ Could not restore {name} from snapshot: {exc}")
+    logger.info(f"♻️ Restored snapshot from {age:.0f}s ago: {restored}")
+    return restored
+
+
+async def save(path: str = SNAPSHOT_PATH) -> dict:
+    """Dump every registered section and write the snapshot file."""
+    global last_saved
+    started = time.perf_counter()
+    sections = {}
+    for name, (dump, _) in _sections.items():
+        try:
+            section = dump()
+            sections[name] = await section if asyncio.iscoroutine(section) else section
+        except Exception as exc:
+            logger.warning(f"⚠️ Could not snapshot {name}: {exc}")
+    data = {"version": SNAPSHOT_VERSION, "savedAt": time.time(), "pid": os.getpid(), "sections": sections}
+    size = await asyncio.to_thread(_write, path, data)
+    last_saved = {"path": path, "bytes": size, "seconds": round(time.perf_counter() - started, 3)}
+    logger.info(f"💾 Saved snapshot to {path} ({size / 1024:.0f} KB in {last_saved['seconds']}s)")
+    return last_saved
+
+
+# ----- lifespan -----
+
+def attach(app) -> None:
+    """
+    Wrap a Starlette app's lifespan: ready once started, and on shutdown drain
+    tool calls then save the snapshot (leader worker only).
+
+    Attach after background.attach, so the snapshot is taken while this worker
+    still holds leadership.
+    """
+    inner = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan(app_):
+        global ready
+        async with inner(app_) as state:
+            ready = True
+            try:
+                yield state
+            finally:
+                await drain()
+                if election.is_leader:
+                    try:
+                        await save()
+                    except Exception as exc:
+                        logger.warning(f"⚠️ Could not save snapshot: {exc}")
+
+    app.router.lifespan_context = lifespan
+
+
+def stats() -> dict:
+    return {
+        "ready": ready,
+        "draining": draining,
+        "inflightToolCalls": inflight,
+        "restored": restored,
+        "lastSaved": last_saved,
+    }